@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 from app.backend.core.database import get_db
+from app.backend.core.security import PasswordHashingBusy
 from app.backend.schemas.user_schemas import UserCreate, UserLogin, TokenResponse
 from app.backend.services.auth_service import handle_login_request, handle_signup_request
 
@@ -10,18 +11,31 @@ from app.backend.services.auth_service import handle_login_request, handle_signu
 router = APIRouter()
 
 
+def hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/login", status_code=status.HTTP_200_OK, response_model=TokenResponse)
-def login(user_credentials: UserLogin, database: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, database: Session = Depends(get_db)):
     """
     Authenticate user and return JWT token.
     """
-    return handle_login_request(user_credentials, database)
+    try:
+        return await handle_login_request(user_credentials, database)
+    except PasswordHashingBusy:
+        raise hashing_busy()
 
 
 @router.post("/signup", status_code=status.HTTP_201_CREATED, response_model=TokenResponse)
-def signup(user_data: UserCreate, database: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, database: Session = Depends(get_db)):
     """
     Signup user and return JWT token.
     """
-
-    return handle_signup_request(user_data, database)
+    try:
+        return await handle_signup_request(user_data, database)
+    except PasswordHashingBusy:
+        raise hashing_busy()
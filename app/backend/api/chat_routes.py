@@ -3,9 +3,10 @@
 from fastapi import APIRouter, Depends
 from app.backend.schemas.chat_schemas import ChatQuery, ChatResponse
 from sqlalchemy.orm import Session
-from app.backend.models.user_model import User
+from app.backend.core.auth_cache import Principal
 from app.backend.core.database import get_db
-from app.backend.core.dependencies import get_current_user, get_language
+from app.backend.core.dependencies import get_current_user, get_language, get_image_size
+from app.backend.core.tmdb_client import build_poster_url
 from app.backend.services.chat_service import process_chat_query
 
 router = APIRouter()
@@ -13,8 +14,12 @@ router = APIRouter()
 @router.post("", response_model=ChatResponse)
 def chat(
     payload: ChatQuery, 
-    user: User = Depends(get_current_user), 
+    user: Principal = Depends(get_current_user), 
     database: Session = Depends(get_db),
-    language: str = Depends(get_language)):
+    language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size)):
 
-    return process_chat_query(payload, user, database, language)
\ No newline at end of file
+    response = process_chat_query(payload, user, database, language)
+    for card in response.results or []:
+        card.poster_url = build_poster_url(card.poster_path, image_size) or card.poster_url
+    return response
\ No newline at end of file
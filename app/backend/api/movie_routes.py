@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, Depends, Request
 from app.backend.schemas.movie_schemas import MovieSearchFilters, MovieCard, KeywordSearchRequest
-from app.backend.core.dependencies import get_current_user, get_db, get_language
-from app.backend.models.user_model import User
+from app.backend.core.dependencies import get_current_user, get_db, get_language, get_image_size
+from app.backend.core.auth_cache import Principal
 from sqlalchemy.orm import Session
+from app.backend.services.card_cache import card_list_response
 from app.backend.services.movie_service import recommend_movies_by_filters, search_movies_by_title
 
 
@@ -14,22 +15,24 @@ router = APIRouter()
 @router.post("/search-by-filters", response_model=list[MovieCard])
 def search_by_filters(
     filters: MovieSearchFilters,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
 
-    return recommend_movies_by_filters(filters, user.id, database, language)
+    return card_list_response(recommend_movies_by_filters(filters, user.id, database, language), image_size)
 
 
 @router.post("/search-by-title", response_model=list[MovieCard])
 def search_by_keywords(
     keywords: KeywordSearchRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
 
-    return search_movies_by_title(keywords, database, language)
+    return card_list_response(search_movies_by_title(keywords.keywords, database, language), image_size)
 
 
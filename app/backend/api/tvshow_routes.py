@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, Depends
 from app.backend.schemas.tvshow_schemas import TvShowSearchFilters, TvShowCard, KeywordSearchRequest
-from app.backend.core.dependencies import get_current_user, get_db, get_language
-from app.backend.models.user_model import User
+from app.backend.core.dependencies import get_current_user, get_db, get_language, get_image_size
+from app.backend.core.auth_cache import Principal
 from sqlalchemy.orm import Session
+from app.backend.services.card_cache import card_list_response
 from app.backend.services.tvshow_service import recommend_tvshows_by_filters, search_tvshows_by_title
 
 router = APIRouter()
@@ -12,22 +13,24 @@ router = APIRouter()
 @router.post("/search-by-filters", response_model=list[TvShowCard])
 def search_by_filters(
     filters: TvShowSearchFilters,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
 
-    return recommend_tvshows_by_filters(filters, user.id, database, language)
+    return card_list_response(recommend_tvshows_by_filters(filters, user.id, database, language), image_size)
 
 
 @router.post("/search-by-title", response_model=list[TvShowCard])
 def search_by_keywords(
     keywords: KeywordSearchRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
 
-    return search_tvshows_by_title(keywords, user.id, database, language)
+    return card_list_response(search_tvshows_by_title(keywords.keywords, database, language), image_size)
 
 
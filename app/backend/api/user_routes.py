@@ -1,33 +1,147 @@
 # app/backend/api/user_routes.py
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from app.backend.models.user_model import User
-from app.backend.core.dependencies import get_current_user, get_language
+import io
+import tempfile
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from typing import Literal, Optional
+from app.backend.core.config import LIBRARY_IMPORT_MAX_BYTES
+from app.backend.core.auth_cache import Principal
+from app.backend.core.dependencies import get_current_user, get_language, get_image_size
 from app.backend.core.database import get_db
-from app.backend.schemas.user_schemas import UserPublic
+from app.backend.schemas.user_schemas import UserPublic, LibraryPage, BatchStatusUpdate, ImportReport
 from app.backend.schemas.movie_schemas import MovieCard
+from app.backend.schemas.stats_schemas import UserStats
 from app.backend.schemas.tvshow_schemas import TvShowCard
 from sqlalchemy.orm import Session
+from app.backend.services.card_cache import card_list_response
 from app.backend.services.user_media_service import (
     update_user_media_status, 
+    apply_user_media_statuses,
     get_user_media_by_status,
+    get_user_library_page,
+    render_library_page,
+    decode_library_cursor,
+    MEDIA_TYPES,
 )
+from app.backend.services.stats_service import get_user_stats
+from app.backend.services.library_import_service import import_library_export
+from app.backend.services.version_service import library_etag, conditional_response
 from app.backend.schemas.user_schemas import MediaStatusUpdate
 
 router = APIRouter()
 
+
+def _status_list_response(
+    request: Request, media_type: str, list_status: str, user: Principal, database: Session, language: str, image_size: str
+) -> Response:
+    """
+    One status list, answered with 304 while the user's library and the catalog rows it lists are unchanged.
+    """
+    etag = library_etag(database, user.id, [media_type], list_status, language, image_size)
+    return conditional_response(
+        request,
+        etag,
+        lambda: card_list_response(get_user_media_by_status(media_type, user.id, database, language, list_status), image_size),
+    )
+
+
 @router.get("/me", response_model=UserPublic)
-def read_own_profile(user: User = Depends(get_current_user)):
+def read_own_profile(user: Principal = Depends(get_current_user)):
     return UserPublic(
         first_name=user.first_name, last_name=user.last_name, email=user.email
     )
 
 
+@router.get("/me/stats", response_model=UserStats)
+def fetch_user_stats(
+    user: Principal = Depends(get_current_user),
+    database: Session = Depends(get_db),
+    language: str = Depends(get_language),
+):
+    return get_user_stats(user.id, database, language)
+
+
+@router.get("/me/library", response_model=LibraryPage)
+def fetch_user_library(
+    request: Request,
+    media_type: Optional[Literal["movie", "tv"]] = None,
+    status_filter: Optional[Literal["seen", "towatchlater", "hidden"]] = Query(default=None, alias="status"),
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    user: Principal = Depends(get_current_user),
+    database: Session = Depends(get_db),
+    language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
+):
+    try:
+        if cursor:
+            decode_library_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def render() -> Response:
+        entries, next_cursor = get_user_library_page(user.id, database, media_type, status_filter, cursor, limit)
+        return Response(
+            content=render_library_page(entries, next_cursor, language, image_size),
+            media_type="application/json",
+        )
+
+    media_types = [media_type] if media_type else MEDIA_TYPES
+    etag = library_etag(database, user.id, media_types, "library", status_filter, cursor, limit, language, image_size)
+    return conditional_response(request, etag, render)
+
+
+@router.post("/me/statuses", status_code=status.HTTP_200_OK)
+def update_media_statuses(
+    payload: BatchStatusUpdate,
+    database: Session = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+):
+    items = [(item.media_type, item.tmdb_id, item.status) for item in payload.items]
+    try:
+        counts = apply_user_media_statuses(user.id, items, database)
+    except Exception as e:
+        database.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Database Error: {e}")
+
+    return {"success": True, **counts}
+
+
+@router.post("/me/import", response_model=ImportReport)
+async def import_user_library(
+    request: Request,
+    import_status: Literal["seen", "towatchlater", "hidden"] = Query(default="seen", alias="status"),
+    database: Session = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+):
+    """
+    Imports an IMDb or Letterboxd CSV export sent as the raw request body (text/csv).
+    The body is spooled to disk past 1 MB, then parsed and imported chunk by chunk off the event loop.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as upload:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > LIBRARY_IMPORT_MAX_BYTES:
+                raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Import file too large")
+            upload.write(chunk)
+        upload.seek(0)
+
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        try:
+            return await run_in_threadpool(import_library_export, user.id, text, import_status, database)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        finally:
+            text.detach()
+
+
 @router.post("/me/movies/update_status", status_code=status.HTTP_200_OK)
 def update_movie_status(
     payload: MediaStatusUpdate,
     database: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     success, message = update_user_media_status("movie", payload.tmdb_id, user.id, database, payload.status)
     if not success:
@@ -38,36 +152,42 @@ def update_movie_status(
 
 @router.get("/me/movies/seen", response_model=list[MovieCard])
 def fetch_user_seen_movies(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("movie",user.id, database, language, "seen")
+    return _status_list_response(request, "movie", "seen", user, database, language, image_size)
 
 
 @router.get("/me/movies/towatchlater", response_model=list[MovieCard])
 def fetch_user_later_movies(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("movie", user.id, database, language, "towatchlater")
+    return _status_list_response(request, "movie", "towatchlater", user, database, language, image_size)
 
 
 @router.get("/me/movies/hidden", response_model=list[MovieCard])
 def fetch_user_hidden_movies(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("movie", user.id, database, language, "hidden")
+    return _status_list_response(request, "movie", "hidden", user, database, language, image_size)
 
 
 @router.post("/me/tvshows/update_status", status_code=status.HTTP_200_OK)
 def update_tvshow_status(
     payload: MediaStatusUpdate,
     database: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     success, message = update_user_media_status("tv", payload.tmdb_id, user.id, database, payload.status)
     if not success:
@@ -78,26 +198,32 @@ def update_tvshow_status(
 
 @router.get("/me/tvshows/seen", response_model=list[TvShowCard])
 def fetch_user_seen_tvshows(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("tv",user.id, database, language, "seen")
+    return _status_list_response(request, "tv", "seen", user, database, language, image_size)
 
 
 @router.get("/me/tvshows/towatchlater", response_model=list[TvShowCard])
 def fetch_user_later_tvshows(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("tv",user.id, database, language, "towatchlater")
+    return _status_list_response(request, "tv", "towatchlater", user, database, language, image_size)
 
 
 @router.get("/me/tvshows/hidden", response_model=list[TvShowCard])
 def fetch_user_hidden_tvshows(
-    user: User = Depends(get_current_user),
+    request: Request,
+    user: Principal = Depends(get_current_user),
     database: Session = Depends(get_db),
     language: str = Depends(get_language),
+    image_size: str = Depends(get_image_size),
 ):
-    return get_user_media_by_status("tv", user.id, database, language, "hidden")
+    return _status_list_response(request, "tv", "hidden", user, database, language, image_size)
@@ -0,0 +1,139 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.backend.core.config import AUTH_TOKEN_CACHE_SIZE, AUTH_PRINCIPAL_CACHE_SIZE, AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+from app.backend.core.security import decode_access_token
+from app.backend.models.user_model import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Read-only snapshot of the authenticated user, safe to share across requests and threads.
+    """
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, first_name=user.first_name, last_name=user.last_name, email=user.email)
+
+
+class ExpiringLRU:
+    """
+    Small thread-safe LRU where every entry carries its own absolute expiry (epoch seconds).
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, expires_at: float):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# ─────────────────────────────────────────────
+# VERIFIED TOKENS (keyed on a hash, never on the raw token)
+_verified_tokens = ExpiringLRU(AUTH_TOKEN_CACHE_SIZE)
+
+
+def get_verified_payload(token: str) -> Optional[dict]:
+    """
+    Decoded JWT payload, verified once and then served from memory until the token's own `exp`.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload is not None and "exp" in payload:
+        _verified_tokens.put(key, payload, float(payload["exp"]))
+    return payload
+
+
+# ─────────────────────────────────────────────
+# PRINCIPALS (keyed on email, the JWT subject)
+_principals = ExpiringLRU(AUTH_PRINCIPAL_CACHE_SIZE)
+
+
+def get_cached_principal(email: str) -> Optional[Principal]:
+    return _principals.get(email)
+
+
+def cache_principal(principal: Principal):
+    _principals.put(principal.email, principal, time.time() + AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(email: str):
+    _principals.pop(email)
+
+
+def clear_auth_caches():
+    _verified_tokens.clear()
+    _principals.clear()
+
+
+# Evicted only once the change is committed: evicting at flush would let a concurrent request
+# re-cache the old row before the commit makes the new one visible
+PENDING_EVICTIONS_KEY = "auth_cache_evictions"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_user_change(mapper, connection, target: User):
+    """
+    Any write to a user (including an email change) marks its cached principal for eviction at commit.
+    """
+    session = object_session(target)
+    emails = {target.email, *(inspect(target).attrs.email.history.deleted or [])}
+    if session is None:
+        for email in emails:
+            invalidate_principal(email)
+        return
+    session.info.setdefault(PENDING_EVICTIONS_KEY, set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_user_changes(session: Session):
+    for email in session.info.pop(PENDING_EVICTIONS_KEY, ()):
+        invalidate_principal(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_user_changes(session: Session):
+    session.info.pop(PENDING_EVICTIONS_KEY, None)
@@ -11,6 +11,65 @@ TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = "gpt-4.1-nano"
+# Build the (slow to import) OpenAI client in the background at startup instead of on the first LLM call
+OPENAI_CLIENT_WARMUP = os.getenv("OPENAI_CLIENT_WARMUP", "1") == "1"
+# Stream title-list answers so each title is resolved on TMDB while the model is still writing the next ones
+OPENAI_STREAMING = os.getenv("OPENAI_STREAMING", "1") == "1"
+
+# Upstream base URLs (override to point at scripts/upstream_stub_server.py)
+TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
+OMDB_BASE_URL = os.getenv("OMDB_BASE_URL", "http://www.omdbapi.com/")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # None → official OpenAI endpoint
+
+# Shared I/O thread pool (TMDB / OMDB / enrichment)
+IO_EXECUTOR_MAX_WORKERS = int(os.getenv("IO_EXECUTOR_MAX_WORKERS", "32"))
+IO_EXECUTOR_PER_REQUEST_LIMIT = int(os.getenv("IO_EXECUTOR_PER_REQUEST_LIMIT", "16"))
+
+# Chat session store: hot sessions kept in memory, messages flushed to the DB in batches
+CHAT_SESSION_CACHE_SIZE = int(os.getenv("CHAT_SESSION_CACHE_SIZE", "10000"))
+CHAT_FLUSH_INTERVAL_SECONDS = float(os.getenv("CHAT_FLUSH_INTERVAL_SECONDS", "1.0"))
+CHAT_FLUSH_BATCH_SIZE = int(os.getenv("CHAT_FLUSH_BATCH_SIZE", "200"))
+# Flushes a chat record may fail (other than constraint violations) before it is dropped
+CHAT_FLUSH_MAX_ATTEMPTS = int(os.getenv("CHAT_FLUSH_MAX_ATTEMPTS", "5"))
+
+# Card JSON cache: serialized cards per (media_type, tmdb_id, language)
+CARD_JSON_CACHE_SIZE = int(os.getenv("CARD_JSON_CACHE_SIZE", "50000"))
+
+# Library import (IMDb / Letterboxd CSV): rows per resolve + upsert transaction, max upload size
+LIBRARY_IMPORT_CHUNK_SIZE = int(os.getenv("LIBRARY_IMPORT_CHUNK_SIZE", "500"))
+LIBRARY_IMPORT_MAX_BYTES = int(os.getenv("LIBRARY_IMPORT_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Similarity index (scripts/build_similarity_index): neighbours stored per title
+SIMILARITY_NEIGHBOURS = int(os.getenv("SIMILARITY_NEIGHBOURS", "40"))
+
+# Description search: FTS5 titles matching every term needed to answer without the LLM, local candidates kept
+DESCRIPTION_LOCAL_MIN_RESULTS = int(os.getenv("DESCRIPTION_LOCAL_MIN_RESULTS", "10"))
+DESCRIPTION_LOCAL_LIMIT = int(os.getenv("DESCRIPTION_LOCAL_LIMIT", "30"))
+
+# Local intent classifier (scripts/train_intent_classifier): model file, and the confidence needed to skip the LLM
+INTENT_MODEL_PATH = os.getenv("INTENT_MODEL_PATH", "data/processed/intent_model.json")
+INTENT_LOCAL_THRESHOLD = float(os.getenv("INTENT_LOCAL_THRESHOLD", "0.9"))
+# Opt-in: log each LLM-classified opening message (raw chat text) as a training label for that model
+INTENT_LABEL_LOGGING = os.getenv("INTENT_LABEL_LOGGING", "0") == "1"
+
+# Auth caches: verified JWTs (bounded by their own expiry) and user principals
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+AUTH_PRINCIPAL_CACHE_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "10000"))
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "300"))
+
+# Password hashing: bcrypt cost and the process pool that runs it (0 workers → inline)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", "5"))
+
+# Logging: level gate, output format ("text" or "json") and share of DEBUG records kept
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+
+# Tracing: requests slower than this get their span breakdown logged
+TRACE_SLOW_REQUEST_SECONDS = float(os.getenv("TRACE_SLOW_REQUEST_SECONDS", "2.0"))
 
 
 # 🧠 Intent classification
@@ -160,7 +219,7 @@ FILTER_PARSING_CONFIG = {
       - `max_release_year`: the latest acceptable release year
       - `min_imdb_rating`: minimum IMDb rating (float)
       - `min_imdb_votes_count`: minimum IMDb votes (integer)
-      - `sort_by`: one of: "popularity.desc", "vote_average.desc", "vote_count.desc"
+      - `sort_by`: one of: "popularity.desc", "vote_average.desc", "vote_count.desc", "personalized" (when the user asks for something matching their taste)
 
       💡 Be smart and infer filters when appropriate.  
       For example, if the user asks for:
@@ -195,7 +254,7 @@ FILTER_PARSING_CONFIG = {
         - `max_release_year`: latest air date year
         - `min_imdb_rating`: minimum IMDb rating (float)
         - `min_imdb_votes_count`: IMDb vote count threshold
-        - `sort_by`: one of: "popularity.desc", "vote_average.desc", "vote_count.desc"
+        - `sort_by`: one of: "popularity.desc", "vote_average.desc", "vote_count.desc", "personalized" (when the user asks for something matching their taste)
 
         💡 Be smart and infer filters when appropriate.  
         For example, if the user asks for:
@@ -1,14 +1,17 @@
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, status, Header, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.backend.models.user_model import User
 from sqlalchemy.orm import Session
 
-from app.backend.core.security import decode_access_token
+from app.backend.core.auth_cache import Principal, get_verified_payload, get_cached_principal, cache_principal
 from app.backend.core.database import get_db
+from app.backend.core.tmdb_client import PosterSize, DEFAULT_POSTER_SIZE
 
 from typing import Optional
+import logging
 
+logger = logging.getLogger(__name__)
 
 oauth2_scheme = HTTPBearer()
 
@@ -16,10 +19,14 @@ oauth2_scheme = HTTPBearer()
 def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
     database: Session = Depends(get_db),
-) -> User:
+) -> Principal:
+    """
+    Resolves the bearer token to the current user. Verified tokens and user
+    principals are cached, so the common path skips both the JWT decode and the DB query.
+    """
 
-    # decode Payload :
-    payload = decode_access_token(token.credentials.replace("Bearer ", ""))
+    # decode Payload (cached until the token expires) :
+    payload = get_verified_payload(token.credentials.replace("Bearer ", ""))
 
     if payload is None:
         raise HTTPException(
@@ -33,20 +40,26 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload"
         )
 
-    # get user :
+    # get user (cached principal, else DB) :
+    principal = get_cached_principal(email)
+    if principal is not None:
+        return principal
+
     user = database.query(User).filter(User.email == email).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User Not Found"
         )
 
-    return user
+    principal = Principal.from_user(user)
+    cache_principal(principal)
+    return principal
 
 
 def get_language(accept_language: Optional[str] = Header(default=None)) -> str:
     
     if not accept_language:
-        print("⚠️ Header missing entirely")
+        logger.debug("Accept-Language header missing, defaulting to en")
         return "en"
 
     try:
@@ -54,6 +67,13 @@ def get_language(accept_language: Optional[str] = Header(default=None)) -> str:
         if lang.startswith("fr"):
             return "fr"
     except Exception as e:
-        print("⚠️ Error parsing language:", e)
+        logger.warning("Could not parse Accept-Language %r: %s", accept_language, e)
 
     return "en"
+
+
+def get_image_size(preferred_image_size: PosterSize = Query(default=DEFAULT_POSTER_SIZE)) -> str:
+    """
+    TMDB poster size for the cards of this response: w185 / w342 (lists) / w500 / original.
+    """
+    return preferred_image_size
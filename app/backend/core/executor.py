@@ -0,0 +1,159 @@
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Optional
+
+from app.backend.core.config import IO_EXECUTOR_MAX_WORKERS, IO_EXECUTOR_PER_REQUEST_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+class IOExecutor:
+    """
+    Application-wide thread pool for blocking I/O (TMDB, OMDB, enrichment).
+    - `max_workers` caps the number of threads for the whole process.
+    - `per_request_limit` caps how many tasks one `map` call keeps in flight,
+      so a request with 50 titles cannot monopolize the queue.
+    """
+
+    def __init__(self, max_workers: int, per_request_limit: int):
+        self.max_workers = max_workers
+        self.per_request_limit = max(1, per_request_limit)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="io-worker")
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._queued = 0
+        self._active = 0
+        self._submitted_total = 0
+        self._completed_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a single task, recording its queue wait time.
+        The caller's context variables (e.g. the current trace) are copied into the worker.
+        """
+        enqueued_at = time.perf_counter()
+        context = contextvars.copy_context()
+
+        def run():
+            waited = time.perf_counter() - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed_total += 1
+
+        with self._lock:
+            self._queued += 1
+            self._submitted_total += 1
+
+        return self._pool.submit(run)
+
+
+    def map(self, fn: Callable, items: Iterable) -> list:
+        """
+        Run `fn` over `items` and return results in input order.
+        At most `per_request_limit` tasks of this call are queued or running at once.
+        `items` is consumed lazily: with a generator (e.g. a streamed LLM answer) each item is
+        dispatched as soon as it is produced, while earlier tasks keep running.
+        """
+        results: dict[int, object] = {}
+        pending: dict[Future, int] = {}
+        remaining = enumerate(items)
+        count = 0
+
+        def fill():
+            nonlocal count
+            while len(pending) < self.per_request_limit:
+                nxt = next(remaining, None)
+                if nxt is None:
+                    return
+                index, item = nxt
+                pending[self.submit(fn, item)] = index
+                count += 1
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+            fill()
+
+        return [results[index] for index in range(count)]
+
+
+    def stats(self) -> dict:
+        with self._lock:
+            started = self._submitted_total - self._queued
+            return {
+                "max_workers": self.max_workers,
+                "per_request_limit": self.per_request_limit,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "submitted_total": self._submitted_total,
+                "completed_total": self._completed_total,
+                "wait_seconds_avg": (self._wait_seconds_total / started) if started else 0.0,
+                "wait_seconds_max": self._wait_seconds_max,
+            }
+
+
+    def shutdown(self, wait_for_tasks: bool = True):
+        self._pool.shutdown(wait=wait_for_tasks, cancel_futures=not wait_for_tasks)
+
+
+
+# ─────────────────────────────────────────────
+# APPLICATION-SCOPED INSTANCE
+_io_executor: Optional[IOExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def start_io_executor() -> IOExecutor:
+    """
+    Creates the shared executor (called from the FastAPI lifespan hook).
+    """
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = IOExecutor(IO_EXECUTOR_MAX_WORKERS, IO_EXECUTOR_PER_REQUEST_LIMIT)
+            logger.info(
+                "I/O executor started: max_workers=%s, per_request_limit=%s",
+                IO_EXECUTOR_MAX_WORKERS, IO_EXECUTOR_PER_REQUEST_LIMIT,
+            )
+        return _io_executor
+
+
+def get_io_executor() -> IOExecutor:
+    """
+    Returns the shared executor, starting it lazily for scripts and tests
+    that run outside the FastAPI lifespan.
+    """
+    return _io_executor or start_io_executor()
+
+
+def shutdown_io_executor():
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is not None:
+            logger.info("I/O executor stats at shutdown: %s", _io_executor.stats())
+            _io_executor.shutdown()
+            _io_executor = None
+
+
+def run_in_io_pool(fn: Callable, items: Iterable) -> list:
+    """
+    Shortcut used by services: fan `fn` out over `items` on the shared executor.
+    """
+    return get_io_executor().map(fn, items)
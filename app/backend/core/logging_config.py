@@ -1,16 +1,79 @@
+import atexit
+import json
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+import queue
+import random
 import sys
 from pathlib import Path
+from typing import Optional
+
+from app.backend.core.config import LOG_LEVEL, LOG_FORMAT, LOG_DEBUG_SAMPLE_RATE
 
 # Ensure Logs directory exists:
 LOG_DIR = Path(__file__).resolve().parents[3] / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# Attributes every LogRecord has; anything else was passed through `extra=` and is a structured field
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Text: "<time> [LEVEL] name - message | key=value ..."
+    JSON: one object per line with the same fields.
+    """
+
+    def __init__(self, as_json: bool = False):
+        super().__init__("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS}
+
+        if self.as_json:
+            entry = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            return json.dumps(entry, default=str, ensure_ascii=False)
+
+        line = super().format(record)
+        if fields:
+            line += " | " + " ".join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keeps only a `rate` share of DEBUG records; INFO and above always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
 
 def setup_logging():
+    """
+    Request threads only put records on an in-memory queue; a background
+    listener thread formats them and writes to stdout and the rotating file.
+    """
+    global _listener
+    if _listener is not None:
+        return
 
-    log_format = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+    formatter = StructuredFormatter(as_json=LOG_FORMAT == "json")
 
     handlers = [
         logging.StreamHandler(sys.stdout),
@@ -18,13 +81,33 @@ def setup_logging():
             LOG_DIR / "app.log",
             when="midnight",
             interval=1,             # rotate every midnight
-            backupCount=7,          # every 1 day
-            encoding="utf-8"        # keep 7 days of logs
+            backupCount=7,          # keep 7 days of logs
+            encoding="utf-8"
         )
     ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(DebugSampler(LOG_DEBUG_SAMPLE_RATE))
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
 
-    logging.basicConfig(
-        level=logging.INFO,         # Only show logs that are INFO or more important
-        format=log_format,
-        handlers=handlers
-    )
\ No newline at end of file
+def stop_logging():
+    """
+    Drains the queue and stops the listener thread (called on shutdown).
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,9 +1,9 @@
 import requests
-from app.backend.core.config import OMDB_API_KEY
-
-OMDB_BASE_URL = "http://www.omdbapi.com/"
+from app.backend.core.config import OMDB_API_KEY, OMDB_BASE_URL
+from app.backend.core.tracing import traced
 
 
+@traced
 def call_omdb_client(imdb_id: str) -> dict:
 
     url = OMDB_BASE_URL
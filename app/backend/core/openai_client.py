@@ -1,19 +1,35 @@
-from openai import OpenAI
-from app.backend.core.config import OPENAI_API_KEY, OPENAI_MODEL
-from typing import List, Dict
+import threading
+import time
+from app.backend.core.config import OPENAI_API_KEY, OPENAI_MODEL, OPENAI_BASE_URL
+from app.backend.core.tracing import record_span_duration, traced
+from typing import Dict, Iterator, List
 
 # ─────────────────────────────────────────────
 # CLIENT INITIALIZATION
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+# Built on first use: importing the `openai` SDK costs more than the rest of the
+# app's imports combined, and most workers / tests never make an LLM call.
+_openai_client = None
+_openai_client_lock = threading.Lock()
 
 
+def get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                from openai import OpenAI
+                _openai_client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+    return _openai_client
+
+
+@traced
 def get_openai_completion(conversation: List[Dict[str, str]], prompt: str, temperature: float) -> str:
 
     messages = [{"role": "system", "content": prompt}]
     messages.extend(conversation)
 
     try:
-        response = openai_client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model=OPENAI_MODEL, 
             messages=messages, 
             temperature=temperature
@@ -22,3 +38,31 @@ def get_openai_completion(conversation: List[Dict[str, str]], prompt: str, tempe
 
     except Exception as e:
         raise RuntimeError(f"OpenAI completion failed: {str(e)}")
+
+
+def stream_openai_completion(conversation: List[Dict[str, str]], prompt: str, temperature: float) -> Iterator[str]:
+    """
+    Same request as get_openai_completion, but yields the answer's text pieces as the model generates them.
+    Not a span (the caller's work runs between the pieces): the duration up to the last piece goes to the
+    `openai_client.stream_openai_completion` histogram.
+    """
+    messages = [{"role": "system", "content": prompt}]
+    messages.extend(conversation)
+    start = time.perf_counter()
+
+    try:
+        stream = get_openai_client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    except Exception as e:
+        raise RuntimeError(f"OpenAI completion failed: {str(e)}")
+
+    finally:
+        record_span_duration("openai_client.stream_openai_completion", time.perf_counter() - start)
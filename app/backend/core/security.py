@@ -1,18 +1,140 @@
+import asyncio
 import bcrypt
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
 from jose import JWTError, jwt
 from datetime import datetime, timedelta, timezone
-from app.backend.core.config import SECRET_KEY, ALGORITHM
+from app.backend.core.config import (
+    SECRET_KEY,
+    ALGORITHM,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
 
+logger = logging.getLogger(__name__)
 
-def hash_password(plain_password: str) -> str:
-    hashed = bcrypt.hashpw(plain_password.encode("utf-8"), bcrypt.gensalt())
+
+# ─────────────────────────────────────────────
+# PASSWORD HASHING POOL
+# bcrypt is CPU-bound by design: it runs in a small process pool so a burst of
+# logins cannot tie up the API threads' CPU, and at most PASSWORD_HASH_MAX_PENDING
+# hashes may be queued before callers get PasswordHashingBusy (a 503 in the routes).
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+_pending_hashes = threading.BoundedSemaphore(max(1, PASSWORD_HASH_MAX_PENDING))
+
+
+class PasswordHashingBusy(Exception):
+    """
+    The hashing queue is full: the caller should be asked to retry later.
+    """
+
+
+def _bcrypt_hash(plain_password: str, rounds: int) -> str:
+    hashed = bcrypt.hashpw(plain_password.encode("utf-8"), bcrypt.gensalt(rounds=rounds))
     return hashed.decode("utf-8")
 
 
+def _bcrypt_check(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def start_password_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Creates the hashing pool (called from the FastAPI lifespan hook, or lazily).
+    Uses "spawn" so workers never inherit locks held by the parent's threads.
+    """
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None and PASSWORD_HASH_WORKERS > 0:
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Password hashing pool started: workers=%s, bcrypt rounds=%s", PASSWORD_HASH_WORKERS, BCRYPT_ROUNDS)
+        return _hash_pool
+
+
+def shutdown_password_pool():
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
+
+
+def _run_in_hash_pool(fn: Callable, *args):
+    """
+    Blocking version, for scripts and sync callers: waits up to PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS for a slot.
+    """
+    pool = _hash_pool or start_password_pool()
+    if pool is None:
+        return fn(*args)
+
+    if not _pending_hashes.acquire(timeout=PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS):
+        logger.warning("Password hashing pool saturated, rejecting request")
+        raise PasswordHashingBusy()
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        # A worker died (OOM kill, failed spawn): replace the pool, answer this call inline
+        logger.exception("Password hashing pool broke, restarting it")
+        _discard_broken_pool(pool)
+        return fn(*args)
+    finally:
+        _pending_hashes.release()
+
+
+async def _run_in_hash_pool_async(fn: Callable, *args):
+    """
+    Request path: awaits the pool's future, so no API thread is held while bcrypt runs.
+    A full queue is rejected at once instead of parking the request.
+    """
+    pool = _hash_pool or start_password_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+
+    if not _pending_hashes.acquire(blocking=False):
+        logger.warning("Password hashing pool saturated, rejecting request")
+        raise PasswordHashingBusy()
+    try:
+        return await asyncio.wrap_future(pool.submit(fn, *args))
+    except BrokenProcessPool:
+        logger.exception("Password hashing pool broke, restarting it")
+        _discard_broken_pool(pool)
+        return await asyncio.to_thread(fn, *args)
+    finally:
+        _pending_hashes.release()
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor):
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is pool:
+            _hash_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def hash_password(plain_password: str) -> str:
+    return _run_in_hash_pool(_bcrypt_hash, plain_password, BCRYPT_ROUNDS)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-    )
+    return _run_in_hash_pool(_bcrypt_check, plain_password, hashed_password)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    return await _run_in_hash_pool_async(_bcrypt_hash, plain_password, BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_hash_pool_async(_bcrypt_check, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_in: int = 3600) -> str:
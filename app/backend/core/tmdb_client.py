@@ -1,13 +1,34 @@
+import logging
 import requests
-from typing import Optional
-from app.backend.core.config import TMDB_API_KEY
+from typing import Literal, Optional, get_args
+from app.backend.core.config import TMDB_API_KEY, TMDB_BASE_URL
+from app.backend.core.tracing import traced
 from app.backend.schemas.movie_schemas import MovieSearchFilters
 
+logger = logging.getLogger(__name__)
 
-TMDB_BASE_URL = "https://api.themoviedb.org/3"
-IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+# Poster size contract: cards carry the TMDB `poster_path`, URLs are built per requested size
+IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
+PosterSize = Literal["w185", "w342", "w500", "original"]
+POSTER_SIZES = get_args(PosterSize)
+DEFAULT_POSTER_SIZE = "w342"
 
 
+def build_poster_url(poster_path: Optional[str], size: str = DEFAULT_POSTER_SIZE) -> Optional[str]:
+    return f"{IMAGE_BASE_URL}/{size}{poster_path}" if poster_path else None
+
+
+def poster_path_from_url(poster_url: Optional[str]) -> Optional[str]:
+    """
+    "https://image.tmdb.org/t/p/original/abc.jpg" → "/abc.jpg" (None for non-TMDB URLs).
+    """
+    if not poster_url or not poster_url.startswith(f"{IMAGE_BASE_URL}/"):
+        return None
+    _, separator, path = poster_url[len(IMAGE_BASE_URL) + 1:].partition("/")
+    return f"/{path}" if separator and path else None
+
+
+@traced
 def get_genres_mapping(media_type: str, language: str) -> dict:
 
     url = f"{TMDB_BASE_URL}/genre/{media_type}/list"
@@ -27,12 +48,15 @@ def get_genres_mapping(media_type: str, language: str) -> dict:
     return mapping
 
 
-def call_tmdb_discover_media_endpoint(media_type: str, filters: MovieSearchFilters, page: int) -> list[dict]:
+@traced
+def call_tmdb_discover_media_endpoint(
+    media_type: str, filters: MovieSearchFilters, page: int, raise_errors: bool = False
+) -> list[dict]:
     """
     Low-level TMDB client to hit /discover/movie or tv with filter + pagination.
+    A failed call returns [] unless `raise_errors` is set (callers that must tell "no results" from "failed").
     """
     url = f"{TMDB_BASE_URL}/discover/{media_type}"
-    print(f"[DEBUG] Calling TMDB Discover Endpoint: {url}")
 
     params = {
         "api_key": TMDB_API_KEY,
@@ -40,7 +64,8 @@ def call_tmdb_discover_media_endpoint(media_type: str, filters: MovieSearchFilte
         "vote_average.gte": 6,
         "vote_count.gte": 1000,
         "with_original_language": filters.original_language or None,
-        "sort_by": filters.sort_by or "popularity.desc",
+        # "personalized" is applied locally after the fetch: TMDB supplies popular candidates
+        "sort_by": filters.sort_by if filters.sort_by not in (None, "personalized") else "popularity.desc",
         "page": page,
     }
 
@@ -59,25 +84,25 @@ def call_tmdb_discover_media_endpoint(media_type: str, filters: MovieSearchFilte
     params.update(combined_date_filters)
     params = {k: v for k, v in params.items() if v is not None}
 
-    print(f"[DEBUG] Final TMDB Discover request params: {params}")
-
     try:
         response = requests.get(url, params=params, timeout=10)
-        print(f"[DEBUG] TMDB responded with status code: {response.status_code}")
         response.raise_for_status()
 
-        data = response.json()
-        movies = data.get("results", [])
-        print(f"[DEBUG] TMDB returned {len(movies)} results on page {page}")
-        if not movies:
-            print(f"[WARNING] TMDB response was empty. Full payload: {data}")
+        movies = response.json().get("results", [])
+        logger.debug(
+            "TMDB discover page fetched",
+            extra={"media_type": media_type, "page": page, "results": len(movies), "genre_id": filters.genre_id},
+        )
         return movies
 
     except requests.RequestException as e:
-        print(f"[TMDB ERROR] Discover call failed: {e} | page={page} | params={params}")
+        logger.warning("TMDB discover call failed: %s", e, extra={"media_type": media_type, "page": page})
+        if raise_errors:
+            raise
         return []
 
 
+@traced
 def call_tmdb_media_details_endpoint(media_type: str, tmdb_id: int, language: str) -> dict:
     """
     Given "tv" or "movie", "tmdb_id" and langauge,  it retruns details to enrich.
@@ -98,6 +123,7 @@ def call_tmdb_media_details_endpoint(media_type: str, tmdb_id: int, language: st
     return data
 
 
+@traced
 def call_tmdb_media_id_by_media_name_endpoint(media_type: str, title: str, year: Optional[int] = None) -> Optional[int]:
     """
     Hits /search/movie on TMDB and tries to return best match TMDB ID.
@@ -120,11 +146,33 @@ def call_tmdb_media_id_by_media_name_endpoint(media_type: str, title: str, year:
         if results:
             return results[0]["id"]
     except requests.RequestException as e:
-        print(f"[TMDB ERROR] Failed to fetch {media_type} ID: {e} | query={title}")
+        logger.warning("TMDB search failed: %s", e, extra={"media_type": media_type, "query": title})
     
     return None
     
 
+@traced
+def call_tmdb_find_by_imdb_id_endpoint(imdb_id: str) -> Optional[tuple[str, int]]:
+    """
+    Hits /find/{imdb_id}: returns ("movie" | "tv", TMDB ID) for an IMDb title, or None.
+    """
+    url = f"{TMDB_BASE_URL}/find/{imdb_id}"
+    params = {"api_key": TMDB_API_KEY, "external_source": "imdb_id"}
+
+    try:
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        for media_type, key in (("movie", "movie_results"), ("tv", "tv_results")):
+            if data.get(key):
+                return media_type, data[key][0]["id"]
+    except requests.RequestException as e:
+        logger.warning("TMDB find failed: %s", e, extra={"imdb_id": imdb_id})
+
+    return None
+
+
+@traced
 def call_tmdb_media_videos_endpoint(media_type: str, tmdb_id: int, language: str) -> Optional[str]:
     """
     Fetches the YouTube trailer URL for a given movie or TV show from TMDB.
@@ -149,3 +197,19 @@ def call_tmdb_media_videos_endpoint(media_type: str, tmdb_id: int, language: str
     return None
 
 
+@traced
+def call_tmdb_changes_endpoint(media_type: str, start_date: str, end_date: str, page: int = 1) -> dict:
+    """
+    Hits /movie/changes or /tv/changes: IDs changed between two dates (max 14 days apart).
+    Returns the raw page payload (results, page, total_pages).
+    """
+    url = f"{TMDB_BASE_URL}/{media_type}/changes"
+    params = {
+        "api_key": TMDB_API_KEY,
+        "start_date": start_date,
+        "end_date": end_date,
+        "page": page,
+    }
+    response = requests.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
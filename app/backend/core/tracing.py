@@ -0,0 +1,157 @@
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+# Histogram buckets (seconds) shared by every span
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+# ─────────────────────────────────────────────
+# HISTOGRAMS
+
+class Histogram:
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        for i, upper in enumerate(BUCKETS):
+            if seconds <= upper:
+                self.bucket_counts[i] += 1
+                break
+
+
+_histograms: dict[str, Histogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def record_span_duration(name: str, seconds: float):
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+
+def reset_histograms():
+    with _histograms_lock:
+        _histograms.clear()
+
+
+# ─────────────────────────────────────────────
+# SPANS
+# The current trace and parent span live in context variables, so they follow
+# the request into the I/O executor threads (see IOExecutor.submit).
+
+@dataclass
+class Trace:
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: list = field(default_factory=list)   # (name, parent, start offset, duration)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, name: str, parent: Optional[str], start: float, duration: float):
+        with self.lock:
+            self.spans.append((name, parent, start - self.started_at, duration))
+
+    def summary(self) -> str:
+        with self.lock:
+            spans = sorted(self.spans, key=lambda s: s[2])
+        return "\n".join(
+            f"  +{offset * 1000:8.1f}ms {duration * 1000:8.1f}ms  {name}  (in {parent or '-'})"
+            for name, parent, offset, duration in spans
+        )
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_span", default=None)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Times a block, records it into the `name` histogram and the current trace.
+    """
+    parent = _current_span.get()
+    token = _current_span.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        _current_span.reset(token)
+        record_span_duration(name, duration)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(name, parent, start, duration)
+
+
+def traced(fn: Callable) -> Callable:
+    """
+    Decorator: wraps a function in a span named `<module>.<function>`.
+    """
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def start_trace() -> contextvars.Token:
+    return _current_trace.set(Trace())
+
+
+def end_trace(token: contextvars.Token) -> Optional[Trace]:
+    trace = _current_trace.get()
+    _current_trace.reset(token)
+    return trace
+
+
+# ─────────────────────────────────────────────
+# PROMETHEUS EXPOSITION
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_prometheus(extra_metrics: Optional[dict[str, float]] = None) -> str:
+    """
+    Span histograms plus flat metrics (names ending in `_total` are typed as counters, the rest as gauges).
+    """
+    lines = [
+        "# HELP app_span_duration_seconds Time spent per pipeline stage.",
+        "# TYPE app_span_duration_seconds histogram",
+    ]
+
+    with _histograms_lock:
+        snapshot = {
+            name: (list(h.bucket_counts), h.count, h.total)
+            for name, h in sorted(_histograms.items())
+        }
+
+    for name, (bucket_counts, count, total) in snapshot.items():
+        label = _escape(name)
+        cumulative = 0
+        for upper, bucket_count in zip(BUCKETS, bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'app_span_duration_seconds_bucket{{span="{label}",le="{upper}"}} {cumulative}')
+        lines.append(f'app_span_duration_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+        lines.append(f'app_span_duration_seconds_sum{{span="{label}"}} {total}')
+        lines.append(f'app_span_duration_seconds_count{{span="{label}"}} {count}')
+
+    for metric, value in (extra_metrics or {}).items():
+        metric_type = "counter" if metric.endswith("_total") else "gauge"
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.append(f"{metric} {value}")
+
+    return "\n".join(lines) + "\n"
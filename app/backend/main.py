@@ -1,12 +1,20 @@
 # app/backend/main.py
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 import logging
+import time
 
 from app.backend.api.router import api_router
 from app.backend.core.logging_config import setup_logging
+from app.backend.core.executor import start_io_executor, shutdown_io_executor, get_io_executor
+from app.backend.core.security import start_password_pool, shutdown_password_pool
+from app.backend.services.chat_session_store import start_chat_session_store, shutdown_chat_session_store
+from app.backend.core.tracing import start_trace, end_trace, record_span_duration, render_prometheus
+from app.backend.core.openai_client import get_openai_client
+from app.backend.core.config import TRACE_SLOW_REQUEST_SECONDS, OPENAI_CLIENT_WARMUP
 
 
 # --- Logging Setup ---
@@ -19,8 +27,16 @@ logger.info("Starting FastAPI App...")
 @asynccontextmanager
 async def lifespan(app:FastAPI):
     logger.info("Startup: initializing resources...")
+    start_io_executor()
+    start_password_pool()
+    start_chat_session_store()
+    if OPENAI_CLIENT_WARMUP:
+        get_io_executor().submit(get_openai_client)   # off the startup path, ready before most first chats
     yield
     logger.info("Shutdown: cleaning up resources...")
+    shutdown_chat_session_store()   # flush pending chat writes before anything else goes away
+    shutdown_io_executor()
+    shutdown_password_pool()
 
 
 # --- FastAPI App Setup ---
@@ -42,6 +58,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Tracing Middleware ---
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    token = start_trace()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        duration = time.perf_counter() - start
+        trace = end_trace(token)
+        route = request.scope.get("route")
+        name = f"http {request.method} {route.path if route else 'unmatched'}"
+        record_span_duration(name, duration)
+        if duration >= TRACE_SLOW_REQUEST_SECONDS:
+            logger.warning("Slow request %s took %.2fs:\n%s", name, duration, trace.summary())
+    return response
+
+
 # --- Include Routers ---
 app.include_router(api_router)
 
@@ -50,3 +84,10 @@ app.include_router(api_router)
 @app.get("/health", tags=["Health"])
 async def health_check():
     return {"status": "ok"}
+
+
+# --- Metrics (Prometheus text format) ---
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    executor_stats = get_io_executor().stats()
+    return render_prometheus({f"app_io_executor_{key}": value for key, value in executor_stats.items()})
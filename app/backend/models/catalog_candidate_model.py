@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Integer, Float, Boolean, Date, UniqueConstraint, Index
+from app.backend.core.database import Base
+
+
+# Title index seeded from TMDB daily ID exports, enriched in popularity order
+class CatalogCandidate(Base):
+
+    __tablename__ = "catalog_candidates"
+
+    id = Column(Integer, primary_key=True)
+    media_type = Column(String, nullable=False)  # "movie" or "tv"
+    tmdb_id = Column(Integer, nullable=False)
+    original_title = Column(String, nullable=True)
+    popularity = Column(Float, nullable=False, default=0.0)
+    enriched = Column(Boolean, nullable=False, default=False)
+    export_date = Column(Date, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("media_type", "tmdb_id", name="_catalog_candidate_uc"),
+        Index("ix_catalog_candidates_queue", "media_type", "enriched", "popularity"),
+    )
+
+    def __repr__(self):
+        return f"<CatalogCandidate(media_type={self.media_type}, tmdb_id={self.tmdb_id}, popularity={self.popularity})>"
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer
+from app.backend.core.database import Base
+
+
+class CatalogVersion(Base):
+
+    __tablename__ = "catalog_versions"
+
+    # Last row_version handed out to a cached movie / TV show: an upper bound of every row's version
+    media_type = Column(String, primary_key=True)   # "movie" or "tv"
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CatalogVersion(media_type={self.media_type}, version={self.version})>"
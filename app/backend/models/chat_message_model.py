@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from app.backend.core.database import Base
+from datetime import datetime
+
+
+class ChatMessage(Base):
+
+    __tablename__ = "chat_messages"
+
+    # (session_id, seq) is the primary key, so "last N messages of a session" is an index range scan
+    session_id = Column(String, ForeignKey("chat_sessions.id"), primary_key=True)
+    seq = Column(Integer, primary_key=True, autoincrement=False)
+    role = Column(String, nullable=False)          # "user" | "assistant"
+    content = Column(Text, nullable=False)
+    created_on = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<ChatMessage(session_id={self.session_id}, seq={self.seq}, role={self.role})>"
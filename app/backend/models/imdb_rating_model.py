@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, Float, Date
+from app.backend.core.database import Base
+from datetime import date
+
+
+# Local copy of IMDb's public title.ratings dataset (see scripts/import_imdb_ratings.py)
+class ImdbRating(Base):
+
+    __tablename__ = "imdb_ratings"
+
+    imdb_id = Column(String, primary_key=True)
+    imdb_rating = Column(Float, nullable=False)
+    imdb_votes_count = Column(Integer, nullable=False)
+    import_date = Column(Date, nullable=False, default=date.today)
+
+    def __repr__(self):
+        return f"<ImdbRating(imdb_id={self.imdb_id}, rating={self.imdb_rating}, votes={self.imdb_votes_count})>"
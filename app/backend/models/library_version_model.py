@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.backend.core.database import Base
+
+
+class LibraryVersion(Base):
+
+    __tablename__ = "library_versions"
+
+    # Bumped in the same transaction as every change to the user's user_media rows
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, autoincrement=False)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<LibraryVersion(user_id={self.user_id}, version={self.version})>"
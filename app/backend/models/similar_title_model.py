@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Float
+from app.backend.core.database import Base
+
+
+class SimilarTitle(Base):
+
+    __tablename__ = "similar_titles"
+
+    # Offline-built nearest neighbours of a cached title (scripts/build_similarity_index), best first
+    media_type = Column(String, primary_key=True)   # "movie" or "tv"
+    tmdb_id = Column(Integer, primary_key=True, autoincrement=False)
+    rank = Column(Integer, primary_key=True, autoincrement=False)
+    similar_tmdb_id = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<SimilarTitle({self.media_type}, tmdb_id={self.tmdb_id}, rank={self.rank}, similar_tmdb_id={self.similar_tmdb_id})>"
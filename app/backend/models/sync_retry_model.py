@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from app.backend.core.database import Base
+from datetime import datetime
+
+
+class SyncRetry(Base):
+
+    __tablename__ = "sync_retries"
+
+    # A changed title whose refresh failed: retried by the next sync, which keeps the watermark until it succeeds
+    media_type = Column(String, primary_key=True)     # "movie" | "tv"
+    tmdb_id = Column(Integer, primary_key=True)
+    attempts = Column(Integer, nullable=False, default=1)
+    failed_on = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return f"<SyncRetry(media_type={self.media_type}, tmdb_id={self.tmdb_id}, attempts={self.attempts})>"
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Date, DateTime
+from app.backend.core.database import Base
+from datetime import datetime
+
+
+class SyncWatermark(Base):
+
+    __tablename__ = "sync_watermarks"
+
+    name = Column(String, primary_key=True)      # e.g. "tmdb_changes:movie"
+    watermark = Column(Date, nullable=False)     # last date fully synced
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return f"<SyncWatermark(name={self.name}, watermark={self.watermark})>"
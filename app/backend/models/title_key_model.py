@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String
+from app.backend.core.database import Base
+
+
+class TitleKey(Base):
+
+    __tablename__ = "title_keys"
+
+    # Folded EN / FR titles of cached titles (utils.fold_text), to spot a catalog title inside free text
+    media_type = Column(String, primary_key=True)   # "movie" or "tv"
+    key = Column(String, primary_key=True)
+    tmdb_id = Column(Integer, primary_key=True, autoincrement=False)
+    word_count = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<TitleKey({self.media_type}, key={self.key}, tmdb_id={self.tmdb_id})>"
@@ -17,6 +17,7 @@ class CachedTvShow(Base):
 
     release_year = Column(Integer, nullable=False)
     poster_url = Column(String, nullable=False)
+    poster_path = Column(String, nullable=True)
 
     title_en = Column(String, nullable=True)
     title_fr = Column(String, nullable=True)
@@ -33,6 +34,8 @@ class CachedTvShow(Base):
     overview_fr = Column(String, nullable=True)
 
     cache_update_date = Column(Date, nullable=False, default=date.today)
+    # Drawn from catalog_versions on every insert / refresh (see services/version_service.py)
+    row_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     def __repr__(self):
         return (
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, DateTime, Index, JSON
 from sqlalchemy.sql import func
 from app.backend.core.database import Base
 
@@ -12,12 +12,19 @@ class UserMedia(Base):
     tmdb_id = Column(Integer, nullable=False)
     media_type = Column(String, nullable=False)  # "movie" or "tv"
     status = Column(String, nullable=False)
+    # What this title added to the user's stat counters when it entered "seen" (NULL: not counted),
+    # so leaving "seen" subtracts exactly that even if the catalog row changed in between
+    stat_snapshot = Column(JSON(none_as_null=True), nullable=True)
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     __table_args__ = (
         UniqueConstraint("user_id", "tmdb_id", "media_type", name="_user_media_uc"),
+        # Library pages: one index range scan per (media_type, status), newest first
+        Index("ix_user_media_library", "user_id", "media_type", "status", "updated_at"),
+        # Users listing a title, whose library versions move when its catalog row changes
+        Index("ix_user_media_title", "media_type", "tmdb_id"),
     )
 
     def __repr__(self):
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from app.backend.core.database import Base
+
+
+class UserStatCounter(Base):
+
+    __tablename__ = "user_stat_counters"
+
+    # One running total per (user, kind, bucket), moved by +/- deltas on every status change:
+    #   ("seen", "") / ("towatchlater", "")   → titles per status
+    #   ("genre", "movie:18")                 → seen titles per genre
+    #   ("year", "1999")                      → seen titles per release year
+    #   ("rating", "sum") / ("rating", "n")   → IMDb rating sum / count of seen titles
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, autoincrement=False)
+    kind = Column(String, primary_key=True)
+    bucket = Column(String, primary_key=True, default="")
+    value = Column(Float, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<UserStatCounter(user_id={self.user_id}, kind={self.kind}, bucket={self.bucket}, value={self.value})>"
@@ -10,6 +10,7 @@ class MovieCard(BaseModel):
     release_year: Optional[int] = None
     imdb_rating: Optional[float]
     imdb_votes_count: Optional[int]
+    poster_path: Optional[str] = None
     poster_url: Optional[str] = None
     trailer_url: Optional[str] = None
     overview: Optional[str] = None
@@ -32,7 +33,8 @@ class MovieSearchFilters(BaseModel):
     sort_by: Optional[Literal[
         "popularity.desc",
         "vote_average.desc",
-        "vote_count.desc"
+        "vote_count.desc",
+        "personalized"
     ]] = "popularity.desc"
 
 
@@ -10,6 +10,7 @@ class TvShowCard(BaseModel):
     release_year: Optional[int] = None
     imdb_rating: Optional[float]
     imdb_votes_count: Optional[int]
+    poster_path: Optional[str] = None
     poster_url: Optional[str] = None
     trailer_url: Optional[str] = None
     overview: Optional[str] = None
@@ -29,7 +30,7 @@ class TvShowSearchFilters(BaseModel):
     max_release_year: Optional[int] = None
     original_language: Optional[str] = None
     sort_by: Optional[Literal[
-        "popularity.desc", "vote_average.desc", "vote_count.desc"
+        "popularity.desc", "vote_average.desc", "vote_count.desc", "personalized"
     ]] = "popularity.desc"
 
 
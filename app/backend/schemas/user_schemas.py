@@ -1,5 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from typing import Literal
+from pydantic import BaseModel, EmailStr, Field
+from typing import Literal, Optional
+from datetime import datetime
+from app.backend.schemas.movie_schemas import MovieCard
+from app.backend.schemas.tvshow_schemas import TvShowCard
 
 
 class UserCreate(BaseModel):
@@ -29,3 +32,33 @@ class TokenResponse(BaseModel):
 class MediaStatusUpdate(BaseModel):
     tmdb_id: int
     status: Literal["seen", "towatchlater", "hidden", "none"]
+
+
+class LibraryItem(BaseModel):
+    media_type: Literal["movie", "tv"]
+    status: Literal["seen", "towatchlater", "hidden"]
+    updated_at: datetime
+    card: MovieCard | TvShowCard
+
+
+class LibraryPage(BaseModel):
+    items: list[LibraryItem]
+    next_cursor: Optional[str] = None
+
+
+class MediaStatusItem(BaseModel):
+    media_type: Literal["movie", "tv"]
+    tmdb_id: int
+    status: Literal["seen", "towatchlater", "hidden", "none"]
+
+
+class BatchStatusUpdate(BaseModel):
+    items: list[MediaStatusItem] = Field(max_length=1000)
+
+
+class ImportReport(BaseModel):
+    rows: int
+    imported: int
+    unresolved: int
+    seconds: float
+    rows_per_second: Optional[float] = None
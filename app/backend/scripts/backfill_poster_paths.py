@@ -0,0 +1,56 @@
+# scripts/backfill_poster_paths.py
+#
+# Adds `poster_path` to cached movies / TV shows and fills it from the stored
+# `/t/p/original` poster_url, so cards can serve any poster size (w185 / w342 / w500 / original).
+# Safe to re-run: only rows without a poster_path are touched.
+#
+#   python -m app.backend.scripts.backfill_poster_paths
+
+from datetime import datetime
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
+
+from app.backend.core.database import engine
+from app.backend.core.tmdb_client import poster_path_from_url
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+
+UPDATE_CHUNK_SIZE = 1000
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def backfill_poster_paths(target: Engine) -> dict:
+    summary = {}
+    for media_type, model in (("movie", CachedMovie), ("tv", CachedTvShow)):
+        table = model.__tablename__
+        columns = {column["name"] for column in inspect(target).get_columns(table)}
+
+        with target.begin() as connection:
+            if "poster_path" not in columns:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN poster_path VARCHAR"))
+
+            rows = connection.execute(
+                select(model.id, model.poster_url).where(model.poster_path.is_(None))
+            ).fetchall()
+
+            changes = [
+                {"row_id": row_id, "path": path}
+                for row_id, poster_url in rows
+                if (path := poster_path_from_url(poster_url))
+            ]
+            statement = update(model).where(model.id == bindparam("row_id")).values(poster_path=bindparam("path"))
+            for start in range(0, len(changes), UPDATE_CHUNK_SIZE):
+                connection.execute(statement, changes[start:start + UPDATE_CHUNK_SIZE])
+
+        summary[media_type] = len(changes)
+    return summary
+
+
+if __name__ == "__main__":
+    log("🖼️ Backfilling poster_path on cached movies / TV shows...")
+    summary = backfill_poster_paths(engine)
+    log(f"✅ {summary['movie']} movies and {summary['tv']} TV shows updated.")
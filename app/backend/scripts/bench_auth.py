@@ -0,0 +1,79 @@
+# scripts/bench_auth.py
+#
+# Microbenchmark of the auth overhead per request in get_current_user:
+#   uncached → JWT decode + User query by email (previous behaviour)
+#   cached   → verified-token cache + principal cache (steady state)
+#
+#   python -m app.backend.scripts.bench_auth --iterations 5000
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.backend.core.auth_cache import clear_auth_caches
+from app.backend.core.database import Base
+from app.backend.core.dependencies import get_current_user
+from app.backend.core.security import create_access_token, decode_access_token
+from app.backend.models.user_model import User
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def uncached_get_current_user(token: HTTPAuthorizationCredentials, database) -> User:
+    payload = decode_access_token(token.credentials)
+    return database.query(User).filter(User.email == payload["sub"]).first()
+
+
+def time_per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark get_current_user with and without auth caches.")
+    parser.add_argument("--iterations", type=int, default=5000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        with Session() as db:
+            db.add(User(first_name="Bench", last_name="User", email="bench@example.com", password_hash="x"))
+            db.commit()
+
+        token = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": "bench@example.com"}))
+        clear_auth_caches()
+
+        # Each request gets its own session, as with the get_db dependency
+        def uncached():
+            with Session() as db:
+                uncached_get_current_user(token, db)
+
+        def cached():
+            with Session() as db:
+                get_current_user(token, db)
+
+        uncached_s = time_per_call(uncached, args.iterations)
+        cached_s = time_per_call(cached, args.iterations)
+        engine.dispose()
+
+    log(f"🔐 {args.iterations} calls each")
+    print(f"uncached (decode + query): {uncached_s * 1e6:8.1f} µs/request")
+    print(f"cached (token + principal): {cached_s * 1e6:7.1f} µs/request")
+    print(f"speedup: {uncached_s / cached_s:.1f}x")
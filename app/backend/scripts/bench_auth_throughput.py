@@ -0,0 +1,133 @@
+# scripts/bench_auth_throughput.py
+#
+# Signup / login throughput under concurrency, plus the latency of a cheap "probe"
+# request running alongside (does a bcrypt burst starve the rest of the API?).
+#
+#   python -m app.backend.scripts.bench_auth_throughput --count 64 --threads 16
+#   PASSWORD_HASH_WORKERS=0 python -m app.backend.scripts.bench_auth_throughput   # inline bcrypt, for comparison
+#
+# "legacy signup" replays the old flow: insert (hash) followed by a full credential check (verify).
+
+import argparse
+import asyncio
+import json
+import math
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.backend.core.config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
+from app.backend.core.database import Base
+from app.backend.core.security import start_password_pool, shutdown_password_pool
+from app.backend.schemas.user_schemas import UserCreate, UserLogin
+from app.backend.services.auth_service import (
+    add_user_to_db,
+    check_user_credentials_in_db,
+    handle_login_request,
+    handle_signup_request,
+)
+
+PASSWORD = "bench-password"
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+def new_user() -> UserCreate:
+    return UserCreate(first_name="Bench", last_name="User", email=f"bench-{uuid4().hex[:12]}@example.com", password=PASSWORD)
+
+
+def run_phase(name: str, op, count: int, threads: int) -> dict:
+    """
+    Runs `count` ops on `threads` threads while a probe thread measures how long a trivial request takes.
+    """
+    probe_latencies = []
+    stop = threading.Event()
+
+    def probe():
+        payload = {"results": [{"tmdb_id": i, "title": f"Title {i}"} for i in range(30)]}
+        while not stop.is_set():
+            start = time.perf_counter()
+            json.dumps(payload)
+            probe_latencies.append(time.perf_counter() - start)
+            time.sleep(0.005)
+
+    probe_thread = threading.Thread(target=probe)
+    probe_thread.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: op(), range(count)))
+    wall = time.perf_counter() - started
+
+    stop.set()
+    probe_thread.join()
+    return {
+        "name": name,
+        "ops_per_s": count / wall,
+        "probe_p99_ms": percentile(probe_latencies, 99) * 1000,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark signup/login throughput.")
+    parser.add_argument("--count", type=int, default=64, help="Operations per phase.")
+    parser.add_argument("--threads", type=int, default=16)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        def legacy_signup():
+            user = new_user()
+            with Session() as db:
+                add_user_to_db(user, db)
+                asyncio.run(check_user_credentials_in_db(UserLogin(email=user.email, password=user.password), db))
+
+        def signup():
+            with Session() as db:
+                asyncio.run(handle_signup_request(new_user(), db))
+
+        login_user = new_user()
+        with Session() as db:
+            add_user_to_db(login_user, db)
+
+        def login():
+            with Session() as db:
+                asyncio.run(handle_login_request(UserLogin(email=login_user.email, password=PASSWORD), db))
+
+        start_password_pool()
+        results = [
+            run_phase("legacy signup (hash + verify)", legacy_signup, args.count, args.threads),
+            run_phase("signup (hash only)", signup, args.count, args.threads),
+            run_phase("login", login, args.count, args.threads),
+        ]
+        shutdown_password_pool()
+        engine.dispose()
+
+    log(f"🔑 bcrypt rounds={BCRYPT_ROUNDS}, hashing workers={PASSWORD_HASH_WORKERS or 'inline'}, "
+        f"{args.count} ops per phase on {args.threads} threads")
+    print(f"{'phase':<32} {'ops/s':>8} {'probe p99 ms':>14}")
+    for r in results:
+        print(f"{r['name']:<32} {r['ops_per_s']:>8.1f} {r['probe_p99_ms']:>14.2f}")
@@ -0,0 +1,91 @@
+# scripts/bench_card_json.py
+#
+# Cost of turning cached rows into a card list response body:
+#   validated → build MovieCards, re-validate them as `response_model=list[MovieCard]`,
+#               jsonable_encoder + json.dumps (what FastAPI did for every list endpoint)
+#   spliced   → join the cached per-card JSON bytes (card_list_response), warm cache
+#
+#   python -m app.backend.scripts.bench_card_json --sizes 30 1000 --rounds 200
+
+import argparse
+import json
+import time
+from datetime import date, datetime
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.schemas.movie_schemas import MovieCard
+from app.backend.services.card_cache import card_list_response, clear_card_cache
+from app.backend.services.movie_service import to_movie_card, to_movie_cards
+
+RESPONSE_ADAPTER = TypeAdapter(list[MovieCard])
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def make_rows(count: int) -> list[CachedMovie]:
+    return [
+        CachedMovie(
+            tmdb_id=tmdb_id,
+            imdb_id=f"tt{tmdb_id:07d}",
+            imdb_rating=7.5,
+            imdb_votes_count=120000 + tmdb_id,
+            release_year=1990 + tmdb_id % 35,
+            poster_url=f"https://image.tmdb.org/t/p/original/poster{tmdb_id}.jpg",
+            title_en=f"Movie number {tmdb_id}",
+            title_fr=f"Film numéro {tmdb_id}",
+            genre_ids=[18, 35],
+            genre_names_en=["drama", "comedy"],
+            genre_names_fr=["drame", "comédie"],
+            trailer_url_en=f"https://www.youtube.com/watch?v=en{tmdb_id}",
+            trailer_url_fr=f"https://www.youtube.com/watch?v=fr{tmdb_id}",
+            overview_en="A quiet family drama about a summer that changes everything. " * 3,
+            overview_fr="Un drame familial sur un été qui change tout. " * 3,
+            cache_update_date=date.today(),
+        )
+        for tmdb_id in range(1, count + 1)
+    ]
+
+
+def validated_body(rows: list[CachedMovie], language: str) -> bytes:
+    cards = [to_movie_card(row, language) for row in rows]
+    validated = RESPONSE_ADAPTER.validate_python(cards, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def spliced_body(rows: list[CachedMovie], language: str) -> bytes:
+    return card_list_response(to_movie_cards(rows, language)).body
+
+
+def time_body(render, rows: list[CachedMovie], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        render(rows, "fr")
+    return (time.perf_counter() - start) / rounds
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark card list serialization: validated vs spliced JSON.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 1000])
+    parser.add_argument("--rounds", type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    log(f"🃏 {args.rounds} responses per size (FR cards, warm card cache)")
+    print(f"{'cards':>6} {'validated ms':>13} {'spliced ms':>11} {'speedup':>8}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        assert json.loads(validated_body(rows, "fr")) == json.loads(spliced_body(rows, "fr"))
+
+        clear_card_cache()
+        spliced_body(rows, "fr")
+        validated_s = time_body(validated_body, rows, args.rounds)
+        spliced_s = time_body(spliced_body, rows, args.rounds)
+        print(f"{size:>6} {validated_s * 1000:>13.3f} {spliced_s * 1000:>11.3f} {validated_s / spliced_s:>7.1f}x")
@@ -0,0 +1,102 @@
+# scripts/bench_chat_history.py
+#
+# Per-turn storage cost as a chat session grows:
+#   blob     → legacy JSON `conversation` column: load the whole list, append, rewrite it
+#   messages → `chat_messages`: append user + assistant rows, read the last 4
+#
+#   python -m app.backend.scripts.bench_chat_history --sizes 10 100 1000 5000 --turns 50
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.backend.core.database import Base
+from app.backend.models.user_model import User
+from app.backend.models.chat_session_model import ChatSession
+from app.backend.models.chat_message_model import ChatMessage
+from app.backend.services.session_service import append_chat_message, get_recent_chat_messages
+
+LegacyBase = declarative_base()
+MESSAGE = "Can you show me smart French comedies from the 90s, ideally something light? " * 2
+
+
+class LegacyChatSession(LegacyBase):
+    __tablename__ = "legacy_chat_sessions"
+    id = Column(String, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    conversation = Column(MutableList.as_mutable(JSON), nullable=False, default=list)
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def seed(Session, session_id: str, size: int):
+    history = [{"role": "user" if i % 2 == 0 else "assistant", "content": MESSAGE} for i in range(size)]
+    with Session() as db:
+        db.add(LegacyChatSession(id=session_id, user_id=1, conversation=history))
+        db.add(ChatSession(id=session_id, user_id=1))
+        db.flush()
+        db.bulk_insert_mappings(ChatMessage, [
+            {"session_id": session_id, "seq": seq, "role": m["role"], "content": m["content"]}
+            for seq, m in enumerate(history, start=1)
+        ])
+        db.commit()
+
+
+def blob_turn(Session, session_id: str):
+    with Session() as db:
+        chat_session = db.get(LegacyChatSession, session_id)
+        chat_session.conversation.append({"role": "user", "content": MESSAGE})
+        _ = chat_session.conversation[-4:]
+        chat_session.conversation.append({"role": "assistant", "content": MESSAGE})
+        db.commit()
+
+
+def messages_turn(Session, session_id: str):
+    with Session() as db:
+        append_chat_message(session_id, "user", MESSAGE, db)
+        get_recent_chat_messages(session_id, db, limit=4)
+        append_chat_message(session_id, "assistant", MESSAGE, db)
+
+
+def time_turns(turn, Session, session_id: str, turns: int) -> float:
+    start = time.perf_counter()
+    for _ in range(turns):
+        turn(Session, session_id)
+    return (time.perf_counter() - start) / turns
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark per-turn chat history cost vs session length.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--turns", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine, tables=[User.__table__, ChatSession.__table__, ChatMessage.__table__])
+        LegacyBase.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        log(f"💬 {args.turns} turns per size (user + assistant message per turn)")
+        print(f"{'messages in session':>20} {'blob ms/turn':>14} {'rows ms/turn':>14}")
+        for size in args.sizes:
+            session_id = f"bench-{size}"
+            seed(Session, session_id, size)
+            blob_s = time_turns(blob_turn, Session, session_id, args.turns)
+            rows_s = time_turns(messages_turn, Session, session_id, args.turns)
+            print(f"{size:>20} {blob_s * 1000:>14.2f} {rows_s * 1000:>14.2f}")
+
+        engine.dispose()
@@ -0,0 +1,112 @@
+# scripts/bench_description_search.py
+#
+# Latency of description queries ("slow burn, mind-bending sci-fi"):
+#   local → FTS5 BM25 over the cached catalog (every-term, then any-term candidates)
+#   llm   → get_titles_from_description_with_llm + TMDB resolution of every suggested title
+#
+#   python -m app.backend.scripts.bench_description_search --catalog-size 20000 --rounds 50
+#
+# --llm also times the LLM path: point OPENAI_BASE_URL / TMDB_BASE_URL at upstream_stub_server
+# (or at the real services, which costs API quota).
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.backend.core.database import Base
+from app.backend.scripts import init_db  # noqa: F401  (registers every model and the FTS tables)
+from app.backend.models.movie_model import CachedMovie
+from app.backend.services.catalog_search_service import search_by_description
+
+QUERIES = [
+    "slow burn, mind-bending sci-fi",
+    "heist thriller with a twist ending",
+    "feel-good french comedy in paris",
+    "survival drama in the mountains",
+    "space exploration and time travel",
+    "serial killer detective investigation",
+]
+
+WORDS = (
+    "space time travel heist twist detective killer investigation survival mountains paris comedy family love "
+    "war soldier ship crew planet robot future past murder mystery school friends road trip music band dream "
+    "memory city night island storm ghost house revenge journey secret agent spy prison escape"
+).split()
+GENRES = ["Action", "Comedy", "Drama", "Science Fiction", "Thriller", "Horror", "Romance", "Mystery"]
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def seed(Session, size: int):
+    with Session() as db:
+        db.add_all([
+            CachedMovie(
+                tmdb_id=tmdb_id, imdb_id=f"tt{tmdb_id:08d}", imdb_rating=7.0, imdb_votes_count=1000,
+                release_year=1950 + tmdb_id % 75, poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+                genre_ids=[18], genre_names_en=random.sample(GENRES, 2),
+                title_en=" ".join(random.sample(WORDS, 2)).title(), overview_en=" ".join(random.choices(WORDS, k=40)),
+            )
+            for tmdb_id in range(1, size + 1)
+        ])
+        db.commit()
+
+
+def percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    return f"p50 {statistics.median(samples) * 1000:8.2f} ms   p95 {samples[int(len(samples) * 0.95) - 1] * 1000:8.2f} ms"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark description search: local FTS5 vs LLM + TMDB.")
+    parser.add_argument("--catalog-size", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--llm", action="store_true", help="Also time the LLM + TMDB path")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    random.seed(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        seed(Session, args.catalog_size)
+        log(f"🔎 {args.catalog_size} cached movies, {len(QUERIES)} queries x {args.rounds} rounds")
+
+        local = []
+        with Session() as db:
+            for _ in range(args.rounds):
+                for query in QUERIES:
+                    start = time.perf_counter()
+                    if len(search_by_description("movie", query, db, match_all=True)) < 10:
+                        search_by_description("movie", query, db)
+                    local.append(time.perf_counter() - start)
+        print(f"{'local FTS5':>12}  {percentiles(local)}")
+
+        if args.llm:
+            from app.backend.core.executor import run_in_io_pool
+            from app.backend.core.tmdb_client import call_tmdb_media_id_by_media_name_endpoint
+            from app.backend.services.llm_service import get_titles_from_description_with_llm
+
+            def resolve(item: dict):
+                return call_tmdb_media_id_by_media_name_endpoint("movie", item["title"], item.get("year"))
+
+            remote = []
+            for query in QUERIES:
+                start = time.perf_counter()
+                run_in_io_pool(resolve, get_titles_from_description_with_llm("movie", query))
+                remote.append(time.perf_counter() - start)
+            print(f"{'llm + tmdb':>12}  {percentiles(remote)}")
+
+        engine.dispose()
@@ -0,0 +1,135 @@
+# scripts/bench_library.py
+#
+# Library read cost as a user's library grows:
+#   legacy     → get_user_media_by_status for every (media_type, status) list, whole lists
+#   first page → GET /users/me/library first page (limit 50, all media types + statuses)
+#   deep page  → same, from a cursor halfway through the library
+#
+#   python -m app.backend.scripts.bench_library --sizes 1000 10000 50000 --rounds 20
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.backend.core.database import Base
+from app.backend.scripts import init_db  # noqa: F401  (registers every model on Base.metadata)
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_media_model import UserMedia
+from app.backend.services.card_cache import card_list_response
+from app.backend.services.user_media_service import (
+    LIBRARY_STATUSES,
+    MEDIA_TYPES,
+    get_user_library_page,
+    get_user_media_by_status,
+    render_library_page,
+)
+
+PAGE_SIZE = 50
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def catalog_rows(model, count: int) -> list[dict]:
+    return [
+        dict(
+            tmdb_id=tmdb_id, imdb_id=f"tt{tmdb_id:08d}", imdb_rating=7.0, imdb_votes_count=1000,
+            release_year=2000, poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+            genre_ids=[18], title_en=f"Title {tmdb_id}", overview_en="An overview. " * 20,
+        )
+        for tmdb_id in range(1, count + 1)
+    ]
+
+
+def seed(Session, user_id: int, size: int):
+    """
+    `size` library entries for `user_id` (plus as many for a neighbour user), spread over both media types.
+    """
+    start = datetime(2024, 1, 1)
+    with Session() as db:
+        for neighbour in (user_id, user_id + 1):
+            db.bulk_insert_mappings(UserMedia, [
+                {
+                    "user_id": neighbour,
+                    "tmdb_id": i // 2 + 1,
+                    "media_type": MEDIA_TYPES[i % 2],
+                    "status": random.choice(LIBRARY_STATUSES),
+                    "updated_at": start + timedelta(minutes=i),
+                }
+                for i in range(size)
+            ])
+        db.commit()
+
+
+def legacy_read(Session, user_id: int):
+    with Session() as db:
+        for media_type in MEDIA_TYPES:
+            for status in LIBRARY_STATUSES:
+                card_list_response(get_user_media_by_status(media_type, user_id, db, "en", status), "w342")
+
+
+def page_read(Session, user_id: int, cursor):
+    with Session() as db:
+        entries, next_cursor = get_user_library_page(user_id, db, cursor=cursor, limit=PAGE_SIZE)
+        render_library_page(entries, next_cursor, "en", "w342")
+
+
+def cursor_at(Session, user_id: int, depth: int):
+    cursor = None
+    with Session() as db:
+        for _ in range(depth // PAGE_SIZE):
+            _, cursor = get_user_library_page(user_id, db, cursor=cursor, limit=PAGE_SIZE)
+    return cursor
+
+
+def time_it(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark library reads: full status lists vs keyset pages.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--rounds", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    random.seed(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        largest = max(args.sizes)
+        with Session() as db:
+            db.bulk_insert_mappings(CachedMovie, catalog_rows(CachedMovie, largest // 2 + 1))
+            db.bulk_insert_mappings(CachedTvShow, catalog_rows(CachedTvShow, largest // 2 + 1))
+            db.commit()
+
+        log(f"📚 {args.rounds} reads per size, pages of {PAGE_SIZE}, warm card cache")
+        print(f"{'entries':>8} {'legacy 6 lists ms':>18} {'first page ms':>14} {'deep page ms':>13}")
+        for n, size in enumerate(args.sizes):
+            user_id = 10 * (n + 1)
+            seed(Session, user_id, size)
+            deep_cursor = cursor_at(Session, user_id, size // 2)
+
+            legacy_read(Session, user_id)
+            legacy_s = time_it(lambda: legacy_read(Session, user_id), max(1, args.rounds // 5))
+            first_s = time_it(lambda: page_read(Session, user_id, None), args.rounds)
+            deep_s = time_it(lambda: page_read(Session, user_id, deep_cursor), args.rounds)
+            print(f"{size:>8} {legacy_s * 1000:>18.1f} {first_s * 1000:>14.2f} {deep_s * 1000:>13.2f}")
+
+        engine.dispose()
@@ -0,0 +1,120 @@
+# scripts/bench_library_import.py
+#
+# Throughput of a library import (IMDb ratings export), on a catalog that holds most of the titles:
+#   per row → one catalog lookup + update_user_media_status (SELECT + write + commit) per row (skips uncached titles)
+#   import  → import_library_export: streamed CSV, bulk resolve + upsert per chunk, one commit per chunk;
+#             uncached titles are resolved on TMDB /find, then enriched and cached before they are imported
+#
+#   python -m app.backend.scripts.bench_library_import --rows 10000 --chunk-sizes 100 500 2000
+#
+# --unknown-share (default 10%) is the fraction of uncached titles: start upstream_stub_server and set
+# TMDB_BASE_URL / OMDB_BASE_URL first, or pass --unknown-share 0.
+# "no card" counts imported titles still missing from the catalog (invisible in the library): should be 0.
+
+import argparse
+import csv
+import io
+import random
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.backend.core.database import Base, SessionLocal
+from app.backend.scripts import init_db  # noqa: F401  (registers every model on Base.metadata)
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.user_media_model import UserMedia
+from app.backend.services.library_import_service import import_library_export
+from app.backend.services.user_media_service import update_user_media_status
+
+
+# Seeded catalog IDs start above the stub's synthetic TMDB IDs, so titles cached during a run can be told apart
+SEEDED_ID_OFFSET = 1_000_000
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def build_export(rows: int, catalog_size: int, unknown_share: float) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["Const", "Your Rating", "Date Rated", "Title", "Title Type", "Year"])
+    for i in range(rows):
+        tmdb_id = SEEDED_ID_OFFSET + (catalog_size + i + 1 if random.random() < unknown_share else i % catalog_size + 1)
+        writer.writerow([f"tt{tmdb_id:08d}", random.randint(1, 10), "2024-01-01", f"Title {tmdb_id}", "movie", 2000])
+    return out.getvalue()
+
+
+def per_row_import(db, user_id: int, export: str):
+    for row in csv.DictReader(io.StringIO(export)):
+        tmdb_id = db.query(CachedMovie.tmdb_id).filter(CachedMovie.imdb_id == row["Const"]).scalar()
+        if tmdb_id:
+            update_user_media_status("movie", tmdb_id, user_id, db, "seen")
+
+
+def count_without_card(db, user_id: int) -> int:
+    return db.execute(
+        select(func.count()).select_from(UserMedia)
+        .outerjoin(CachedMovie, CachedMovie.tmdb_id == UserMedia.tmdb_id)
+        .where(UserMedia.user_id == user_id, CachedMovie.tmdb_id.is_(None))
+    ).scalar_one()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark CSV library imports: per-row updates vs chunked upserts.")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--unknown-share", type=float, default=0.1)
+    parser.add_argument("--skip-per-row", action="store_true", help="Skip the slow per-row baseline")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    random.seed(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        # Enrichment workers cache titles through SessionLocal
+        SessionLocal.configure(bind=engine)
+
+        with Session() as db:
+            db.bulk_insert_mappings(CachedMovie, [
+                dict(
+                    tmdb_id=tmdb_id, imdb_id=f"tt{tmdb_id:08d}", imdb_rating=7.0, imdb_votes_count=1000,
+                    release_year=2000, poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+                    genre_ids=[18], title_en=f"Title {tmdb_id}", cache_update_date=date.today(),
+                )
+                for tmdb_id in range(SEEDED_ID_OFFSET + 1, SEEDED_ID_OFFSET + args.rows + 1)
+            ])
+            db.commit()
+
+        export = build_export(args.rows, args.rows, args.unknown_share)
+        log(f"📥 {args.rows} rows, {len(export) // 1024} KB, {args.unknown_share:.0%} resolved on TMDB")
+        print(f"{'method':>16} {'seconds':>9} {'rows/s':>10} {'no card':>8}")
+
+        if not args.skip_per_row:
+            with Session() as db:
+                start = time.perf_counter()
+                per_row_import(db, 1, export)
+                seconds = time.perf_counter() - start
+                without_card = count_without_card(db, 1)
+            print(f"{'per row':>16} {seconds:>9.2f} {args.rows / seconds:>10.0f} {without_card:>8}")
+
+        for chunk_size in args.chunk_sizes:
+            with Session() as db:
+                # Every run starts from the seeded catalog: titles cached by the previous run go back to TMDB
+                db.execute(delete(UserMedia))
+                db.execute(delete(CachedMovie).where(CachedMovie.tmdb_id <= SEEDED_ID_OFFSET))
+                db.commit()
+                report = import_library_export(1, io.StringIO(export), "seen", db, chunk_size=chunk_size)
+                without_card = count_without_card(db, 1)
+            print(f"{f'import x{chunk_size}':>16} {report['seconds']:>9.2f} {report['rows_per_second']:>10.0f} {without_card:>8}")
+
+        engine.dispose()
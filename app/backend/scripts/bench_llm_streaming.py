@@ -0,0 +1,80 @@
+# scripts/bench_llm_streaming.py
+#
+# End-to-end latency of an LLM title list (here: description suggestions) turned into cached movies:
+#   two passes → whole answer, then resolve every title on TMDB, then enrich every resolved movie
+#   buffered   → whole answer, then one task per title (resolve + enrich)
+#   streamed   → streamed answer, each title's task dispatched as soon as its JSON object is parsed
+#
+# Needs upstream_stub_server, with a generation pace so streaming has something to overlap:
+#   python -m app.backend.scripts.upstream_stub_server --latency-ms 80 --token-ms 15 --llm-titles 40 --port 9000
+#   TMDB_BASE_URL=http://localhost:9000/tmdb OMDB_BASE_URL=http://localhost:9000/omdb/ \
+#   OPENAI_BASE_URL=http://localhost:9000/openai/v1 python -m app.backend.scripts.bench_llm_streaming --rounds 5
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app.backend.core.database import Base, SessionLocal
+from app.backend.core.executor import run_in_io_pool
+from app.backend.core.tmdb_client import call_tmdb_media_id_by_media_name_endpoint
+from app.backend.scripts import init_db  # noqa: F401  (registers every model on Base.metadata)
+from app.backend.services import llm_service
+from app.backend.services.llm_service import get_titles_from_description_with_llm
+from app.backend.services.movie_service import enrich_and_cache_one_movie, resolve_and_cache_movies
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def two_passes(query: str) -> list[int]:
+    llm_service.OPENAI_STREAMING = False
+    titles = list(get_titles_from_description_with_llm("movie", query))
+    resolved = run_in_io_pool(
+        lambda item: call_tmdb_media_id_by_media_name_endpoint("movie", item["title"], item.get("year")), titles
+    )
+    tmdb_ids = [tmdb_id for tmdb_id in resolved if tmdb_id is not None]
+    run_in_io_pool(enrich_and_cache_one_movie, tmdb_ids)
+    return tmdb_ids
+
+
+def buffered(query: str) -> list[int]:
+    llm_service.OPENAI_STREAMING = False
+    return resolve_and_cache_movies(get_titles_from_description_with_llm("movie", query))
+
+
+def streamed(query: str) -> list[int]:
+    llm_service.OPENAI_STREAMING = True
+    return resolve_and_cache_movies(get_titles_from_description_with_llm("movie", query))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark buffered vs streamed LLM title resolution.")
+    parser.add_argument("--rounds", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+
+        log(f"🎬 {args.rounds} rounds per method, fresh titles every query (nothing cached)")
+        print(f"{'method':>12} {'titles':>7} {'p50 ms':>8} {'max ms':>8}")
+        for name, method in (("two passes", two_passes), ("buffered", buffered), ("streamed", streamed)):
+            timings, titles = [], 0
+            for round_ in range(args.rounds):
+                start = time.perf_counter()
+                titles += len(method(f"slow burn sci-fi about memory, {name} round {round_}"))
+                timings.append(time.perf_counter() - start)
+            print(f"{name:>12} {titles / args.rounds:>7.1f} {statistics.median(timings) * 1000:>8.0f} {max(timings) * 1000:>8.0f}")
+
+        engine.dispose()
@@ -0,0 +1,137 @@
+# scripts/bench_logging.py
+#
+# Compares the logging cost paid *inside request threads* by:
+#   legacy   → the old prints ([DEBUG] lines per TMDB page, get_language) + synchronous file/stdout handlers
+#   queue    → QueueHandler pipeline, DEBUG gated off (production default)
+#   sampled  → QueueHandler pipeline, DEBUG on with LOG_DEBUG_SAMPLE_RATE-style sampling
+#
+#   python -m app.backend.scripts.bench_logging --requests 20000 --threads 16
+
+import argparse
+import contextlib
+import logging
+import math
+import queue
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+from app.backend.core.logging_config import DebugSampler, StructuredFormatter
+
+# One recommend_*_by_filters request walks ~3 discover pages before it has 50 IDs
+PAGES_PER_REQUEST = 3
+PARAMS = {
+    "with_genres": 18, "vote_average.gte": 6, "vote_count.gte": 1000,
+    "sort_by": "popularity.desc", "primary_release_date.gte": "1990-01-01",
+}
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+def legacy_request(logger: logging.Logger):
+    for page in range(1, PAGES_PER_REQUEST + 1):
+        print("[DEBUG] Calling TMDB Discover Endpoint: https://api.themoviedb.org/3/discover/movie")
+        print(f"[DEBUG] Final TMDB Discover request params: {PARAMS | {'page': page}}")
+        print("[DEBUG] TMDB responded with status code: 200")
+        print(f"[DEBUG] TMDB returned 20 results on page {page}")
+    print("⚠️ Header missing entirely")
+    logger.info("Recommended %s movies", 30)
+
+
+def pipeline_request(logger: logging.Logger):
+    for page in range(1, PAGES_PER_REQUEST + 1):
+        logger.debug(
+            "TMDB discover page fetched",
+            extra={"media_type": "movie", "page": page, "results": 20, "genre_id": 18},
+        )
+    logger.debug("Accept-Language header missing, defaulting to en")
+    logger.info("Recommended %s movies", 30)
+
+
+def sink_handlers(directory: Path, name: str) -> list[logging.Handler]:
+    stream = open(directory / f"{name}.stdout", "w", encoding="utf-8")
+    handlers = [logging.StreamHandler(stream), logging.FileHandler(directory / f"{name}.log", encoding="utf-8")]
+    for handler in handlers:
+        handler.setFormatter(StructuredFormatter())
+    return handlers
+
+
+def run(request_fn, logger: logging.Logger, requests: int, threads: int) -> list[float]:
+    def one(_):
+        start = time.perf_counter()
+        request_fn(logger)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(one, range(requests)))
+
+
+def bench(name: str, request_fn, logger: logging.Logger, args, listener=None) -> dict:
+    started = time.perf_counter()
+    latencies = run(request_fn, logger, args.requests, args.threads)
+    wall = time.perf_counter() - started
+    if listener:
+        listener.stop()   # drain outside the measured request path
+    return {
+        "name": name,
+        "mean_us": sum(latencies) / len(latencies) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+        "rps": args.requests / wall,
+    }
+
+
+def build_logger(name: str, level: int) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark legacy prints vs the queue logging pipeline.")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+
+        # legacy: prints go to (redirected) stdout, INFO is written synchronously
+        legacy = build_logger("legacy", logging.INFO)
+        for handler in sink_handlers(directory, "legacy"):
+            legacy.addHandler(handler)
+        with open(directory / "legacy.prints", "w", encoding="utf-8") as prints, contextlib.redirect_stdout(prints):
+            results.append(bench("legacy (print + sync)", legacy_request, legacy, args))
+
+        for name, level, rate in (("queue", logging.INFO, 1.0), ("sampled", logging.DEBUG, args.sample_rate)):
+            logger = build_logger(name, level)
+            log_queue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.addFilter(DebugSampler(rate))
+            logger.addHandler(queue_handler)
+            listener = QueueListener(log_queue, *sink_handlers(directory, name))
+            listener.start()
+            label = "queue (DEBUG off)" if name == "queue" else f"queue (DEBUG sampled {rate:.0%})"
+            results.append(bench(label, pipeline_request, logger, args, listener))
+
+    log(f"📊 {args.requests} requests on {args.threads} threads, {PAGES_PER_REQUEST} TMDB pages each")
+    print(f"{'variant':<28} {'mean µs/req':>12} {'p99 µs/req':>12} {'req/s':>10}")
+    for r in results:
+        print(f"{r['name']:<28} {r['mean_us']:>12.1f} {r['p99_us']:>12.1f} {r['rps']:>10.0f}")
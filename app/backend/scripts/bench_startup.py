@@ -0,0 +1,95 @@
+# scripts/bench_startup.py
+#
+# Cold start of an API worker, each sample in a fresh interpreter:
+#   import   → `import app.backend.main` (everything a worker / test run pays up front)
+#   startup  → lifespan hook (executors, password pool, chat store)
+#   first    → first GET /health, then first authenticated GET /users/me
+#   openai   → building the OpenAI client on demand (what the first LLM call adds, without warm-up)
+#
+#   python -m app.backend.scripts.bench_startup --runs 5
+#   python -m app.backend.scripts.bench_startup --runs 5 --budget-ms 1500   # exit 1 when import+startup+first exceed it
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+STAGES = ["import", "startup", "first_health", "first_auth", "openai"]
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def measure_once() -> dict:
+    timings = {}
+
+    start = time.perf_counter()
+    from app.backend.main import app
+    timings["import"] = time.perf_counter() - start
+
+    from fastapi.testclient import TestClient
+    from app.backend.core.security import create_access_token
+
+    start = time.perf_counter()
+    with TestClient(app) as client:
+        timings["startup"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        client.get("/health")
+        timings["first_health"] = time.perf_counter() - start
+
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench-startup@example.com'})}"}
+        start = time.perf_counter()
+        client.get("/users/me", headers=headers)
+        timings["first_auth"] = time.perf_counter() - start
+
+    from app.backend.core.openai_client import get_openai_client
+    start = time.perf_counter()
+    get_openai_client()
+    timings["openai"] = time.perf_counter() - start
+
+    return {stage: seconds * 1000 for stage, seconds in timings.items()}
+
+
+def run_child() -> dict:
+    env = dict(os.environ, OPENAI_CLIENT_WARMUP="0")
+    output = subprocess.run(
+        [sys.executable, "-m", "app.backend.scripts.bench_startup", "--child"],
+        capture_output=True, text=True, check=True, env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark API worker import time and first-request latency.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.child:
+        print(json.dumps(measure_once()))
+        sys.exit(0)
+
+    log(f"🚀 {args.runs} cold starts (fresh interpreter each, OpenAI warm-up off)")
+    samples = [run_child() for _ in range(args.runs)]
+
+    print(f"{'stage':>14} {'median ms':>10} {'max ms':>9}")
+    for stage in STAGES:
+        values = [sample[stage] for sample in samples]
+        print(f"{stage:>14} {statistics.median(values):>10.1f} {max(values):>9.1f}")
+
+    ready_ms = statistics.median(sample["import"] + sample["startup"] + sample["first_health"] for sample in samples)
+    log(f"⏱️ import + startup + first request: {ready_ms:.1f} ms")
+    if args.budget_ms is not None and ready_ms > args.budget_ms:
+        log(f"❌ Over the {args.budget_ms:.0f} ms startup budget")
+        sys.exit(1)
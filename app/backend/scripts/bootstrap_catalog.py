@@ -0,0 +1,65 @@
+# scripts/bootstrap_catalog.py
+
+import argparse
+import gzip
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import requests
+
+from app.backend.core.database import get_db
+from app.backend.core.executor import shutdown_io_executor
+from app.backend.services.catalog_bootstrap_service import (
+    export_file_url,
+    open_export_file,
+    ingest_tmdb_export,
+    enrich_candidates,
+)
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Seed the catalog from TMDB daily ID export files.")
+    parser.add_argument("--media", nargs="+", choices=["movie", "tv"], default=["movie", "tv"])
+    parser.add_argument("--file", type=Path, default=None,
+                        help="Local export file (only with a single --media). Downloads the daily export when omitted.")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today() - timedelta(days=1),
+                        help="Export date (YYYY-MM-DD). Defaults to yesterday, the latest complete export.")
+    parser.add_argument("--min-popularity", type=float, default=1.0,
+                        help="Skip long-tail titles below this TMDB popularity.")
+    parser.add_argument("--enrich", type=int, default=0,
+                        help="After seeding, enrich the N most popular candidates.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.file and len(args.media) != 1:
+        raise SystemExit("--file needs exactly one --media")
+
+    db = next(get_db())
+    try:
+        for media_type in args.media:
+            if args.file:
+                log(f"📂 Ingesting {media_type} IDs from {args.file}...")
+                with open_export_file(args.file) as stream:
+                    total = ingest_tmdb_export(stream, media_type, db, args.date, args.min_popularity)
+            else:
+                url = export_file_url(media_type, args.date)
+                log(f"🌍 Streaming {media_type} IDs from {url}...")
+                with requests.get(url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    with gzip.GzipFile(fileobj=response.raw) as stream:
+                        total = ingest_tmdb_export(stream, media_type, db, args.date, args.min_popularity)
+            log(f"✅ {total} {media_type} candidates seeded.")
+
+            if args.enrich:
+                enriched = enrich_candidates(media_type, db, args.enrich)
+                log(f"🎬 Enriched the {enriched} most popular {media_type} candidates.")
+    finally:
+        db.close()
+        shutdown_io_executor()
+
+    log("🏁 DONE.")
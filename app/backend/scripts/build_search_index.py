@@ -0,0 +1,34 @@
+# scripts/build_search_index.py
+#
+# Creates the FTS5 full-text tables (movies_fts / tvshows_fts) on an existing database and fills them
+# from the cached catalog. After that, cached rows are kept in sync on insert / refresh / delete.
+# Safe to re-run (the tables are refilled from scratch).
+#
+#   python -m app.backend.scripts.build_search_index
+
+from datetime import datetime
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.backend.core.database import engine
+from app.backend.services.catalog_search_service import rebuild_fts_index
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def build_search_index(target: Engine) -> dict:
+    summary = {}
+    with Session(bind=target) as database:
+        for media_type in ("movie", "tv"):
+            summary[media_type] = rebuild_fts_index(database, media_type)
+        database.commit()
+    return summary
+
+
+if __name__ == "__main__":
+    log("🔎 Building full-text search index...")
+    summary = build_search_index(engine)
+    log(f"✅ {summary['movie']} movies and {summary['tv']} TV shows indexed. Restart the API to pick up new tables.")
@@ -0,0 +1,56 @@
+# scripts/build_similarity_index.py
+#
+# Rebuilds the local "similar to X" index from the cached catalog:
+#   - similar_titles → the SIMILARITY_NEIGHBOURS nearest titles of every cached movie / TV show
+#                      (overview TF-IDF EN+FR, genres, release year)
+#   - title_keys     → folded EN / FR titles, to recognize the reference title in a chat message
+# Run after catalog syncs / bulk caching; titles cached since the last build fall back to the LLM.
+#
+#   python -m app.backend.scripts.build_similarity_index
+#   python -m app.backend.scripts.build_similarity_index --media-type movie --neighbours 40
+
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.backend.core.config import SIMILARITY_NEIGHBOURS
+from app.backend.core.database import engine
+from app.backend.models.similar_title_model import SimilarTitle
+from app.backend.models.title_key_model import TitleKey
+from app.backend.services.similarity_service import build_similarity_index
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def build_index(target: Engine, media_types: list[str], neighbours: int) -> dict:
+    SimilarTitle.__table__.create(target, checkfirst=True)
+    TitleKey.__table__.create(target, checkfirst=True)
+
+    summary = {}
+    with Session(bind=target) as database:
+        for media_type in media_types:
+            start = time.perf_counter()
+            summary[media_type] = build_similarity_index(database, media_type, neighbours)
+            database.commit()
+            summary[media_type]["seconds"] = round(time.perf_counter() - start, 2)
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the local similarity index from the cached catalog.")
+    parser.add_argument("--media-type", choices=["movie", "tv"], default=None, help="Only rebuild this media type")
+    parser.add_argument("--neighbours", type=int, default=SIMILARITY_NEIGHBOURS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    media_types = [args.media_type] if args.media_type else ["movie", "tv"]
+    log(f"🧭 Building similarity index for {', '.join(media_types)} ({args.neighbours} neighbours)...")
+    for media_type, summary in build_index(engine, media_types, args.neighbours).items():
+        log(f"✅ {media_type}: {summary}")
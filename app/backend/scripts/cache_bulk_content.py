@@ -1,16 +1,26 @@
 # scripts/cache_bulk_content.py
 
+import argparse
+import json
+import os
 import time
 from datetime import datetime
 from itertools import product
+from pathlib import Path
+from typing import Optional
 import traceback
 import requests
 
 from app.backend.core.database import get_db
+from app.backend.core.executor import IOExecutor
+from app.backend.core.tmdb_client import call_tmdb_discover_media_endpoint
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
 from app.backend.schemas.movie_schemas import MovieSearchFilters
 from app.backend.schemas.tvshow_schemas import TvShowSearchFilters
-from app.backend.services.movie_service import recommend_movies_by_filters
-from app.backend.services.tvshow_service import recommend_tvshows_by_filters
+from app.backend.services.movie_service import recommend_movies_by_filters, enrich_and_cache_one_movie
+from app.backend.services.tvshow_service import recommend_tvshows_by_filters, enrich_and_cache_one_tvshow
+from app.backend.utils.utils import map_genre_to_id
 from sqlalchemy.orm import Session
 
 # 🎯 FULL LIST of genres from schema
@@ -37,6 +47,17 @@ MIN_RATING = 6.0
 MIN_VOTES = 5000
 SLEEP_BETWEEN_CALLS = 0.25  # be gentle with TMDB/OMDB
 
+# Crawler mode
+ROOT_DIR = Path(__file__).resolve().parents[3]
+CHECKPOINT_PATH = ROOT_DIR / "storage" / "crawl_checkpoint.json"
+CRAWL_MAX_PAGES = 5          # TMDB discover pages per (genre, year, language)
+CRAWL_WORKERS = 8            # bounded parallelism for discover + enrichment
+CRAWL_CHUNK_SIZE = 100       # checkpoint after every chunk
+TMDB_PAGE_SIZE = 20
+
+# Upstream calls needed to enrich one new title (details EN/FR, videos EN/FR, OMDB)
+ENRICH_CALLS_PER_TITLE = {"movie": 5, "tv": 7}  # tv details also hit /external_ids
+
 # TMDB and OMDB test endpoints
 TMDB_PING = "https://api.themoviedb.org/3/configuration"
 OMDB_PING = "http://www.omdbapi.com/?i=tt0133093"
@@ -119,12 +140,205 @@ def cache_tvshows(database: Session):
     log(f"✅ Done caching TV SHOWS. Total added or refreshed: {total}")
 
 
+
+# ─────────────────────────────────────────────
+# CRAWLER MODE
+# Enumerates discover pages per (genre, year, language), dedupes TMDB IDs
+# globally and enriches each new title once. Progress is checkpointed so an
+# interrupted run resumes where it stopped.
+
+CRAWL_TARGETS = {
+    "movie": {
+        "genres": MOVIE_GENRES,
+        "filters": MovieSearchFilters,
+        "model": CachedMovie,
+        "enrich": enrich_and_cache_one_movie,
+    },
+    "tv": {
+        "genres": TVSHOW_GENRES,
+        "filters": TvShowSearchFilters,
+        "model": CachedTvShow,
+        "enrich": enrich_and_cache_one_tvshow,
+    },
+}
+
+
+def load_checkpoint(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: Path, checkpoint: dict):
+    # Write to a temp file then rename, so a crash never leaves a half-written checkpoint
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def combo_key(genre: str, year: int, lang: str) -> str:
+    return f"{genre}|{year}|{lang}"
+
+
+def estimate_upstream_calls(media_type: str, pending_combos: int, max_pages: int) -> dict:
+    """
+    Upper bound on upstream calls before starting: every pending combination
+    walks all its pages, and every result is a new title to enrich.
+    """
+    discover_calls = pending_combos * max_pages
+    max_new_titles = discover_calls * TMDB_PAGE_SIZE
+    return {
+        "discover_calls": discover_calls,
+        "max_enrich_calls": max_new_titles * ENRICH_CALLS_PER_TITLE[media_type],
+    }
+
+
+def discover_combo_ids(media_type: str, genre: str, year: int, lang: str, max_pages: int) -> Optional[list[int]]:
+    """
+    Walks TMDB discover pages for one (genre, year, language), stopping on a short page.
+    Returns None when a page could not be fetched, so the combination is retried on the next run.
+    """
+    target = CRAWL_TARGETS[media_type]
+    filters = target["filters"](
+        genre_id=map_genre_to_id(media_type, "en", genre),
+        min_release_year=year,
+        max_release_year=year,
+        original_language=lang,
+        sort_by="popularity.desc",
+    )
+
+    ids = []
+    for page in range(1, max_pages + 1):
+        try:
+            results = call_tmdb_discover_media_endpoint(media_type, filters, page, raise_errors=True)
+        except requests.RequestException as e:
+            log(f"⚠️ Discover failed for {combo_key(genre, year, lang)} page {page}: {e}")
+            return None
+        ids.extend(item["id"] for item in results)
+        if len(results) < TMDB_PAGE_SIZE:
+            break
+        time.sleep(SLEEP_BETWEEN_CALLS)
+    return ids
+
+
+def crawl_media(
+    media_type: str,
+    database: Session,
+    executor: IOExecutor,
+    checkpoint: dict,
+    checkpoint_path: Path,
+    max_pages: int = CRAWL_MAX_PAGES,
+):
+    target = CRAWL_TARGETS[media_type]
+    state = checkpoint.setdefault(media_type, {"done_combos": [], "discovered": [], "enriched": []})
+    done_combos = set(state["done_combos"])
+    discovered = set(state["discovered"])
+    enriched = set(state["enriched"])
+
+    combos = [
+        (genre, year, lang)
+        for genre, year, lang in product(target["genres"], YEARS, LANGUAGES)
+        if combo_key(genre, year, lang) not in done_combos
+    ]
+
+    estimate = estimate_upstream_calls(media_type, len(combos), max_pages)
+    log(
+        f"🧮 [{media_type.upper()}] {len(combos)} combinations pending, "
+        f"{len(discovered - enriched)} discovered titles still to enrich. "
+        f"Estimate: ≤ {estimate['discover_calls']} discover calls, "
+        f"≤ {estimate['max_enrich_calls']} enrichment calls."
+    )
+
+    # 1. Discover: bounded parallelism across combinations, checkpoint per chunk
+    for start in range(0, len(combos), CRAWL_CHUNK_SIZE):
+        chunk = combos[start:start + CRAWL_CHUNK_SIZE]
+        try:
+            results = executor.map(lambda combo: discover_combo_ids(media_type, *combo, max_pages), chunk)
+        except Exception as e:
+            log(f"❌ Discover chunk failed ({media_type}): {e}")
+            traceback.print_exc()
+            break
+
+        failed = 0
+        for (genre, year, lang), ids in zip(chunk, results):
+            if ids is None:
+                failed += 1
+                continue
+            discovered.update(ids)
+            done_combos.add(combo_key(genre, year, lang))
+
+        state["done_combos"] = sorted(done_combos)
+        state["discovered"] = sorted(discovered)
+        save_checkpoint(checkpoint_path, checkpoint)
+        log(
+            f"🔎 [{media_type.upper()}] {len(done_combos)} combinations done | {len(discovered)} unique titles"
+            + (f" | {failed} failed, left for the next run" if failed else "")
+        )
+
+    # 2. Dedupe against the DB: titles already cached are refreshed by the normal request path
+    model = target["model"]
+    already_cached = {row.tmdb_id for row in database.query(model.tmdb_id)}
+    to_enrich = sorted(discovered - enriched - already_cached)
+    enriched |= discovered & already_cached
+
+    log(
+        f"🧮 [{media_type.upper()}] {len(to_enrich)} new titles to enrich "
+        f"(~{len(to_enrich) * ENRICH_CALLS_PER_TITLE[media_type]} upstream calls)."
+    )
+
+    # 3. Enrich: bounded parallelism, checkpoint per chunk
+    for start in range(0, len(to_enrich), CRAWL_CHUNK_SIZE):
+        chunk = to_enrich[start:start + CRAWL_CHUNK_SIZE]
+        outcomes = executor.map(target["enrich"], chunk)
+        enriched.update(tmdb_id for tmdb_id, ok in zip(chunk, outcomes) if ok)
+
+        state["enriched"] = sorted(enriched)
+        save_checkpoint(checkpoint_path, checkpoint)
+        log(f"🎬 [{media_type.upper()}] enriched {min(start + len(chunk), len(to_enrich))}/{len(to_enrich)}")
+
+    log(f"✅ Done crawling {media_type.upper()}. Stats: {executor.stats()}")
+
+
+def crawl(database: Session, media_types: list[str], checkpoint_path: Path, workers: int, max_pages: int):
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint:
+        log(f"♻️ Resuming from checkpoint {checkpoint_path}")
+
+    executor = IOExecutor(max_workers=workers, per_request_limit=workers)
+    try:
+        for media_type in media_types:
+            crawl_media(media_type, database, executor, checkpoint, checkpoint_path, max_pages)
+    finally:
+        executor.shutdown()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bulk-populate the movie and TV show cache.")
+    parser.add_argument("--mode", choices=["crawl", "legacy"], default="crawl",
+                        help="crawl: deduplicating, resumable crawler. legacy: full filter pipeline per combination.")
+    parser.add_argument("--media", nargs="+", choices=["movie", "tv"], default=["movie", "tv"])
+    parser.add_argument("--workers", type=int, default=CRAWL_WORKERS)
+    parser.add_argument("--max-pages", type=int, default=CRAWL_MAX_PAGES)
+    parser.add_argument("--checkpoint", type=Path, default=CHECKPOINT_PATH)
+    parser.add_argument("--reset", action="store_true", help="Ignore and delete an existing checkpoint.")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     log("🧠 Starting BULK CACHE job...")
     check_external_services()
 
     db = next(get_db())
-    cache_movies(db)
-    cache_tvshows(db)
+
+    if args.mode == "legacy":
+        cache_movies(db)
+        cache_tvshows(db)
+    else:
+        if args.reset and args.checkpoint.exists():
+            args.checkpoint.unlink()
+        crawl(db, args.media, args.checkpoint, args.workers, args.max_pages)
 
     log("🏁 DONE. You just populated the f*** out of your DB.")
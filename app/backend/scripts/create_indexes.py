@@ -0,0 +1,40 @@
+# scripts/create_indexes.py
+#
+# Creates any index declared on the models that an existing database is missing
+# (create_all only adds missing tables, never indexes on tables that already exist).
+# Safe to re-run.
+#
+#   python -m app.backend.scripts.create_indexes
+
+from datetime import datetime
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from app.backend.core.database import Base, engine
+from app.backend.scripts import init_db  # noqa: F401  (registers every model on Base.metadata)
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def create_missing_indexes(target: Engine) -> list[str]:
+    inspector = inspect(target)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(target)
+                created.append(index.name)
+    return created
+
+
+if __name__ == "__main__":
+    log("🗂️ Creating missing indexes...")
+    created = create_missing_indexes(engine)
+    log(f"✅ {len(created)} created: {', '.join(created) or '-'}")
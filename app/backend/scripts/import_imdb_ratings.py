@@ -0,0 +1,49 @@
+# scripts/import_imdb_ratings.py
+
+import argparse
+import gzip
+from datetime import datetime
+from pathlib import Path
+import requests
+
+from app.backend.core.database import get_db
+from app.backend.services.imdb_ratings_service import (
+    IMDB_RATINGS_URL,
+    open_ratings_file,
+    import_imdb_ratings,
+    apply_imdb_ratings_to_cache,
+)
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import IMDb title.ratings into the local DB.")
+    parser.add_argument(
+        "--file", type=Path, default=None,
+        help="Local title.ratings.tsv(.gz). Streams from datasets.imdbws.com when omitted.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    db = next(get_db())
+
+    if args.file:
+        log(f"📂 Importing IMDb ratings from {args.file}...")
+        with open_ratings_file(args.file) as stream:
+            total = import_imdb_ratings(stream, db)
+    else:
+        log(f"🌍 Streaming IMDb ratings from {IMDB_RATINGS_URL}...")
+        with requests.get(IMDB_RATINGS_URL, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with gzip.GzipFile(fileobj=response.raw) as stream:
+                total = import_imdb_ratings(stream, db)
+
+    log(f"✅ {total} ratings imported.")
+    updated = apply_imdb_ratings_to_cache(db)
+    log(f"🎬 Updated {updated['movie']} cached movies and {updated['tv']} cached TV shows.")
+    db.close()
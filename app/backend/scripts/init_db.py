@@ -2,8 +2,19 @@ from app.backend.core.database import Base, engine
 from app.backend.models.user_model import User
 from app.backend.models.user_media_model import UserMedia
 from app.backend.models.chat_session_model import ChatSession
+from app.backend.models.chat_message_model import ChatMessage
 from app.backend.models.movie_model import CachedMovie
 from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.sync_state_model import SyncWatermark
+from app.backend.models.sync_retry_model import SyncRetry
+from app.backend.models.imdb_rating_model import ImdbRating
+from app.backend.models.catalog_candidate_model import CatalogCandidate
+from app.backend.models.library_version_model import LibraryVersion
+from app.backend.models.catalog_version_model import CatalogVersion
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.models.similar_title_model import SimilarTitle
+from app.backend.models.title_key_model import TitleKey
+from app.backend.services import catalog_search_service  # noqa: F401  (FTS5 tables created / dropped with the catalog)
 
 
 def init():
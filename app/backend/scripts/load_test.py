@@ -0,0 +1,168 @@
+# scripts/load_test.py
+#
+# Drives a running API (ideally wired to scripts/upstream_stub_server.py) with a mix of
+# chat and filter traffic, then reports throughput and p50/p95/p99 latency per endpoint.
+#
+#   python -m app.backend.scripts.load_test --base-url http://localhost:8000 --concurrency 20 --duration 60
+
+import argparse
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+
+CHAT_QUERIES = [
+    "Suggest me a sci-fi movie",
+    "french comedies from the 90s",
+    "Something like Breaking Bad",
+    "A slow burn mind-bending thriller",
+    "Des films policiers intelligents",
+    "Best crime tv shows of the last ten years",
+    "Inception",
+    "Movies similar to Get Out",
+]
+
+MOVIE_FILTERS = [
+    {},
+    {"genre_name": "drama", "sort_by": "vote_average.desc"},
+    {"genre_name": "comedy", "original_language": "fr", "min_release_year": 1990, "max_release_year": 1999},
+    {"genre_name": "thriller", "min_imdb_rating": 7.0, "sort_by": "vote_count.desc"},
+]
+
+TVSHOW_FILTERS = [
+    {},
+    {"genre_name": "crime", "sort_by": "popularity.desc"},
+    {"genre_name": "drama", "min_release_year": 2015},
+]
+
+# (endpoint label, weight)
+TRAFFIC_MIX = [
+    ("POST /chat", 5),
+    ("POST /movies/search-by-filters", 3),
+    ("POST /tvshows/search-by-filters", 2),
+]
+
+
+@dataclass
+class EndpointStats:
+    latencies: list = field(default_factory=list)
+    errors: int = 0
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile (pct in 0-100).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def signup_user(client: httpx.Client, index: int) -> str:
+    payload = {
+        "first_name": "Load",
+        "last_name": f"Tester{index}",
+        "email": f"loadtest-{uuid4().hex[:12]}@example.com",
+        "password": "loadtest-password",
+    }
+    response = client.post("/auth/signup", json=payload)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def send_request(client: httpx.Client, endpoint: str, headers: dict, session_id: str) -> httpx.Response:
+    if endpoint == "POST /chat":
+        payload = {"session_id": session_id, "query": random.choice(CHAT_QUERIES), "media_type": None}
+        return client.post("/chat", json=payload, headers=headers)
+    if endpoint == "POST /movies/search-by-filters":
+        return client.post("/movies/search-by-filters", json=random.choice(MOVIE_FILTERS), headers=headers)
+    return client.post("/tvshows/search-by-filters", json=random.choice(TVSHOW_FILTERS), headers=headers)
+
+
+def run_worker(base_url: str, token: str, deadline: float, stats: dict, lock: threading.Lock, timeout: float):
+    endpoints = [name for name, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight in TRAFFIC_MIX]
+    session_id = str(uuid4())
+
+    with httpx.Client(base_url=base_url, timeout=timeout) as client:
+        while time.perf_counter() < deadline:
+            endpoint = random.choices(endpoints, weights)[0]
+            headers = {"Authorization": f"Bearer {token}", "Accept-Language": random.choice(["en", "fr"])}
+
+            start = time.perf_counter()
+            try:
+                ok = send_request(client, endpoint, headers, session_id).status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - start
+
+            with lock:
+                stats[endpoint].latencies.append(elapsed)
+                if not ok:
+                    stats[endpoint].errors += 1
+
+
+def format_report(stats: dict, wall_seconds: float) -> str:
+    header = f"{'endpoint':<34} {'count':>7} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    lines = [header, "-" * len(header)]
+    for endpoint, endpoint_stats in sorted(stats.items()):
+        latencies = endpoint_stats.latencies
+        lines.append(
+            f"{endpoint:<34} {len(latencies):>7} {endpoint_stats.errors:>7} "
+            f"{len(latencies) / wall_seconds:>8.1f} "
+            f"{percentile(latencies, 50) * 1000:>9.1f} "
+            f"{percentile(latencies, 95) * 1000:>9.1f} "
+            f"{percentile(latencies, 99) * 1000:>9.1f}"
+        )
+    total = sum(len(s.latencies) for s in stats.values())
+    lines.append(f"\nTotal: {total} requests in {wall_seconds:.1f}s → {total / wall_seconds:.1f} req/s")
+    return "\n".join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test /chat and /search-by-filters.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of sustained traffic.")
+    parser.add_argument("--users", type=int, default=5, help="Distinct accounts shared by the workers.")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with httpx.Client(base_url=args.base_url, timeout=args.timeout) as setup_client:
+        tokens = [signup_user(setup_client, i) for i in range(args.users)]
+    log(f"👥 {len(tokens)} users ready, starting {args.concurrency} workers for {args.duration:.0f}s...")
+
+    stats = defaultdict(EndpointStats)
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + args.duration
+
+    workers = [
+        threading.Thread(
+            target=run_worker,
+            args=(args.base_url, tokens[i % len(tokens)], deadline, stats, lock, args.timeout),
+        )
+        for i in range(args.concurrency)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    print(format_report(stats, time.perf_counter() - started))
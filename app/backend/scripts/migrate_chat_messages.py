@@ -0,0 +1,74 @@
+# scripts/migrate_chat_messages.py
+#
+# One-off migration: moves every `chat_sessions.conversation` JSON blob into
+# `chat_messages` rows (seq = position in the blob), then drops the column.
+# Safe to re-run: already-copied messages are skipped and a migrated DB is a no-op.
+#
+#   python -m app.backend.scripts.migrate_chat_messages
+
+import json
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, inspect, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+
+from app.backend.core.database import engine
+from app.backend.models.chat_session_model import ChatSession
+from app.backend.models.chat_message_model import ChatMessage
+
+INSERT_CHUNK_SIZE = 1000
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def migrate_chat_messages(target: Engine) -> dict:
+    ChatMessage.__table__.create(target, checkfirst=True)
+
+    columns = {column["name"] for column in inspect(target).get_columns(ChatSession.__tablename__)}
+    if "conversation" not in columns:
+        return {"sessions": 0, "messages": 0}
+
+    sessions = 0
+    messages = 0
+    with target.begin() as connection:
+        rows = connection.execute(
+            text("SELECT id, conversation, created_on FROM chat_sessions")
+            .columns(id=String, conversation=String, created_on=DateTime)
+        )
+        chunk = []
+        for session_id, raw_conversation, created_on in rows:
+            conversation = json.loads(raw_conversation) if raw_conversation else []
+            sessions += 1
+            for seq, message in enumerate(conversation, start=1):
+                chunk.append({
+                    "session_id": session_id,
+                    "seq": seq,
+                    "role": message.get("role", "user"),
+                    "content": message.get("content", ""),
+                    "created_on": created_on,
+                })
+            if len(chunk) >= INSERT_CHUNK_SIZE:
+                messages += insert_messages(connection, chunk)
+                chunk = []
+        if chunk:
+            messages += insert_messages(connection, chunk)
+
+        connection.execute(text("ALTER TABLE chat_sessions DROP COLUMN conversation"))
+
+    return {"sessions": sessions, "messages": messages}
+
+
+def insert_messages(connection, rows: list[dict]) -> int:
+    statement = insert(ChatMessage).values(rows).on_conflict_do_nothing(
+        index_elements=[ChatMessage.session_id, ChatMessage.seq]
+    )
+    return connection.execute(statement).rowcount
+
+
+if __name__ == "__main__":
+    log("🗂️ Migrating chat_sessions.conversation → chat_messages...")
+    summary = migrate_chat_messages(engine)
+    log(f"✅ {summary['sessions']} sessions, {summary['messages']} messages copied.")
@@ -0,0 +1,57 @@
+# scripts/migrate_row_versions.py
+#
+# Adds what ETag revalidation needs to an existing database:
+#   - `row_version` on cached movies / TV shows (0 until a row is next refreshed)
+#   - the `catalog_versions` and `library_versions` tables
+#   - the user_media (media_type, tmdb_id) index used to find the users listing a refreshed title
+# Safe to re-run.
+#
+#   python -m app.backend.scripts.migrate_row_versions
+
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.backend.core.database import engine
+from app.backend.models.user_model import User
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.catalog_version_model import CatalogVersion
+from app.backend.models.library_version_model import LibraryVersion
+from app.backend.models.user_media_model import UserMedia
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def migrate_row_versions(target: Engine) -> list[str]:
+    changes = []
+    with target.begin() as connection:
+        for model in (CachedMovie, CachedTvShow):
+            table = model.__tablename__
+            columns = {column["name"] for column in inspect(connection).get_columns(table)}
+            if "row_version" not in columns:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0"))
+                changes.append(f"{table}.row_version")
+
+        existing_tables = set(inspect(connection).get_table_names())
+        for model in (CatalogVersion, LibraryVersion):
+            if model.__tablename__ not in existing_tables:
+                model.__table__.create(connection)
+                changes.append(model.__tablename__)
+
+        if UserMedia.__tablename__ in existing_tables:
+            indexes = {index["name"] for index in inspect(connection).get_indexes(UserMedia.__tablename__)}
+            title_index = next(index for index in UserMedia.__table__.indexes if index.name == "ix_user_media_title")
+            if title_index.name not in indexes:
+                title_index.create(connection)
+                changes.append(title_index.name)
+    return changes
+
+
+if __name__ == "__main__":
+    log("🏷️ Adding row / library versions...")
+    changes = migrate_row_versions(engine)
+    log(f"✅ {len(changes)} changes: {', '.join(changes) or '-'}")
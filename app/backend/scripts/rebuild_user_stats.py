@@ -0,0 +1,64 @@
+# scripts/rebuild_user_stats.py
+#
+# Recomputes the per-user stat counters (status counts, genre / year histograms, rating sum)
+# from user_media and the catalog, and re-snapshots what each seen title contributes:
+# backfill for existing libraries, or a resync after catalog ratings were refreshed.
+# Creates the `user_stat_counters` table and the `user_media.stat_snapshot` column if needed. Safe to re-run.
+#
+#   python -m app.backend.scripts.rebuild_user_stats
+#   python -m app.backend.scripts.rebuild_user_stats --user-id 42
+
+import argparse
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.backend.core.database import engine
+from app.backend.models.user_model import User  # noqa: F401  (users table for the foreign key)
+from app.backend.models.user_media_model import UserMedia
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.services.stats_service import rebuild_user_stats
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def rebuild_all_user_stats(target: Engine, user_id: Optional[int] = None) -> dict:
+    """
+    Rebuilds every user with library entries (or just `user_id`), one transaction per user.
+    """
+    UserStatCounter.__table__.create(target, checkfirst=True)
+    with target.begin() as connection:
+        columns = {column["name"] for column in inspect(connection).get_columns(UserMedia.__tablename__)}
+        if "stat_snapshot" not in columns:
+            connection.execute(text(f"ALTER TABLE {UserMedia.__tablename__} ADD COLUMN stat_snapshot JSON"))
+
+    summary = {"users": 0, "counters": 0}
+    with Session(bind=target) as database:
+        if user_id is not None:
+            user_ids = [user_id]
+        else:
+            user_ids = database.execute(select(UserMedia.user_id).distinct().order_by(UserMedia.user_id)).scalars().all()
+
+        for uid in user_ids:
+            summary["counters"] += rebuild_user_stats(database, uid)
+            database.commit()
+            summary["users"] += 1
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rebuild per-user stat counters from user_media.")
+    parser.add_argument("--user-id", type=int, default=None, help="Only rebuild this user")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    log("📊 Rebuilding user stats...")
+    summary = rebuild_all_user_stats(engine, args.user_id)
+    log(f"✅ {summary['users']} users, {summary['counters']} counters.")
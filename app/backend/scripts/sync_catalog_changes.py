@@ -0,0 +1,32 @@
+# scripts/sync_catalog_changes.py
+
+from datetime import datetime
+
+from app.backend.core.database import get_db
+from app.backend.core.executor import shutdown_io_executor
+from app.backend.services.catalog_sync_service import sync_media_changes
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+if __name__ == "__main__":
+    log("🔄 Starting incremental catalog sync from TMDB changes feed...")
+
+    db = next(get_db())
+    try:
+        for media_type in ("movie", "tv"):
+            summary = sync_media_changes(media_type, db)
+            log(
+                f"✅ {media_type.upper()}: {summary['changed']} changed on TMDB since {summary['since']}, "
+                f"{summary['refreshed']} cached rows refreshed."
+            )
+            if summary["failed"]:
+                log(f"⚠️ {media_type.upper()}: {len(summary['failed'])} refreshes failed, retried next run "
+                    f"(watermark {'advanced' if summary['watermark_advanced'] else 'kept'}).")
+    finally:
+        db.close()
+        shutdown_io_executor()
+
+    log("🏁 DONE.")
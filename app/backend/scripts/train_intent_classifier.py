@@ -0,0 +1,138 @@
+# scripts/train_intent_classifier.py
+#
+# Trains the local intent classifier from the intents the LLM returned in production and evaluates it offline.
+# Labels are the "Chat intent classified" records chat_service logs for opening messages; run the API with
+# INTENT_LABEL_LOGGING=1 and LOG_FORMAT=json so they can be read back (JSONL files of
+# {"query", "intent", "media_type", "selected_media_type"} work too). They hold raw chat text: keep those logs short-lived.
+#
+# The model is scored on a held-out share of the labels. For each confidence threshold the report gives:
+#   coverage  → share of turns answered locally (no LLM call)
+#   accuracy  → share of those local answers that match the LLM's intent and media type
+# It also gives the local classification latency. The saved model is then trained on all the labels.
+#
+#   python -m app.backend.scripts.train_intent_classifier
+#   python -m app.backend.scripts.train_intent_classifier --labels logs/app.log* extra_labels.jsonl --thresholds 0.8 0.9 0.95
+#   python -m app.backend.scripts.train_intent_classifier --no-save
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+from app.backend.core.logging_config import LOG_DIR
+from app.backend.services.intent_classifier_service import (
+    MEDIA_LABELS,
+    IntentClassifier,
+    model_path,
+    train_linear_model,
+)
+
+
+def log(msg: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def read_labelled_turns(paths: Iterable[Path]) -> list[dict]:
+    """
+    Labelled chat turns from JSON log lines / JSONL files; lines that are not LLM intent labels are skipped.
+    """
+    turns = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict) or not record.get("query") or not record.get("intent"):
+                    continue
+                if record.get("source", "llm") != "llm":
+                    continue
+                turns.append(record)
+    return turns
+
+
+def train_classifier(turns: list[dict]) -> IntentClassifier:
+    intent_model = train_linear_model([(turn["query"], turn["intent"]) for turn in turns])
+    # Only turns where the user did not pick a media type say what the message itself implies
+    media_model = train_linear_model(
+        [(turn["query"], turn.get("media_type") or "none") for turn in turns if not turn.get("selected_media_type")],
+        labels=list(MEDIA_LABELS),
+    )
+    return IntentClassifier(intent_model, media_model)
+
+
+def evaluate(classifier: IntentClassifier, turns: list[dict], thresholds: list[float]) -> dict:
+    """
+    Top-1 intent accuracy, then coverage / accuracy of the local answers at each threshold, plus latency.
+    """
+    top1 = sum(classifier.intent_model.predict(turn["query"])[0] == turn["intent"] for turn in turns)
+
+    rows = []
+    for threshold in thresholds:
+        answered = correct = 0
+        for turn in turns:
+            local = classifier.classify(turn["query"], turn.get("selected_media_type"), None, threshold)
+            if local is None:
+                continue
+            answered += 1
+            correct += local.intent == turn["intent"] and local.media_type == turn.get("media_type")
+        rows.append({
+            "threshold": threshold,
+            "coverage": answered / len(turns),
+            "accuracy": correct / answered if answered else 0.0,
+        })
+
+    timings = []
+    for turn in turns:
+        start = time.perf_counter()
+        classifier.classify(turn["query"], turn.get("selected_media_type"), None)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "turns": len(turns),
+        "top1_accuracy": top1 / len(turns),
+        "thresholds": rows,
+        "latency_p50_ms": statistics.median(timings) * 1000,
+        "latency_p99_ms": timings[int(len(timings) * 0.99)] * 1000,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train and evaluate the local chat intent classifier.")
+    parser.add_argument("--labels", type=Path, nargs="+", default=sorted(LOG_DIR.glob("app.log*")))
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of the labels kept for evaluation")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.7, 0.8, 0.9, 0.95])
+    parser.add_argument("--output", type=Path, default=None, help="Model file (default: INTENT_MODEL_PATH)")
+    parser.add_argument("--no-save", action="store_true", help="Only evaluate")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    turns = read_labelled_turns(args.labels)
+    log(f"📥 {len(turns)} labelled turns from {len(args.labels)} files")
+    if len(turns) < 10:
+        raise SystemExit("Not enough labelled turns to train on.")
+
+    random.Random(7).shuffle(turns)
+    split = max(1, int(len(turns) * args.holdout))
+    held_out, training = turns[:split], turns[split:]
+
+    start = time.perf_counter()
+    report = evaluate(train_classifier(training), held_out, args.thresholds)
+    log(f"🧠 Trained on {len(training)} turns in {time.perf_counter() - start:.1f}s, evaluated on {report['turns']}")
+    log(f"🎯 Top-1 intent accuracy {report['top1_accuracy']:.1%}")
+    print(f"{'threshold':>10} {'coverage':>9} {'accuracy':>9}")
+    for row in report["thresholds"]:
+        print(f"{row['threshold']:>10.2f} {row['coverage']:>9.1%} {row['accuracy']:>9.1%}")
+    log(f"⏱️  Local classification p50 {report['latency_p50_ms']:.2f} ms, p99 {report['latency_p99_ms']:.2f} ms")
+
+    if not args.no_save:
+        output = args.output or model_path()
+        train_classifier(turns).save(output)
+        log(f"✅ Model trained on all {len(turns)} turns saved to {output}")
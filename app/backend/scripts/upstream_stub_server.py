@@ -0,0 +1,324 @@
+# scripts/upstream_stub_server.py
+#
+# Local stand-in for TMDB, OMDB and OpenAI, for load tests that must not burn API quota.
+#
+#   python -m app.backend.scripts.upstream_stub_server --mode replay --latency-ms 80 --error-rate 0.01
+#
+# Then start the API with:
+#   TMDB_BASE_URL=http://localhost:9000/tmdb
+#   OMDB_BASE_URL=http://localhost:9000/omdb/
+#   OPENAI_BASE_URL=http://localhost:9000/openai/v1
+#
+# Modes:
+#   record → proxies to the real upstream and stores every response in the cassette dir
+#   replay → serves stored responses; on a miss, answers with synthetic data (or 404 with --on-miss 404)
+#
+# OpenAI requests with "stream": true get the same answer as server-sent chunks. --token-ms simulates generation:
+# streamed chunks (about one token each) are paced by it, and other answers wait for the whole text to be "generated".
+
+import argparse
+import hashlib
+import json
+import random
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import requests
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.backend.core.config import (
+    CHAT_INTENT_CONFIG,
+    FILTER_PARSING_CONFIG,
+    OPENAI_API_KEY,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+DEFAULT_CASSETTE_DIR = ROOT_DIR / "storage" / "upstream_cassettes"
+
+REAL_UPSTREAMS = {
+    "tmdb": "https://api.themoviedb.org/3",
+    "omdb": "http://www.omdbapi.com",
+    "openai": "https://api.openai.com/v1",
+}
+
+# Query params that must not be part of a cassette key (secrets / noise)
+IGNORED_PARAMS = {"api_key", "apikey"}
+
+
+@dataclass
+class StubSettings:
+    mode: str = "replay"
+    cassette_dir: Path = DEFAULT_CASSETTE_DIR
+    on_miss: str = "synthetic"
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    token_ms: float = 0.0
+    llm_titles: int = 10
+
+
+# ─────────────────────────────────────────────
+# CASSETTES
+
+def cassette_key(service: str, path: str, params: dict, body: Optional[dict] = None) -> str:
+    kept = sorted((k, str(v)) for k, v in params.items() if k not in IGNORED_PARAMS)
+    raw = json.dumps([service, path.strip("/"), kept, body], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def cassette_path(settings: StubSettings, service: str, key: str) -> Path:
+    return settings.cassette_dir / service / f"{key}.json"
+
+
+def load_cassette(settings: StubSettings, service: str, key: str) -> Optional[dict]:
+    path = cassette_path(settings, service, key)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_cassette(settings: StubSettings, service: str, key: str, status_code: int, body):
+    path = cassette_path(settings, service, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"status_code": status_code, "body": body}, f, ensure_ascii=False)
+
+
+# ─────────────────────────────────────────────
+# SYNTHETIC RESPONSES (replay misses)
+
+def stable_id(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8")) % 900_000 + 1
+
+
+def synthetic_tmdb(path: str, params: dict):
+    parts = path.strip("/").split("/")
+
+    if parts[0] == "discover":
+        page = int(params.get("page", 1))
+        genre_id = int(str(params.get("with_genres") or 18).split(",")[0])
+        seed = json.dumps(sorted((k, str(v)) for k, v in params.items() if k not in IGNORED_PARAMS | {"page"}))
+        results = [
+            {"id": stable_id(f"{seed}:{page}:{i}"), "genre_ids": [genre_id], "popularity": 100.0 - i}
+            for i in range(20)
+        ]
+        return {"page": page, "results": results, "total_pages": 10, "total_results": 200}
+
+    if parts[0] == "search":
+        return {"results": [{"id": stable_id(f"{parts[1]}:{params.get('query', '')}")}]}
+
+    if parts[0] == "find":
+        return {"movie_results": [{"id": stable_id(f"find:{parts[1]}")}], "tv_results": []}
+
+    if parts[0] == "genre":
+        return {"genres": [{"id": 18, "name": "Drama"}, {"id": 35, "name": "Comedy"}]}
+
+    media_type = parts[0]
+    if len(parts) >= 2 and parts[1] == "changes":
+        return {"results": [], "page": 1, "total_pages": 1}
+
+    tmdb_id = int(parts[1])
+    if len(parts) == 3 and parts[2] == "videos":
+        return {"results": [{"site": "YouTube", "type": "Trailer", "name": "Trailer", "key": f"stub{tmdb_id}"}]}
+    if len(parts) == 3 and parts[2] == "external_ids":
+        return {"imdb_id": f"tt{tmdb_id:07d}"}
+
+    title_key = "title" if media_type == "movie" else "name"
+    date_key = "release_date" if media_type == "movie" else "first_air_date"
+    return {
+        "id": tmdb_id,
+        "imdb_id": f"tt{tmdb_id:07d}",
+        title_key: f"Stub {media_type} {tmdb_id}",
+        date_key: f"{1980 + tmdb_id % 45}-01-01",
+        "genres": [{"id": 18, "name": "Drama"}],
+        "poster_path": f"/stub{tmdb_id}.jpg",
+        "overview": f"Synthetic overview for {media_type} {tmdb_id}.",
+    }
+
+
+def synthetic_omdb(params: dict):
+    seed = stable_id(params.get("i", ""))
+    return {"imdbRating": f"{6 + (seed % 35) / 10:.1f}", "imdbVotes": f"{1000 + seed * 3:,}", "Response": "True"}
+
+
+def synthetic_openai(body: dict, titles: int = 10):
+    messages = body.get("messages", [])
+    system_prompt = messages[0]["content"] if messages else ""
+    user_text = " ".join(m["content"] for m in messages[1:] if m.get("role") == "user")
+
+    if system_prompt == CHAT_INTENT_CONFIG["prompt"]:
+        media_type = "tv" if any(w in user_text.lower() for w in ("show", "series", "série")) else "movie"
+        content = json.dumps({
+            "intent": "filters_parsing",
+            "media_type": media_type,
+            "message_to_user": "Here are some picks for you.",
+        })
+    elif system_prompt in FILTER_PARSING_CONFIG["prompt"].values():
+        content = json.dumps({"genre_name": "drama", "sort_by": "popularity.desc"})
+    else:
+        seed = stable_id(user_text)
+        content = json.dumps([{"title": f"Stub title {seed + i}", "year": 1990 + (seed + i) % 35} for i in range(titles)])
+
+    return {
+        "id": f"chatcmpl-stub-{stable_id(user_text)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+# OpenAI streams a few characters (about one token) per chunk
+STREAM_CHUNK_CHARS = 4
+
+
+def completion_content(payload: dict) -> str:
+    return payload["choices"][0]["message"]["content"] or ""
+
+
+def stream_chat_completion(payload: dict, chunk_ms: float) -> StreamingResponse:
+    """
+    A chat.completion replayed as OpenAI's "chat.completion.chunk" server-sent events, one every `chunk_ms`.
+    """
+    content = completion_content(payload)
+    base = {
+        "id": payload.get("id", "chatcmpl-stub"),
+        "object": "chat.completion.chunk",
+        "created": payload.get("created", int(time.time())),
+        "model": payload.get("model", "stub"),
+    }
+
+    def event(delta: dict, finish_reason: Optional[str] = None) -> str:
+        chunk = {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+        return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+    def events():
+        yield event({"role": "assistant", "content": ""})
+        for start in range(0, len(content), STREAM_CHUNK_CHARS):
+            if chunk_ms:
+                time.sleep(chunk_ms / 1000)
+            yield event({"content": content[start:start + STREAM_CHUNK_CHARS]})
+        yield event({}, "stop")
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+# ─────────────────────────────────────────────
+# APP
+
+def create_stub_app(settings: StubSettings) -> FastAPI:
+    app = FastAPI(title="Upstream stub (TMDB / OMDB / OpenAI)", docs_url=None, redoc_url=None)
+    app.state.settings = settings
+
+    def inject_faults() -> Optional[JSONResponse]:
+        delay = settings.latency_ms + random.uniform(-settings.jitter_ms, settings.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if settings.error_rate and random.random() < settings.error_rate:
+            status_code = random.choice([429, 500, 503])
+            return JSONResponse({"error": "injected failure"}, status_code=status_code)
+        return None
+
+    def serve(service: str, path: str, params: dict, body: Optional[dict], synthesize, forward):
+        failure = inject_faults()
+        if failure:
+            return failure
+
+        key = cassette_key(service, path, params, body)
+
+        if settings.mode == "record":
+            status_code, payload = forward()
+            save_cassette(settings, service, key, status_code, payload)
+            return JSONResponse(payload, status_code=status_code)
+
+        recorded = load_cassette(settings, service, key)
+        if recorded:
+            return JSONResponse(recorded["body"], status_code=recorded["status_code"])
+        if settings.on_miss == "404":
+            return JSONResponse({"error": "no recording"}, status_code=404)
+        return JSONResponse(synthesize())
+
+    # Endpoints are sync on purpose: FastAPI runs them in its thread pool, so sleeps don't block the loop
+    @app.get("/tmdb/{path:path}")
+    def tmdb(path: str, request: Request):
+        params = dict(request.query_params)
+
+        def forward():
+            response = requests.get(f"{REAL_UPSTREAMS['tmdb']}/{path}", params=params, timeout=10)
+            return response.status_code, response.json()
+
+        return serve("tmdb", path, params, None, lambda: synthetic_tmdb(path, params), forward)
+
+    @app.get("/omdb/")
+    def omdb(request: Request):
+        params = dict(request.query_params)
+
+        def forward():
+            response = requests.get(f"{REAL_UPSTREAMS['omdb']}/", params=params, timeout=10)
+            return response.status_code, response.json()
+
+        return serve("omdb", "", params, None, lambda: synthetic_omdb(params), forward)
+
+    @app.post("/openai/v1/chat/completions")
+    def openai_chat(body: dict):
+        def forward():
+            response = requests.post(
+                f"{REAL_UPSTREAMS['openai']}/chat/completions",
+                json={key: value for key, value in body.items() if key != "stream"},
+                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+                timeout=60,
+            )
+            return response.status_code, response.json()
+
+        # Key on what determines the answer, not on sampling noise
+        key_body = {"model": body.get("model"), "messages": body.get("messages")}
+        response = serve("openai", "chat/completions", {}, key_body, lambda: synthetic_openai(body, settings.llm_titles), forward)
+        if response.status_code != 200:
+            return response
+        payload = json.loads(response.body)
+        if body.get("stream"):
+            return stream_chat_completion(payload, settings.token_ms)
+        if settings.token_ms:
+            chunks = -(-len(completion_content(payload)) // STREAM_CHUNK_CHARS)
+            time.sleep(chunks * settings.token_ms / 1000)
+        return response
+
+    return app
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Record/replay stub for TMDB, OMDB and OpenAI.")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay")
+    parser.add_argument("--cassette-dir", type=Path, default=DEFAULT_CASSETTE_DIR)
+    parser.add_argument("--on-miss", choices=["synthetic", "404"], default="synthetic")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean injected latency per call.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter around the mean.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of calls answered with 429/500/503.")
+    parser.add_argument("--token-ms", type=float, default=0.0, help="Simulated OpenAI generation time per chunk of 4 chars.")
+    parser.add_argument("--llm-titles", type=int, default=10, help="Titles in synthetic OpenAI title lists.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    stub_settings = StubSettings(
+        mode=args.mode,
+        cassette_dir=args.cassette_dir,
+        on_miss=args.on_miss,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        token_ms=args.token_ms,
+        llm_titles=args.llm_titles,
+    )
+    uvicorn.run(create_stub_app(stub_settings), host=args.host, port=args.port)
@@ -0,0 +1,75 @@
+import math
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.core.tracing import traced
+
+
+def decade_of(year: Optional[int]) -> Optional[int]:
+    return year // 10 * 10 if year else None
+
+
+@dataclass
+class AffinityVector:
+    """
+    Unit-length genre / decade profile of what a user has seen:
+    "genre:<id>" (this media type's genres) and "decade:<year>" (movies and shows alike) → weight.
+    Empty for users with no seen history.
+    """
+    weights: dict[str, float] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.weights)
+
+    def score(self, genre_ids: Optional[Iterable[int]], release_year: Optional[int]) -> float:
+        """
+        Cosine similarity with a candidate's one-hot genre + decade vector.
+        """
+        keys = [f"genre:{genre_id}" for genre_id in genre_ids or []]
+        if decade_of(release_year):
+            keys.append(f"decade:{decade_of(release_year)}")
+        if not keys:
+            return 0.0
+        return sum(self.weights.get(key, 0.0) for key in keys) / math.sqrt(len(keys))
+
+
+@traced
+def load_user_affinity(user_id: int, media_type: str, database: Session) -> AffinityVector:
+    """
+    Builds the user's affinity vector from the genre / year stat counters, which are kept up to date
+    on every status change (see stats_service): one indexed read, no scan of the user's history.
+    """
+    counters = database.execute(
+        select(UserStatCounter.kind, UserStatCounter.bucket, UserStatCounter.value).where(
+            UserStatCounter.user_id == user_id,
+            UserStatCounter.kind.in_(("genre", "year")),
+            UserStatCounter.value > 0,
+        )
+    ).all()
+
+    weights: dict[str, float] = {}
+    for kind, bucket, value in counters:
+        if kind == "genre":
+            bucket_media_type, genre_id = bucket.split(":", 1)
+            if bucket_media_type != media_type:
+                continue
+            key = f"genre:{genre_id}"
+        else:
+            key = f"decade:{decade_of(int(bucket))}"
+        weights[key] = weights.get(key, 0.0) + value
+
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return AffinityVector({key: weight / norm for key, weight in weights.items()} if norm else {})
+
+
+def rank_by_affinity(rows: list, affinity: AffinityVector) -> list:
+    """
+    Best affinity first, IMDb rating as the tie-breaker. Keeps the input order when the vector is empty.
+    """
+    if not affinity:
+        return rows
+    return sorted(rows, key=lambda row: (affinity.score(row.genre_ids, row.release_year), row.imdb_rating or 0.0), reverse=True)
@@ -1,53 +1,49 @@
 from fastapi import status, HTTPException
+from starlette.concurrency import run_in_threadpool
 import logging
 from sqlalchemy.orm import Session
 from typing import Tuple, Optional
 
 from app.backend.models.user_model import User
 from app.backend.schemas.user_schemas import UserCreate, UserLogin, UserPublic, TokenResponse
-from app.backend.core.security import hash_password, verify_password, create_access_token
+from app.backend.core.security import hash_password, hash_password_async, verify_password_async, create_access_token
 
 logger = logging.getLogger(__name__)
 
 
-def handle_signup_request(user_data: UserCreate, database: Session) -> TokenResponse:
+async def handle_signup_request(user_data: UserCreate, database: Session) -> TokenResponse:
     """
-    Process a user signup request: create user, then log them in and return JWT & User Data.
+    Process a user signup request: create user, then return JWT & User Data.
+    The password was just hashed on insert, so there is no second bcrypt check.
+    DB work runs in the thread pool, bcrypt in the hashing pool: the event loop is never blocked.
     """
-    success, message = add_user_to_db(user_data, database)
+    if await run_in_threadpool(find_user_by_email, user_data.email, database):
+        logger.warning("Signup failed: email already registered - %s", user_data.email)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists")
+
+    password_hash = await hash_password_async(user_data.password)
+    success, message = await run_in_threadpool(add_user_to_db, user_data, database, password_hash)
 
     if not success:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
     else:
         logger.info("Signup successful for: %s", user_data.email)
 
-
-    user_credentials = UserLogin(email=user_data.email, password=user_data.password)
-    user = check_user_credentials_in_db(user_credentials, database)
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Credentials"
-        )
-    else:
-        logger.info("Login successful for: %s", user.email)
-
-
     return TokenResponse(
-        access_token=create_access_token({"sub": user.email}),
+        access_token=create_access_token({"sub": user_data.email}),
         token_type="Bearer",
         user=UserPublic(
-            first_name=user.first_name, last_name=user.last_name, email=user.email
+            first_name=user_data.first_name, last_name=user_data.last_name, email=user_data.email
         ),
     )
 
 
 
-def handle_login_request(user_credentials: UserLogin, database: Session) -> TokenResponse:
+async def handle_login_request(user_credentials: UserLogin, database: Session) -> TokenResponse:
     """
     Process a user login request: log user in, and return JWT & User Data.
     """
-    user = check_user_credentials_in_db(user_credentials, database)
+    user = await check_user_credentials_in_db(user_credentials, database)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Credentials"
@@ -64,13 +60,17 @@ def handle_login_request(user_credentials: UserLogin, database: Session) -> Toke
     )
 
 
-def add_user_to_db(user_data: UserCreate, database: Session) -> Tuple[bool, str]:
+def find_user_by_email(email: str, database: Session) -> Optional[User]:
+    return database.query(User).filter(User.email == email).first()
+
+
+def add_user_to_db(user_data: UserCreate, database: Session, password_hash: Optional[str] = None) -> Tuple[bool, str]:
     """
-    Process a user signup request: create user, then log them in and return JWT & User Data.
+    Inserts the user. `password_hash` comes from the async signup path; sync callers let it hash here.
     """
     logger.info("Signup attempt for email: %s", user_data.email)
 
-    email_exists = database.query(User).filter(User.email == user_data.email).first()
+    email_exists = find_user_by_email(user_data.email, database)
     if email_exists:
         logger.warning("Signup failed: email already registered - %s", user_data.email)
         return False, "Email already exists"
@@ -79,7 +79,7 @@ def add_user_to_db(user_data: UserCreate, database: Session) -> Tuple[bool, str]
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=password_hash or hash_password(user_data.password),
     )
 
     database.add(new_user)
@@ -89,10 +89,10 @@ def add_user_to_db(user_data: UserCreate, database: Session) -> Tuple[bool, str]
 
 
 
-def check_user_credentials_in_db(user_data: UserLogin, database: Session) -> Optional[User]:
+async def check_user_credentials_in_db(user_data: UserLogin, database: Session) -> Optional[User]:
     logger.info("Login attempt for: %s", user_data.email)
 
-    user = database.query(User).filter(User.email == user_data.email).first()
+    user = await run_in_threadpool(find_user_by_email, user_data.email, database)
     if not user:
         logger.warning("Login failed: no user with email %s", user_data.email)
         raise HTTPException(
@@ -100,7 +100,7 @@ def check_user_credentials_in_db(user_data: UserLogin, database: Session) -> Opt
             detail="Invalid credentials"
         )
 
-    if not verify_password(user_data.password, user.password_hash):
+    if not await verify_password_async(user_data.password, user.password_hash):
         logger.warning("Login failed: wrong password for %s", user_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
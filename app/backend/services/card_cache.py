@@ -0,0 +1,151 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Callable
+
+from fastapi import Response
+from sqlalchemy import event
+from pydantic import BaseModel
+
+from app.backend.core.config import CARD_JSON_CACHE_SIZE
+from app.backend.core.tmdb_client import POSTER_SIZES, DEFAULT_POSTER_SIZE
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+
+LANGUAGES = ("en", "fr")
+
+
+class CardJsonCache:
+    """
+    Thread-safe LRU of serialized cards: (media_type, tmdb_id, language, image_size) → (row version, JSON bytes).
+    The version is the row's `row_version`, so a row refreshed by another process
+    (sync / import scripts) is re-serialized on its next read.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, version, payload: bytes):
+        with self._lock:
+            self._entries[key] = (version, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_card_json = CardJsonCache(CARD_JSON_CACHE_SIZE)
+
+
+def get_card_json(media_type: str, row, language: str, image_size: str, build: Callable[..., BaseModel]) -> bytes:
+    """
+    JSON bytes of one card, serialized once per row version, language and poster size.
+    """
+    key = (media_type, row.tmdb_id, language, image_size)
+    payload = _card_json.get(key, row.row_version)
+    if payload is None:
+        payload = build(row, language, image_size).model_dump_json().encode("utf-8")
+        _card_json.put(key, row.row_version, payload)
+    return payload
+
+
+def invalidate_card(media_type: str, tmdb_id: int):
+    for language in LANGUAGES:
+        for image_size in POSTER_SIZES:
+            _card_json.pop((media_type, tmdb_id, language, image_size))
+
+
+def clear_card_cache():
+    _card_json.clear()
+
+
+def card_cache_stats() -> dict:
+    return _card_json.stats()
+
+
+class CardList(Sequence):
+    """
+    Cards of a list response, kept as cached rows until they are needed:
+    - routes send `to_json()`, spliced from cached bytes with no model validation;
+    - indexing / iterating builds the Pydantic cards (chat responses, scripts, tests).
+    """
+
+    def __init__(self, media_type: str, rows: list, language: str, build: Callable[..., BaseModel],
+                 image_size: str = DEFAULT_POSTER_SIZE):
+        self.media_type = media_type
+        self.rows = rows
+        self.language = language
+        self.build = build
+        self.image_size = image_size
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.build(row, self.language, self.image_size) for row in self.rows[index]]
+        return self.build(self.rows[index], self.language, self.image_size)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other) if isinstance(other, (list, CardList)) else NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<CardList({self.media_type}, {len(self.rows)} cards, {self.language})>"
+
+    def with_image_size(self, image_size: str) -> "CardList":
+        return CardList(self.media_type, self.rows, self.language, self.build, image_size)
+
+    def to_json(self) -> bytes:
+        return b"[" + b",".join(
+            get_card_json(self.media_type, row, self.language, self.image_size, self.build) for row in self.rows
+        ) + b"]"
+
+
+def card_list_response(cards, image_size: str = DEFAULT_POSTER_SIZE) -> Response:
+    """
+    Sends a card list as raw JSON: a CardList is spliced from cached bytes, anything
+    else (the `[]` early returns) is serialized card by card. Skips `response_model` validation.
+    """
+    if isinstance(cards, CardList):
+        content = cards.with_image_size(image_size).to_json()
+    else:
+        content = b"[" + b",".join(card.model_dump_json().encode("utf-8") for card in cards) + b"]"
+    return Response(content=content, media_type="application/json")
+
+
+@event.listens_for(CachedMovie, "after_update")
+@event.listens_for(CachedMovie, "after_delete")
+def _invalidate_movie_card(mapper, connection, target: CachedMovie):
+    invalidate_card("movie", target.tmdb_id)
+
+
+@event.listens_for(CachedTvShow, "after_update")
+@event.listens_for(CachedTvShow, "after_delete")
+def _invalidate_tvshow_card(mapper, connection, target: CachedTvShow):
+    invalidate_card("tv", target.tmdb_id)
@@ -0,0 +1,148 @@
+import gzip
+import json
+import logging
+from datetime import date
+from pathlib import Path
+from typing import IO, Collection, Iterator, Optional
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.backend.core.executor import run_in_io_pool
+from app.backend.models.catalog_candidate_model import CatalogCandidate
+from app.backend.services.movie_service import enrich_and_cache_one_movie
+from app.backend.services.tvshow_service import enrich_and_cache_one_tvshow
+
+logger = logging.getLogger(__name__)
+
+TMDB_EXPORTS_BASE_URL = "http://files.tmdb.org/p/exports"
+EXPORT_FILE_PREFIX = {"movie": "movie_ids", "tv": "tv_series_ids"}
+INGEST_CHUNK_SIZE = 5000
+
+ENRICHERS = {
+    "movie": enrich_and_cache_one_movie,
+    "tv": enrich_and_cache_one_tvshow,
+}
+
+
+def export_file_url(media_type: str, export_date: date) -> str:
+    """
+    e.g. http://files.tmdb.org/p/exports/movie_ids_07_28_2025.json.gz
+    """
+    return f"{TMDB_EXPORTS_BASE_URL}/{EXPORT_FILE_PREFIX[media_type]}_{export_date.strftime('%m_%d_%Y')}.json.gz"
+
+
+def open_export_file(path: Path) -> IO[bytes]:
+    """
+    Opens a local export, gzipped (.gz) or plain JSON lines.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_export_rows(stream: IO[bytes], min_popularity: float = 0.0) -> Iterator[dict]:
+    """
+    Streams {id, original_title|original_name, popularity} lines, skipping adult titles and videos.
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if item.get("adult") or item.get("video"):
+            continue
+        popularity = float(item.get("popularity") or 0.0)
+        if popularity < min_popularity:
+            continue
+        yield {
+            "tmdb_id": item["id"],
+            "original_title": item.get("original_title") or item.get("original_name"),
+            "popularity": popularity,
+        }
+
+
+def upsert_candidates_chunk(rows: list[dict], database: Session):
+    statement = insert(CatalogCandidate).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[CatalogCandidate.media_type, CatalogCandidate.tmdb_id],
+        set_={
+            "original_title": statement.excluded.original_title,
+            "popularity": statement.excluded.popularity,
+            "export_date": statement.excluded.export_date,
+        },
+    )
+    database.execute(statement)
+    database.commit()
+
+
+def ingest_tmdb_export(
+    stream: IO[bytes],
+    media_type: str,
+    database: Session,
+    export_date: Optional[date] = None,
+    min_popularity: float = 0.0,
+    chunk_size: int = INGEST_CHUNK_SIZE,
+) -> int:
+    """
+    Seeds `catalog_candidates` from a TMDB daily ID export in fixed-size chunks.
+    Existing candidates keep their `enriched` flag, only title and popularity are refreshed.
+    """
+    export_date = export_date or date.today()
+    chunk = []
+    total = 0
+
+    for row in read_export_rows(stream, min_popularity):
+        row.update(media_type=media_type, export_date=export_date)
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            upsert_candidates_chunk(chunk, database)
+            total += len(chunk)
+            chunk = []
+
+    if chunk:
+        upsert_candidates_chunk(chunk, database)
+        total += len(chunk)
+
+    logger.info("Ingested %s %s candidates from TMDB export", total, media_type)
+    return total
+
+
+def next_candidates(media_type: str, database: Session, limit: int, exclude: Collection[int] = ()) -> list[int]:
+    """
+    Most popular candidates that have not been enriched yet (skipping `exclude`).
+    """
+    query = database.query(CatalogCandidate.tmdb_id).filter(
+        CatalogCandidate.media_type == media_type, CatalogCandidate.enriched.is_(False)
+    )
+    if exclude:
+        query = query.filter(CatalogCandidate.tmdb_id.not_in(exclude))
+    rows = query.order_by(CatalogCandidate.popularity.desc()).limit(limit)
+    return [row.tmdb_id for row in rows]
+
+
+def enrich_candidates(media_type: str, database: Session, limit: int, batch_size: int = 100) -> int:
+    """
+    Tries up to `limit` candidates in popularity order and flags those that were actually cached.
+    Failed ones stay unflagged for the next run. Returns the number enriched.
+    """
+    tried, enriched, failed = 0, 0, []
+    while tried < limit:
+        tmdb_ids = next_candidates(media_type, database, min(batch_size, limit - tried), exclude=failed)
+        if not tmdb_ids:
+            break
+
+        outcomes = run_in_io_pool(ENRICHERS[media_type], tmdb_ids)
+        cached_ids = [tmdb_id for tmdb_id, ok in zip(tmdb_ids, outcomes) if ok]
+        failed.extend(tmdb_id for tmdb_id, ok in zip(tmdb_ids, outcomes) if not ok)
+
+        if cached_ids:
+            (
+                database.query(CatalogCandidate)
+                .filter(CatalogCandidate.media_type == media_type, CatalogCandidate.tmdb_id.in_(cached_ids))
+                .update({CatalogCandidate.enriched: True}, synchronize_session=False)
+            )
+            database.commit()
+        tried += len(tmdb_ids)
+        enriched += len(cached_ids)
+        logger.info("Enriched %s/%s %s candidates (%s failed)", enriched, limit, media_type, len(failed))
+
+    return enriched
@@ -0,0 +1,223 @@
+from sqlalchemy import DDL, event, inspect, text
+from sqlalchemy.orm import Session
+
+from app.backend.core.tracing import traced
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.utils.utils import fold_text
+
+# One FTS5 table per catalog table, rowid = tmdb_id; diacritics folded by the tokenizer
+FTS_TABLES = {"movie": "movies_fts", "tv": "tvshows_fts"}
+FTS_COLUMNS = ("title_en", "title_fr", "overview_en", "overview_fr", "genres")
+INDEXED_ATTRIBUTES = ("title_en", "title_fr", "overview_en", "overview_fr", "genre_names_en", "genre_names_fr")
+
+# bm25() column weights, in FTS_COLUMNS order: descriptions match overviews and genres first
+DESCRIPTION_WEIGHTS = (2.0, 2.0, 1.0, 1.0, 3.0)
+
+# bm25() weights for title lookups: titles only
+TITLE_WEIGHTS = (1.0, 1.0, 0.0, 0.0, 0.0)
+TITLE_CANDIDATES = 100
+
+# Dropped from a title lookup only when the raw keywords match nothing ("find the movie inception")
+TITLE_REQUEST_WORDS = frozenset("""
+    find search looking for movie movies film films show shows series serie tv me please called named titled
+    the a an cherche trouve trouver le la les un une
+""".split())
+
+QUERY_STOPWORDS = frozenset("""
+    the and for with from that this about some something like want looking movie movies film films show shows
+    series serie tv me give recommend les des une pour avec dans qui que sur comme veux cherche un le la de du
+""".split())
+MAX_QUERY_TERMS = 12
+
+
+def create_fts_table_sql(media_type: str) -> str:
+    columns = ", ".join(FTS_COLUMNS)
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLES[media_type]} "
+        f"USING fts5({columns}, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+
+# ─────────────────────────────────────────────
+# SYNC: created / dropped with the catalog tables, rows kept in step by ORM events
+
+_ready_binds: set = set()
+
+
+def fts_table_exists(connection, media_type: str) -> bool:
+    key = (id(connection.engine), media_type)
+    if key not in _ready_binds:
+        if FTS_TABLES[media_type] not in inspect(connection).get_table_names():
+            return False
+        _ready_binds.add(key)
+    return True
+
+
+def fts_values(row) -> dict:
+    return {
+        "rowid": row.tmdb_id,
+        "title_en": row.title_en or "",
+        "title_fr": row.title_fr or "",
+        "overview_en": row.overview_en or "",
+        "overview_fr": row.overview_fr or "",
+        "genres": " ".join((row.genre_names_en or []) + (row.genre_names_fr or [])),
+    }
+
+
+def index_row(connection, media_type: str, row):
+    table = FTS_TABLES[media_type]
+    connection.execute(text(f"DELETE FROM {table} WHERE rowid = :rowid"), {"rowid": row.tmdb_id})
+    connection.execute(
+        text(f"INSERT INTO {table} (rowid, {', '.join(FTS_COLUMNS)}) VALUES (:rowid, :{', :'.join(FTS_COLUMNS)})"),
+        fts_values(row),
+    )
+
+
+def _sync_on_insert(media_type: str):
+    def sync(mapper, connection, target):
+        if fts_table_exists(connection, media_type):
+            index_row(connection, media_type, target)
+    return sync
+
+
+def _sync_on_update(media_type: str):
+    def sync(mapper, connection, target):
+        # Rating / vote refreshes leave the indexed text alone
+        changed = any(inspect(target).attrs[name].history.has_changes() for name in INDEXED_ATTRIBUTES)
+        if changed and fts_table_exists(connection, media_type):
+            index_row(connection, media_type, target)
+    return sync
+
+
+def _sync_on_delete(media_type: str):
+    def sync(mapper, connection, target):
+        if fts_table_exists(connection, media_type):
+            connection.execute(text(f"DELETE FROM {FTS_TABLES[media_type]} WHERE rowid = :rowid"), {"rowid": target.tmdb_id})
+    return sync
+
+
+for _model, _media_type in ((CachedMovie, "movie"), (CachedTvShow, "tv")):
+    event.listen(_model.__table__, "after_create", DDL(create_fts_table_sql(_media_type)))
+    event.listen(_model.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLES[_media_type]}"))
+    event.listen(_model, "after_insert", _sync_on_insert(_media_type))
+    event.listen(_model, "after_update", _sync_on_update(_media_type))
+    event.listen(_model, "after_delete", _sync_on_delete(_media_type))
+
+
+def rebuild_fts_index(database: Session, media_type: str) -> int:
+    """
+    Creates the FTS table if needed and refills it from the catalog. Does not commit. Returns the row count.
+    """
+    model = {"movie": CachedMovie, "tv": CachedTvShow}[media_type]
+    table = FTS_TABLES[media_type]
+    database.execute(text(create_fts_table_sql(media_type)))
+    database.execute(text(f"DELETE FROM {table}"))
+
+    rows = database.query(
+        model.tmdb_id, model.title_en, model.title_fr, model.overview_en, model.overview_fr,
+        model.genre_names_en, model.genre_names_fr,
+    ).all()
+    if rows:
+        database.execute(
+            text(f"INSERT INTO {table} (rowid, {', '.join(FTS_COLUMNS)}) VALUES (:rowid, :{', :'.join(FTS_COLUMNS)})"),
+            [fts_values(row) for row in rows],
+        )
+    return len(rows)
+
+
+# ─────────────────────────────────────────────
+# QUERIES
+
+def query_terms(user_input: str) -> list[str]:
+    """
+    Folded, stopword-free terms; plural "s" / "x" dropped so the prefix query matches both forms.
+    """
+    terms = [
+        term[:-1] if len(term) > 4 and term[-1] in "sx" else term
+        for term in fold_text(user_input).split() if len(term) > 2 and term not in QUERY_STOPWORDS
+    ]
+    return list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+
+
+def match_expression(terms: list[str], operator: str) -> str:
+    # Quoted terms cannot be read as FTS5 syntax; a trailing * also matches plurals / longer forms
+    return f" {operator} ".join(f'"{term}"*' for term in terms)
+
+
+@traced
+def search_by_description(
+    media_type: str, user_input: str, database: Session, limit: int = 30, match_all: bool = False
+) -> list[int]:
+    """
+    TMDB IDs whose title / overview / genres match a free-form description, best BM25 first.
+    `match_all` keeps only titles matching every term; otherwise any term is enough.
+    """
+    terms = query_terms(user_input)
+    if not terms or not fts_table_exists(database.connection(), media_type):
+        return []
+
+    table = FTS_TABLES[media_type]
+    weights = ", ".join(str(weight) for weight in DESCRIPTION_WEIGHTS)
+    rows = database.execute(
+        text(f"SELECT rowid FROM {table} WHERE {table} MATCH :query ORDER BY bm25({table}, {weights}) LIMIT :limit"),
+        {"query": match_expression(terms, "AND" if match_all else "OR"), "limit": limit},
+    ).scalars().all()
+    return list(rows)
+
+
+def rank_title_matches(rows: list, query: str) -> list[int]:
+    """
+    Match quality first (exact title, title prefix, all words whole, word prefixes), then popularity (IMDb votes).
+    """
+    def quality(row) -> int:
+        best = 0
+        for title in (fold_text(row.title_en or ""), fold_text(row.title_fr or "")):
+            if title == query:
+                return 3
+            if title.startswith(query):
+                best = max(best, 2)
+            elif set(query.split()) <= set(title.split()):
+                best = max(best, 1)
+        return best
+
+    ranked = sorted(rows, key=lambda row: (quality(row), row.imdb_votes_count or 0), reverse=True)
+    return [row.tmdb_id for row in ranked]
+
+
+def match_titles(media_type: str, terms: list[str], database: Session, limit: int) -> list[int]:
+    model = {"movie": CachedMovie, "tv": CachedTvShow}[media_type]
+    table = FTS_TABLES[media_type]
+    weights = ", ".join(str(weight) for weight in TITLE_WEIGHTS)
+    candidate_ids = database.execute(
+        text(f"SELECT rowid FROM {table} WHERE {table} MATCH :query ORDER BY bm25({table}, {weights}) LIMIT :limit"),
+        {"query": f"{{title_en title_fr}} : ({match_expression(terms, 'AND')})", "limit": TITLE_CANDIDATES},
+    ).scalars().all()
+    if not candidate_ids:
+        return []
+
+    rows = database.query(model.tmdb_id, model.title_en, model.title_fr, model.imdb_votes_count).filter(
+        model.tmdb_id.in_(candidate_ids)
+    ).all()
+    return rank_title_matches(rows, " ".join(terms))[:limit]
+
+
+@traced
+def search_by_title(media_type: str, keywords: str, database: Session, limit: int = 20) -> list[int]:
+    """
+    Local keyword search over EN / FR titles: every word must start a word of the title (accents and case ignored).
+    Retries without request words ("find the movie …") when the raw keywords match nothing.
+    """
+    if not fts_table_exists(database.connection(), media_type):
+        return []
+
+    terms = list(dict.fromkeys(fold_text(keywords).split()))[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+    tmdb_ids = match_titles(media_type, terms, database, limit)
+
+    stripped = [term for term in terms if term not in TITLE_REQUEST_WORDS]
+    if not tmdb_ids and stripped and stripped != terms:
+        tmdb_ids = match_titles(media_type, stripped, database, limit)
+    return tmdb_ids
+
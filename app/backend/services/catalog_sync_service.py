@@ -0,0 +1,133 @@
+import logging
+from datetime import date, timedelta
+from functools import partial
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.backend.core.executor import run_in_io_pool
+from app.backend.core.tmdb_client import call_tmdb_changes_endpoint
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.sync_state_model import SyncWatermark
+from app.backend.models.sync_retry_model import SyncRetry
+from app.backend.services.movie_service import enrich_and_cache_one_movie
+from app.backend.services.tvshow_service import enrich_and_cache_one_tvshow
+
+logger = logging.getLogger(__name__)
+
+# TMDB rejects change windows longer than 14 days
+MAX_CHANGES_WINDOW_DAYS = 14
+# First run without a watermark: only look back one day
+DEFAULT_LOOKBACK_DAYS = 1
+# A title still failing after this many syncs (e.g. removed from TMDB) no longer holds the watermark back
+MAX_REFRESH_ATTEMPTS = 3
+
+SYNC_TARGETS = {
+    "movie": (CachedMovie, enrich_and_cache_one_movie),
+    "tv": (CachedTvShow, enrich_and_cache_one_tvshow),
+}
+
+
+def watermark_name(media_type: str) -> str:
+    return f"tmdb_changes:{media_type}"
+
+
+def get_watermark(media_type: str, database: Session) -> Optional[date]:
+    row = database.get(SyncWatermark, watermark_name(media_type))
+    return row.watermark if row else None
+
+
+def set_watermark(media_type: str, value: date, database: Session):
+    row = database.get(SyncWatermark, watermark_name(media_type))
+    if row:
+        row.watermark = value
+    else:
+        database.add(SyncWatermark(name=watermark_name(media_type), watermark=value))
+    database.commit()
+
+
+def record_failed_refreshes(media_type: str, failed_ids: list[int], database: Session) -> list[int]:
+    """
+    Replaces the retry list with this run's failures. Returns the ids still under MAX_REFRESH_ATTEMPTS.
+    """
+    previous = {
+        row.tmdb_id: row.attempts
+        for row in database.query(SyncRetry).filter(SyncRetry.media_type == media_type)
+    }
+    database.query(SyncRetry).filter(SyncRetry.media_type == media_type).delete()
+
+    retrying = []
+    for tmdb_id in failed_ids:
+        attempts = previous.get(tmdb_id, 0) + 1
+        if attempts >= MAX_REFRESH_ATTEMPTS:
+            logger.error("Giving up refreshing %s %s after %s failed syncs", media_type, tmdb_id, attempts)
+            continue
+        database.add(SyncRetry(media_type=media_type, tmdb_id=tmdb_id, attempts=attempts))
+        retrying.append(tmdb_id)
+    database.commit()
+    return retrying
+
+
+def fetch_changed_tmdb_ids(media_type: str, start: date, end: date) -> set[int]:
+    """
+    Reads the TMDB changes feed between two dates, walking 14-day windows and all pages.
+    """
+    changed_ids = set()
+    window_start = start
+
+    while window_start <= end:
+        window_end = min(window_start + timedelta(days=MAX_CHANGES_WINDOW_DAYS - 1), end)
+        page, total_pages = 1, 1
+
+        while page <= total_pages:
+            payload = call_tmdb_changes_endpoint(media_type, window_start.isoformat(), window_end.isoformat(), page)
+            changed_ids.update(item["id"] for item in payload.get("results", []) if not item.get("adult"))
+            total_pages = payload.get("total_pages", 1)
+            page += 1
+
+        window_start = window_end + timedelta(days=1)
+
+    return changed_ids
+
+
+def sync_media_changes(media_type: str, database: Session, today: Optional[date] = None) -> dict:
+    """
+    Re-enriches only the cached rows that TMDB reports as changed since the last watermark,
+    plus the ones whose refresh failed last time. The watermark moves to today only when
+    every refresh succeeded; failures are recorded in sync_retries for the next run.
+    """
+    today = today or date.today()
+    model, enrich_one = SYNC_TARGETS[media_type]
+
+    start = get_watermark(media_type, database) or today - timedelta(days=DEFAULT_LOOKBACK_DAYS)
+    changed_ids = fetch_changed_tmdb_ids(media_type, start, today)
+
+    # Only titles we actually cache are worth refreshing
+    cached_ids = [
+        row.tmdb_id
+        for row in database.query(model.tmdb_id).filter(model.tmdb_id.in_(changed_ids))
+    ] if changed_ids else []
+    retry_ids = [row.tmdb_id for row in database.query(SyncRetry.tmdb_id).filter(SyncRetry.media_type == media_type)]
+    refresh_ids = list(dict.fromkeys(cached_ids + retry_ids))
+
+    refreshed = run_in_io_pool(partial(enrich_one, force_refresh=True), refresh_ids)
+    failed_ids = [tmdb_id for tmdb_id, ok in zip(refresh_ids, refreshed) if not ok]
+
+    retrying = record_failed_refreshes(media_type, failed_ids, database)
+    if not retrying:
+        set_watermark(media_type, today, database)
+
+    summary = {
+        "media_type": media_type,
+        "since": start.isoformat(),
+        "until": today.isoformat(),
+        "changed": len(changed_ids),
+        "refreshed": len(refresh_ids) - len(failed_ids),
+        "failed": failed_ids,
+        "watermark_advanced": not retrying,
+    }
+    if failed_ids:
+        logger.warning("Catalog sync done with failures: %s", summary)
+    else:
+        logger.info("Catalog sync done: %s", summary)
+    return summary
@@ -1,10 +1,14 @@
+import logging
+
 from sqlalchemy.orm import Session
-from app.backend.models.user_model import User
+from app.backend.core.auth_cache import Principal
 from app.backend.schemas.chat_schemas import ChatQuery, ChatResponse
 from typing import Optional
 
 from app.backend.core.openai_client import get_openai_completion
-from app.backend.services.session_service import get_or_create_chat_session
+from app.backend.core.tracing import traced
+from app.backend.services.chat_session_store import get_chat_session_store
+from app.backend.services.intent_classifier_service import classify_intent_locally
 
 from app.backend.services.movie_service import (
     recommend_movies_by_filters, 
@@ -21,30 +25,56 @@ from app.backend.services.tvshow_service import(
 
 from app.backend.services.llm_service import parse_filters_from_conversation
 
-from app.backend.core.config import CHAT_INTENT_CONFIG
+from app.backend.core.config import CHAT_INTENT_CONFIG, INTENT_LABEL_LOGGING
 import json
 
+logger = logging.getLogger(__name__)
+
 
-def process_chat_query(payload: ChatQuery, user: User, database: Session, language: str) -> ChatResponse:
+@traced
+def process_chat_query(payload: ChatQuery, user: Principal, database: Session, language: str) -> ChatResponse:
     """
     Main entry point for processing a chat query from the frontend.
     Determines the user’s intent and routes the query accordingly.
     """
 
-    # 1. Get or create chat session
-    chat_session = get_or_create_chat_session(user.id, payload.session_id, database)
+    # 1. Get or create chat session (in memory; persisted by the write-behind flusher)
+    sessions = get_chat_session_store()
+    chat_session = sessions.get_or_load(user.id, payload.session_id, database)
 
     # 2. Append user's message to session
-    chat_session.conversation.append({"role": "user", "content": payload.query})
-
-    # 3. Prune to last 2 exchanges (max 4 messages)
-    pruned_conversation = chat_session.conversation[-4:]
-
-    # 4. Classify intent using LLM
-    try:
-        intent, media_type, msg_for_user = answer_and_classify_user_intent(pruned_conversation, getattr(payload, "media_type", None))
-    except Exception:
-        return ChatResponse(message="Internal server error while understanding your request.")
+    sessions.append(chat_session, "user", payload.query, database)
+
+    # 3. Last 2 exchanges (max 4 messages), straight from the cached window
+    pruned_conversation = list(chat_session.recent)
+
+    # 4. Classify intent: the local model when it is confident, the LLM otherwise.
+    #    The local model only sees the message, so follow-ups that lean on the previous turn go to the LLM.
+    selected_media_type = getattr(payload, "media_type", None)
+    opening_turn = sum(message["role"] == "user" for message in pruned_conversation) == 1
+    local = None
+    if opening_turn:
+        local = classify_intent_locally(payload.query, selected_media_type, chat_session.media_type, language)
+    if local:
+        intent, media_type, msg_for_user = local
+    else:
+        try:
+            intent, media_type, msg_for_user = answer_and_classify_user_intent(pruned_conversation, selected_media_type)
+        except Exception:
+            return ChatResponse(message="Internal server error while understanding your request.")
+        # Training labels for the local model (scripts/train_intent_classifier reads them from JSON logs)
+        if INTENT_LABEL_LOGGING and opening_turn:
+            logger.info("Chat intent classified", extra={
+                "source": "llm", "query": payload.query, "intent": intent,
+                "media_type": media_type, "selected_media_type": selected_media_type,
+            })
+
+    # Keep the assistant's reply so the next turn sees the whole exchange
+    sessions.append(chat_session, "assistant", msg_for_user, database)
+
+    # Follow-ups without an explicit media type ("more like that") stay on the previous one
+    media_type = media_type or chat_session.media_type
+    chat_session.media_type = media_type
 
     # 5. Route by intent
     match intent:
@@ -83,6 +113,7 @@ def process_chat_query(payload: ChatQuery, user: User, database: Session, langua
     return ChatResponse(message="Something went wrong. Please try again.")
 
 
+@traced
 def answer_and_classify_user_intent(conversation: list[dict], media_type: Optional[str]):
     """
     Calls the OpenAI LLM to classify the user intent and optionally extract filters.
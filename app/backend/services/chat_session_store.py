@@ -0,0 +1,260 @@
+import logging
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.backend.core.config import (
+    CHAT_SESSION_CACHE_SIZE, CHAT_FLUSH_INTERVAL_SECONDS, CHAT_FLUSH_BATCH_SIZE, CHAT_FLUSH_MAX_ATTEMPTS,
+)
+from app.backend.models.chat_session_model import ChatSession
+from app.backend.services.session_service import append_chat_message, get_recent_chat_messages
+
+logger = logging.getLogger(__name__)
+
+# Messages kept per session: what the intent / filter prompts see
+CHAT_HISTORY_WINDOW = 4
+
+
+@dataclass
+class ChatSessionState:
+    session_id: str
+    user_id: int
+    recent: deque = field(default_factory=lambda: deque(maxlen=CHAT_HISTORY_WINDOW))
+    media_type: Optional[str] = None
+
+
+class ChatSessionStore:
+    """
+    LRU of active chat sessions with write-behind persistence.
+    - Turns read and append against the in-memory window only.
+    - New sessions and messages are queued and written by a background thread
+      every `flush_interval` seconds (or sooner once `batch_size` writes are pending),
+      one transaction per session against the DB the request came from.
+    - Rows that violate constraints are dropped one by one; other failures are retried
+      up to `max_attempts` flushes, so a bad record never blocks the rest of the queue.
+    """
+
+    def __init__(self, max_sessions: int, flush_interval: float, batch_size: int, max_attempts: int = CHAT_FLUSH_MAX_ATTEMPTS):
+        self.max_sessions = max_sessions
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+        self._sessions: OrderedDict[str, ChatSessionState] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # (bind, kind, payload, attempts) in arrival order; kind is "session" or "message"
+        self._pending: list = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="chat-session-writer", daemon=True)
+        self._worker.start()
+
+
+    # ─────────────────────────────────────────────
+    # HOT PATH
+
+    def get_or_load(self, user_id: int, session_id: str, database: Session) -> ChatSessionState:
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is not None:
+                self._sessions.move_to_end(session_id)
+
+        if state is None:
+            state = self._load(user_id, session_id, database)
+
+        if state.user_id != user_id:
+            raise RuntimeError(f"Failed to create chat session: {session_id} belongs to another user")
+        return state
+
+
+    def append(self, state: ChatSessionState, role: str, content: str, database: Session):
+        state.recent.append({"role": role, "content": content})
+        self._enqueue(database, "message", (state.session_id, role, content))
+
+
+    # ─────────────────────────────────────────────
+    # LOADING (cache miss only)
+
+    def _load(self, user_id: int, session_id: str, database: Session) -> ChatSessionState:
+        # An evicted session may still have queued messages: persist them before reading back
+        if self._has_pending(session_id):
+            self.flush()
+
+        row = database.get(ChatSession, session_id)
+        if row is None:
+            state = ChatSessionState(session_id=session_id, user_id=user_id)
+            self._enqueue(database, "session", (session_id, user_id, datetime.now()))
+        else:
+            state = ChatSessionState(session_id=session_id, user_id=row.user_id)
+            state.recent.extend(get_recent_chat_messages(session_id, database, limit=CHAT_HISTORY_WINDOW))
+
+        with self._lock:
+            state = self._sessions.setdefault(session_id, state)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return state
+
+
+    # ─────────────────────────────────────────────
+    # WRITE-BEHIND
+
+    def _enqueue(self, database: Session, kind: str, payload: tuple):
+        with self._pending_lock:
+            self._pending.append((database.get_bind(), kind, payload, 0))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+
+    def _has_pending(self, session_id: str) -> bool:
+        with self._pending_lock:
+            return any(payload[0] == session_id for _, _, payload, _ in self._pending)
+
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+    def flush(self) -> int:
+        """
+        Writes everything queued so far. Returns the number of records written.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            # payload[0] is the session id for both kinds
+            sessions: dict = {}
+            for bind, kind, payload, attempts in batch:
+                sessions.setdefault((bind, payload[0]), []).append((kind, payload, attempts))
+
+            written, retry = 0, []
+            for (bind, session_id), records in sessions.items():
+                count, failed = self._write(bind, session_id, records)
+                written += count
+                retry.extend((bind, kind, payload, attempts) for kind, payload, attempts in failed)
+
+            # Back at the head, so a session's retried messages stay ahead of its newer ones
+            if retry:
+                with self._pending_lock:
+                    self._pending[:0] = retry
+            return written
+
+
+    def _write(self, bind, session_id: str, records: list) -> tuple[int, list]:
+        """
+        Writes one session's records in one transaction. Returns (records written, records to retry).
+        """
+        database = Session(bind=bind, autoflush=False)
+        try:
+            try:
+                self._insert(database, records)
+                database.commit()
+                return len(records), []
+            except IntegrityError:
+                database.rollback()
+                logger.warning("Chat flush for session %s hit a constraint, writing its records one by one", session_id)
+            except Exception:
+                database.rollback()
+                logger.exception("Chat flush failed for session %s", session_id)
+                return 0, self._retryable(session_id, records)
+
+            written, retry = 0, []
+            for record in records:
+                try:
+                    self._insert(database, [record])
+                    database.commit()
+                    written += 1
+                except IntegrityError:
+                    database.rollback()
+                    logger.exception("Dropping chat %s of session %s that violates constraints", record[0], session_id)
+                except Exception:
+                    database.rollback()
+                    logger.exception("Chat flush failed for a %s of session %s", record[0], session_id)
+                    retry.extend(self._retryable(session_id, [record]))
+            return written, retry
+        finally:
+            database.close()
+
+
+    @staticmethod
+    def _insert(database: Session, records: list):
+        new_sessions = [
+            {"id": sid, "user_id": uid, "created_on": created_on}
+            for kind, (sid, uid, created_on), _ in records if kind == "session"
+        ]
+        if new_sessions:
+            database.execute(insert(ChatSession).values(new_sessions).on_conflict_do_nothing())
+
+        for kind, payload, _ in records:
+            if kind == "message":
+                session_id, role, content = payload
+                append_chat_message(session_id, role, content, database, commit=False)
+
+
+    def _retryable(self, session_id: str, records: list) -> list:
+        retry = [(kind, payload, attempts + 1) for kind, payload, attempts in records if attempts + 1 < self.max_attempts]
+        if len(retry) < len(records):
+            logger.error(
+                "Dropping %s chat records of session %s after %s failed flushes",
+                len(records) - len(retry), session_id, self.max_attempts,
+            )
+        return retry
+
+
+    def shutdown(self):
+        """
+        Stops the writer thread and flushes whatever is still queued.
+        """
+        self._stopped.set()
+        self._wake.set()
+        self._worker.join(timeout=self.flush_interval + 5)
+        written = self.flush()
+        logger.info("Chat session store flushed %s pending records at shutdown", written)
+
+
+    def stats(self) -> dict:
+        with self._lock, self._pending_lock:
+            return {"sessions": len(self._sessions), "pending_writes": len(self._pending)}
+
+
+
+# ─────────────────────────────────────────────
+# APPLICATION-SCOPED INSTANCE
+_store: Optional[ChatSessionStore] = None
+_store_lock = threading.Lock()
+
+
+def start_chat_session_store() -> ChatSessionStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ChatSessionStore(CHAT_SESSION_CACHE_SIZE, CHAT_FLUSH_INTERVAL_SECONDS, CHAT_FLUSH_BATCH_SIZE)
+        return _store
+
+
+def get_chat_session_store() -> ChatSessionStore:
+    return _store or start_chat_session_store()
+
+
+def shutdown_chat_session_store():
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.shutdown()
+            _store = None
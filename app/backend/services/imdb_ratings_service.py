@@ -0,0 +1,131 @@
+import csv
+import gzip
+import io
+import logging
+from datetime import date
+from pathlib import Path
+from typing import IO, Iterator, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.backend.core.omdb_client import call_omdb_client
+from app.backend.models.imdb_rating_model import ImdbRating
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.services.card_cache import clear_card_cache
+from app.backend.services.version_service import bump_listing_library_versions, next_catalog_version
+
+logger = logging.getLogger(__name__)
+
+IMDB_RATINGS_URL = "https://datasets.imdbws.com/title.ratings.tsv.gz"
+IMPORT_CHUNK_SIZE = 5000
+
+
+def read_ratings_rows(stream: IO[bytes]) -> Iterator[dict]:
+    """
+    Streams (tconst, averageRating, numVotes) rows from a title.ratings TSV byte stream.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    reader = csv.reader(text, delimiter="\t", quoting=csv.QUOTE_NONE)
+    header = next(reader, None)
+    if header != ["tconst", "averageRating", "numVotes"]:
+        raise ValueError(f"Unexpected title.ratings header: {header}")
+
+    for tconst, rating, votes in reader:
+        yield {"imdb_id": tconst, "imdb_rating": float(rating), "imdb_votes_count": int(votes)}
+
+
+def open_ratings_file(path: Path) -> IO[bytes]:
+    """
+    Opens a local title.ratings dump, gzipped (.gz) or plain.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def upsert_ratings_chunk(rows: list[dict], database: Session):
+    statement = insert(ImdbRating).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ImdbRating.imdb_id],
+        set_={
+            "imdb_rating": statement.excluded.imdb_rating,
+            "imdb_votes_count": statement.excluded.imdb_votes_count,
+            "import_date": statement.excluded.import_date,
+        },
+    )
+    database.execute(statement)
+    database.commit()
+
+
+def import_imdb_ratings(stream: IO[bytes], database: Session, chunk_size: int = IMPORT_CHUNK_SIZE) -> int:
+    """
+    Loads the whole dump into `imdb_ratings` in fixed-size chunks (constant memory).
+    Returns the number of rows read.
+    """
+    today = date.today()
+    chunk = []
+    total = 0
+
+    for row in read_ratings_rows(stream):
+        row["import_date"] = today
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            upsert_ratings_chunk(chunk, database)
+            total += len(chunk)
+            chunk = []
+
+    if chunk:
+        upsert_ratings_chunk(chunk, database)
+        total += len(chunk)
+
+    logger.info("Imported %s IMDb ratings", total)
+    return total
+
+
+def apply_imdb_ratings_to_cache(database: Session) -> dict:
+    """
+    Copies ratings and vote counts onto every cached movie / TV show that has
+    a match in `imdb_ratings`, one UPDATE statement per table.
+    """
+    updated = {}
+    for media_type, model in (("movie", CachedMovie), ("tv", CachedTvShow)):
+        match = ImdbRating.imdb_id == model.imdb_id
+        rated = model.imdb_id.in_(select(ImdbRating.imdb_id))
+        statement = (
+            update(model)
+            .where(rated)
+            .values(
+                imdb_rating=select(ImdbRating.imdb_rating).where(match).scalar_subquery(),
+                imdb_votes_count=select(ImdbRating.imdb_votes_count).where(match).scalar_subquery(),
+                cache_update_date=date.today(),
+                row_version=next_catalog_version(database.connection(), media_type),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        updated[media_type] = database.execute(statement).rowcount
+        # The bulk UPDATE skips the row-version listeners, so stale the listing users' libraries here
+        bump_listing_library_versions(database.connection(), media_type, select(model.tmdb_id).where(rated))
+
+    database.commit()
+    # Bulk UPDATEs skip the ORM events that evict single cards
+    clear_card_cache()
+    logger.info("Applied IMDb ratings to cached rows: %s", updated)
+    return updated
+
+
+def get_imdb_rating_and_votes(imdb_id: str, database: Session) -> Tuple[float, int]:
+    """
+    Reads rating and vote count from the local IMDb dump, falling back to OMDB
+    only for titles missing from it.
+    """
+    local = database.get(ImdbRating, imdb_id)
+    if local:
+        return local.imdb_rating, local.imdb_votes_count
+
+    imdb_data = call_omdb_client(imdb_id)
+    return (
+        float(imdb_data.get("imdb_rating") or 0),
+        int(imdb_data.get("imdb_votes_count", "0").replace(",", "")),
+    )
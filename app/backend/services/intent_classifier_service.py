@@ -0,0 +1,212 @@
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from app.backend.core.config import INTENT_LOCAL_THRESHOLD, INTENT_MODEL_PATH
+from app.backend.core.tracing import traced
+from app.backend.utils.utils import ROOT_DIR, fold_text, read_json, save_json
+
+# Intents the local model may answer; greetings / unclear requests ("error") always go to the LLM
+LOCAL_INTENTS = ("exact_title", "similar_media", "filters_parsing", "free_description_suggestion")
+MEDIA_LABELS = ("movie", "tv", "none")
+
+NGRAM_SIZES = (2, 3, 4)
+MAX_INPUT_CHARS = 300
+
+# Weights smaller than this are dropped from the saved model
+PRUNE_BELOW = 1e-3
+
+# Confirmation shown instead of the LLM's message_to_user when the local model answers
+LOCAL_MESSAGES = {
+    "en": {
+        "exact_title": "Here is what I found for that title.",
+        "similar_media": "Here are some {media} similar to that one.",
+        "filters_parsing": "Here are some {media} matching your criteria.",
+        "free_description_suggestion": "Here are some {media} that fit your description.",
+        "media": {"movie": "movies", "tv": "TV shows"},
+    },
+    "fr": {
+        "exact_title": "Voici ce que j'ai trouvé pour ce titre.",
+        "similar_media": "Voici des {media} similaires.",
+        "filters_parsing": "Voici des {media} qui correspondent à vos critères.",
+        "free_description_suggestion": "Voici des {media} qui correspondent à votre description.",
+        "media": {"movie": "films", "tv": "séries"},
+    },
+}
+
+
+# ─────────────────────────────────────────────
+# FEATURES
+
+def text_features(text: str) -> dict[str, float]:
+    """
+    Unit-length counts of folded character 2-4 grams, whole words ("w:") and a word-count bucket ("len:").
+    """
+    folded = fold_text(text[:MAX_INPUT_CHARS])
+    words = folded.split()
+    counts = Counter(f"w:{word}" for word in words)
+    counts[f"len:{min(len(words), 8)}"] += 1
+
+    padded = f" {folded} "
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            counts[padded[start:start + size]] += 1
+
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    return {feature: count / norm for feature, count in counts.items()}
+
+
+# ─────────────────────────────────────────────
+# MODEL
+
+@dataclass
+class LinearModel:
+    """
+    Multinomial logistic regression over sparse text features: feature → one weight per label.
+    """
+    labels: list[str]
+    weights: dict[str, list[float]] = field(default_factory=dict)
+    bias: list[float] = field(default_factory=list)
+
+    def probabilities(self, text: str) -> list[float]:
+        return self.feature_probabilities(text_features(text))
+
+    def feature_probabilities(self, feats: dict[str, float]) -> list[float]:
+        scores = list(self.bias) or [0.0] * len(self.labels)
+        for feature, value in feats.items():
+            row = self.weights.get(feature)
+            if row:
+                for k, weight in enumerate(row):
+                    scores[k] += value * weight
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def predict(self, text: str) -> tuple[str, float]:
+        probabilities = self.probabilities(text)
+        best = max(range(len(self.labels)), key=probabilities.__getitem__)
+        return self.labels[best], probabilities[best]
+
+    def to_dict(self) -> dict:
+        weights = {
+            feature: [round(weight, 4) for weight in row]
+            for feature, row in self.weights.items() if max(abs(weight) for weight in row) >= PRUNE_BELOW
+        }
+        return {"labels": self.labels, "bias": [round(b, 4) for b in self.bias], "weights": weights}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LinearModel":
+        return cls(labels=data["labels"], weights=data["weights"], bias=data["bias"])
+
+
+def train_linear_model(
+    examples: list[tuple[str, str]], labels: Optional[list[str]] = None,
+    epochs: int = 15, learning_rate: float = 0.5, l2: float = 1e-4, seed: int = 7,
+) -> LinearModel:
+    """
+    Fits a LinearModel on (text, label) pairs with plain SGD on the log loss.
+    The L2 penalty is applied to the weights of the features each example touches.
+    """
+    labels = labels or sorted({label for _, label in examples})
+    index = {label: k for k, label in enumerate(labels)}
+    model = LinearModel(labels=list(labels), bias=[0.0] * len(labels))
+    samples = [(text_features(text), index[label]) for text, label in examples if label in index]
+
+    rng = random.Random(seed)
+    for epoch in range(epochs):
+        rng.shuffle(samples)
+        rate = learning_rate / (1 + 0.2 * epoch)
+        for feats, target in samples:
+            probabilities = model.feature_probabilities(feats)
+            gradient = [p - (k == target) for k, p in enumerate(probabilities)]
+
+            for k, g in enumerate(gradient):
+                model.bias[k] -= rate * g
+            for feature, value in feats.items():
+                row = model.weights.setdefault(feature, [0.0] * len(labels))
+                for k, g in enumerate(gradient):
+                    row[k] -= rate * (g * value + l2 * row[k])
+    return model
+
+
+@dataclass
+class LocalIntent:
+    intent: str
+    media_type: str
+    confidence: float
+
+
+@dataclass
+class IntentClassifier:
+    """
+    Intent model (CHAT_INTENT labels) + media type model ("movie" / "tv" / "none" when the message does not say).
+    """
+    intent_model: LinearModel
+    media_model: LinearModel
+
+    def classify(
+        self, query: str, selected_media_type: Optional[str] = None, session_media_type: Optional[str] = None,
+        threshold: float = INTENT_LOCAL_THRESHOLD,
+    ) -> Optional[LocalIntent]:
+        """
+        The intent when the model is confident enough to skip the LLM, else None.
+        Media type: the user's selection, else a confident prediction from the message, else the session's.
+        """
+        intent, confidence = self.intent_model.predict(query)
+        if intent not in LOCAL_INTENTS or confidence < threshold:
+            return None
+
+        media_type = selected_media_type
+        if not media_type:
+            predicted, media_confidence = self.media_model.predict(query)
+            if predicted != "none" and media_confidence >= threshold:
+                media_type = predicted
+            else:
+                media_type = session_media_type
+        if media_type not in ("movie", "tv"):
+            return None
+        return LocalIntent(intent, media_type, confidence)
+
+    def save(self, path: Path):
+        save_json(path, {"intent": self.intent_model.to_dict(), "media_type": self.media_model.to_dict()})
+
+    @classmethod
+    def load(cls, path: Path) -> "IntentClassifier":
+        data = read_json(path)
+        return cls(LinearModel.from_dict(data["intent"]), LinearModel.from_dict(data["media_type"]))
+
+
+def model_path() -> Path:
+    path = Path(INTENT_MODEL_PATH)
+    return path if path.is_absolute() else ROOT_DIR / path
+
+
+# Loaded once; no model file → every turn goes to the LLM
+@lru_cache(maxsize=1)
+def get_intent_classifier() -> Optional[IntentClassifier]:
+    path = model_path()
+    return IntentClassifier.load(path) if path.exists() else None
+
+
+@traced
+def classify_intent_locally(
+    query: str, selected_media_type: Optional[str], session_media_type: Optional[str], language: str
+) -> Optional[tuple[str, str, str]]:
+    """
+    (intent, media_type, message_to_user) from the local model, or None to ask the LLM.
+    """
+    classifier = get_intent_classifier()
+    if classifier is None:
+        return None
+    local = classifier.classify(query, selected_media_type, session_media_type)
+    if local is None:
+        return None
+
+    messages = LOCAL_MESSAGES.get(language, LOCAL_MESSAGES["en"])
+    message = messages[local.intent].format(media=messages["media"][local.media_type])
+    return local.intent, local.media_type, message
@@ -0,0 +1,165 @@
+import csv
+import logging
+import time
+from typing import IO, Iterable, Iterator, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.backend.core.config import LIBRARY_IMPORT_CHUNK_SIZE
+from app.backend.core.executor import run_in_io_pool
+from app.backend.core.tmdb_client import call_tmdb_find_by_imdb_id_endpoint, call_tmdb_media_id_by_media_name_endpoint
+from app.backend.core.tracing import traced
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.services.movie_service import enrich_and_cache_one_movie
+from app.backend.services.tvshow_service import enrich_and_cache_one_tvshow
+from app.backend.services.user_media_service import apply_user_media_statuses
+
+logger = logging.getLogger(__name__)
+
+# IMDb "Title Type" values that are TV shows (everything else is imported as a movie)
+IMDB_TV_TITLE_TYPES = {"tvSeries", "tvMiniSeries", "TV Series", "TV Mini Series"}
+
+
+# ─────────────────────────────────────────────
+# PARSING (IMDb ratings / watchlist exports, Letterboxd watched / ratings / watchlist exports)
+
+def detect_export_format(header: list[str]) -> str:
+    if "Const" in header:
+        return "imdb"
+    if "Name" in header and "Year" in header:
+        return "letterboxd"
+    raise ValueError(f"Unrecognized export header: {header}")
+
+
+def parse_year(value: Optional[str]) -> Optional[int]:
+    try:
+        return int((value or "").strip()[:4])
+    except ValueError:
+        return None
+
+
+def read_export_rows(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Streams {"source", "imdb_id", "media_type", "title", "year"} items from an export, one row at a time.
+    """
+    reader = csv.DictReader(lines)
+    source = detect_export_format(reader.fieldnames or [])
+
+    for row in reader:
+        if source == "imdb":
+            imdb_id = (row.get("Const") or "").strip()
+            if not imdb_id.startswith("tt"):
+                continue
+            yield {
+                "source": "imdb",
+                "imdb_id": imdb_id,
+                "media_type": "tv" if row.get("Title Type") in IMDB_TV_TITLE_TYPES else "movie",
+                "title": row.get("Title"),
+                "year": parse_year(row.get("Year")),
+            }
+        else:
+            title = (row.get("Name") or "").strip()
+            if not title:
+                continue
+            yield {"source": "letterboxd", "imdb_id": None, "media_type": "movie", "title": title, "year": parse_year(row.get("Year"))}
+
+
+# ─────────────────────────────────────────────
+# RESOLUTION (local catalog first, TMDB in parallel for the rest, cached as they resolve)
+
+@traced
+def resolve_export_rows(rows: list[dict], database: Session) -> list[Optional[tuple[str, int]]]:
+    """
+    (media_type, tmdb_id) per row, None when the title cannot be found. Keeps input order.
+    """
+    resolved: list[Optional[tuple[str, int]]] = [None] * len(rows)
+
+    imdb_ids = {row["imdb_id"] for row in rows if row["imdb_id"]}
+    by_imdb_id = {}
+    for media_type, model in (("movie", CachedMovie), ("tv", CachedTvShow)):
+        if imdb_ids:
+            for imdb_id, tmdb_id in database.query(model.imdb_id, model.tmdb_id).filter(model.imdb_id.in_(imdb_ids)):
+                by_imdb_id[imdb_id] = (media_type, tmdb_id)
+
+    titles = {row["title"].lower() for row in rows if not row["imdb_id"] and row["title"]}
+    by_title_year = {}
+    if titles:
+        matches = database.query(func.lower(CachedMovie.title_en), CachedMovie.release_year, CachedMovie.tmdb_id)
+        for title, year, tmdb_id in matches.filter(func.lower(CachedMovie.title_en).in_(titles)):
+            by_title_year.setdefault((title, year), ("movie", tmdb_id))
+
+    missing = []
+    for i, row in enumerate(rows):
+        if row["imdb_id"]:
+            resolved[i] = by_imdb_id.get(row["imdb_id"])
+        else:
+            resolved[i] = by_title_year.get((row["title"].lower(), row["year"]))
+        if resolved[i] is None:
+            missing.append(i)
+
+    if missing:
+        lookups = run_in_io_pool(lambda i: lookup_on_tmdb(rows[i]), missing)
+        for i, found in zip(missing, lookups):
+            resolved[i] = found
+
+    return resolved
+
+
+def lookup_on_tmdb(row: dict) -> Optional[tuple[str, int]]:
+    """
+    Resolves a row missing from the local catalog on TMDB, then enriches and caches the title in the same
+    worker, so it has a card and a stat snapshot once imported. None when unresolved or not cacheable.
+    """
+    if row["imdb_id"]:
+        found = call_tmdb_find_by_imdb_id_endpoint(row["imdb_id"])
+    else:
+        tmdb_id = call_tmdb_media_id_by_media_name_endpoint(row["media_type"], row["title"], row["year"])
+        found = (row["media_type"], tmdb_id) if tmdb_id else None
+    if found is None:
+        return None
+    enrich = enrich_and_cache_one_tvshow if found[0] == "tv" else enrich_and_cache_one_movie
+    return found if enrich(found[1]) else None
+
+
+# ─────────────────────────────────────────────
+# IMPORT
+
+@traced
+def import_library_export(
+    user_id: int,
+    stream: IO[str],
+    status: str,
+    database: Session,
+    chunk_size: int = LIBRARY_IMPORT_CHUNK_SIZE,
+) -> dict:
+    """
+    Imports an IMDb / Letterboxd CSV export into the user's library with `status`:
+    rows are read as a stream, resolved and upserted `chunk_size` at a time, one transaction per chunk.
+    Returns counts and throughput.
+    """
+    start = time.perf_counter()
+    report = {"rows": 0, "imported": 0, "unresolved": 0}
+    chunk = []
+
+    def flush():
+        resolved = resolve_export_rows(chunk, database)
+        items = [(media_type, tmdb_id, status) for media_type, tmdb_id in filter(None, resolved)]
+        apply_user_media_statuses(user_id, items, database)
+        report["imported"] += len(items)
+        report["unresolved"] += len(chunk) - len(items)
+        chunk.clear()
+
+    for row in read_export_rows(stream):
+        chunk.append(row)
+        report["rows"] += 1
+        if len(chunk) == chunk_size:
+            flush()
+    if chunk:
+        flush()
+
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    report["rows_per_second"] = round(report["rows"] / report["seconds"], 1) if report["seconds"] else None
+    logger.info("Library import for user %s: %s", user_id, report)
+    return report
@@ -1,6 +1,7 @@
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 
-from app.backend.core.openai_client import get_openai_completion
+from app.backend.core.openai_client import get_openai_completion, stream_openai_completion
+from app.backend.core.tracing import traced
 from app.backend.schemas.movie_schemas import MovieSearchFilters
 from app.backend.schemas.tvshow_schemas import TvShowSearchFilters
 from app.backend.core.config import (
@@ -8,11 +9,85 @@ from app.backend.core.config import (
     SIMILAR_TITLES_CONFIG,
     FREE_DESCRIPTION_CONFIG,
     FILTER_PARSING_CONFIG,
+    OPENAI_STREAMING,
 )
 
 import json
 
 
+# ─────────────────────────────────────────────
+# TITLE LISTS: streamed JSON arrays
+
+class JsonArrayParser:
+    """
+    Incremental parser for an LLM answer holding a JSON array of objects ([{"title": ..., "year": ...}, ...]).
+    `feed` takes the text as it arrives and returns the objects completed by it.
+    Code fences / text around the array are skipped, and so are objects that are not valid JSON.
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.current: list[str] = []
+
+    def feed(self, text: str) -> list[dict]:
+        items = []
+        for char in text:
+            if self.finished:
+                break
+            if not self.started:
+                self.started = char == "["
+                continue
+            if self.depth == 0:
+                if char == "{":
+                    self.depth, self.current = 1, [char]
+                elif char == "]":
+                    self.finished = True
+                continue
+
+            self.current.append(char)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        item = json.loads("".join(self.current))
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(item, dict):
+                        items.append(item)
+        return items
+
+
+def iter_titles_from_llm(messages: List[dict], prompt: str, temperature: float) -> Iterator[Dict]:
+    """
+    Yields each {"title", "year"} item of the LLM's JSON array as soon as it is complete.
+    With OPENAI_STREAMING off, the whole answer is fetched first and then parsed the same way.
+    """
+    if OPENAI_STREAMING:
+        pieces = stream_openai_completion(messages, prompt, temperature)
+    else:
+        pieces = [get_openai_completion(messages, prompt, temperature)]
+
+    parser = JsonArrayParser()
+    for piece in pieces:
+        yield from parser.feed(piece)
+
+
+@traced
 def parse_filters_from_conversation(
     conversation: List[dict],
     media_type: str
@@ -41,47 +116,31 @@ def parse_filters_from_conversation(
     return None
 
 
-def extract_movie_titles_with_llm(user_input: str) -> List[Dict]:
+def extract_movie_titles_with_llm(user_input: str) -> Iterator[Dict]:
     """
-    Extracts movie titles and release years from user input using LLM.
+    Extracts movie titles and release years from user input using LLM, yielded as they are generated.
     """
     messages = [{"role": "user", "content": user_input}]
     prompt = EXTRACT_TITLE_CONFIG["prompt"]["movie"]
     temperature = EXTRACT_TITLE_CONFIG["temperature"]
 
-    raw = get_openai_completion(messages, prompt, temperature)
-
-    if raw.startswith("```"):
-        raw = raw.strip("```json").strip("```").strip()
-
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        return []
+    return iter_titles_from_llm(messages, prompt, temperature)
 
 
-def extract_tvshow_titles_with_llm(user_input: str) -> List[Dict]:
+def extract_tvshow_titles_with_llm(user_input: str) -> Iterator[Dict]:
     """
-    Extracts TV show titles and release years from user input using LLM.
+    Extracts TV show titles and release years from user input using LLM, yielded as they are generated.
     """
     messages = [{"role": "user", "content": user_input}]
     prompt = EXTRACT_TITLE_CONFIG["prompt"]["tv"]
     temperature = EXTRACT_TITLE_CONFIG["temperature"]
 
-    raw = get_openai_completion(messages, prompt, temperature)
+    return iter_titles_from_llm(messages, prompt, temperature)
 
-    if raw.startswith("```"):
-        raw = raw.strip("```json").strip("```").strip()
 
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        return []
-
-
-def get_similar_titles_with_llm(media_type: str, user_input: str) -> List[Dict]:
+def get_similar_titles_with_llm(media_type: str, user_input: str) -> Iterator[Dict]:
     """
-    Uses LLM to suggest titles similar to a given reference movie or TV show.
+    Uses LLM to suggest titles similar to a given reference movie or TV show, yielded as they are generated.
     """
     messages = [
         {"role": "user", "content": user_input},
@@ -90,20 +149,13 @@ def get_similar_titles_with_llm(media_type: str, user_input: str) -> List[Dict]:
     prompt = SIMILAR_TITLES_CONFIG["prompt"]
     temperature = SIMILAR_TITLES_CONFIG["temperature"]
 
-    raw = get_openai_completion(messages, prompt, temperature)
-
-    if raw.startswith("```"):
-        raw = raw.strip("```json").strip("```").strip()
-
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        return []
+    return iter_titles_from_llm(messages, prompt, temperature)
 
 
-def get_titles_from_description_with_llm(media_type: str, user_input: str) -> List[Dict]:
+def get_titles_from_description_with_llm(media_type: str, user_input: str) -> Iterator[Dict]:
     """
-    Uses LLM to recommend titles based on free-form description (e.g. "slow burn, mind-bending sci-fi").
+    Uses LLM to recommend titles based on free-form description (e.g. "slow burn, mind-bending sci-fi"),
+    yielded as they are generated.
     """
     messages = [
         {"role": "user", "content": user_input},
@@ -112,12 +164,4 @@ def get_titles_from_description_with_llm(media_type: str, user_input: str) -> Li
     prompt = FREE_DESCRIPTION_CONFIG["prompt"]
     temperature = FREE_DESCRIPTION_CONFIG["temperature"]
 
-    raw = get_openai_completion(messages, prompt, temperature)
-
-    if raw.startswith("```"):
-        raw = raw.strip("```json").strip("```").strip()
-
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        return []
+    return iter_titles_from_llm(messages, prompt, temperature)
@@ -1,6 +1,8 @@
+import logging
 from sqlalchemy.orm import Session
 from app.backend.core.database import SessionLocal
 from datetime import date
+from typing import Collection, Iterable, Optional
 from app.backend.schemas.movie_schemas import MovieSearchFilters, MovieCard
 from app.backend.models.movie_model import CachedMovie
 from app.backend.models.user_media_model import UserMedia
@@ -9,7 +11,10 @@ from app.backend.core.tmdb_client import (
     call_tmdb_discover_media_endpoint,
     call_tmdb_media_details_endpoint,
     call_tmdb_media_videos_endpoint,
-    call_tmdb_media_id_by_media_name_endpoint,)
+    call_tmdb_media_id_by_media_name_endpoint,
+    build_poster_url,
+    poster_path_from_url,
+    DEFAULT_POSTER_SIZE,)
 
 from app.backend.services.llm_service import ( 
     get_similar_titles_with_llm, 
@@ -17,14 +22,22 @@ from app.backend.services.llm_service import (
     get_titles_from_description_with_llm
 
 )
-from app.backend.core.omdb_client import call_omdb_client
-from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from app.backend.services.imdb_ratings_service import get_imdb_rating_and_votes
+from app.backend.core.executor import run_in_io_pool
+from app.backend.core.tracing import traced
+from app.backend.services.card_cache import CardList
+from app.backend.services.similarity_service import find_similar_tmdb_ids
+from app.backend.services.catalog_search_service import search_by_description, search_by_title
+from app.backend.core.config import DESCRIPTION_LOCAL_MIN_RESULTS, DESCRIPTION_LOCAL_LIMIT
+from app.backend.services.affinity_service import AffinityVector, load_user_affinity, rank_by_affinity
 from sqlalchemy.exc import IntegrityError
 import traceback
 
+logger = logging.getLogger(__name__)
 
 
+
+@traced
 def fetch_excluded_ids(media_type: str, user_id: int, database: Session) -> set[int]:
     """
     Fetches a set of TMDB IDs for a given user and media type that are marked as
@@ -41,6 +54,7 @@ def fetch_excluded_ids(media_type: str, user_id: int, database: Session) -> set[
     return excluded_ids
 
 
+@traced
 def fetch_unseen_tmdb_ids(filters: MovieSearchFilters, user_id: int, database: Session) -> list[int]:
     """
     Fetch up to 50 TMDB movies that:
@@ -68,10 +82,44 @@ def fetch_unseen_tmdb_ids(filters: MovieSearchFilters, user_id: int, database: S
     return results
 
 
-def enrich_and_cache_one_movie(tmdb_id: int):
+@traced
+def fetch_movie_fields(tmdb_id: int, db: Session) -> dict:
+    """
+    Fetches everything needed to cache a movie from TMDB (EN/FR details, trailers)
+    and IMDb (rating, votes). Returns CachedMovie column values.
+    """
+    tmdb_details_en = call_tmdb_media_details_endpoint("movie", tmdb_id, "en")
+    tmdb_details_fr = call_tmdb_media_details_endpoint("movie", tmdb_id, "fr")
+    imdb_rating, imdb_votes_count = get_imdb_rating_and_votes(tmdb_details_en["imdb_id"], db)
+    genre_ids = [g["id"] for g in tmdb_details_en.get("genres", [])] or tmdb_details_en.get("genre_ids", [])
+
+    return dict(
+        imdb_id=tmdb_details_en["imdb_id"],
+        imdb_rating=imdb_rating,
+        imdb_votes_count=imdb_votes_count,
+        release_year=int(tmdb_details_en.get("release_date", "0000")[:4]),
+        poster_url=build_poster_url(tmdb_details_en.get("poster_path"), "original"),
+        poster_path=tmdb_details_en.get("poster_path"),
+        title_en=tmdb_details_en.get("title"),
+        title_fr=tmdb_details_fr.get("title"),
+        genre_ids=genre_ids,
+        genre_names_en=[map_id_to_genre("movie", "en", gid) for gid in genre_ids],
+        genre_names_fr=[map_id_to_genre("movie", "fr", gid) for gid in genre_ids],
+        trailer_url_en=call_tmdb_media_videos_endpoint("movie", tmdb_id, "en"),
+        trailer_url_fr=call_tmdb_media_videos_endpoint("movie", tmdb_id, "fr"),
+        overview_en=tmdb_details_en.get("overview"),
+        overview_fr=tmdb_details_fr.get("overview"),
+        cache_update_date=date.today(),
+    )
+
+
+@traced
+def enrich_and_cache_one_movie(tmdb_id: int, force_refresh: bool = False) -> bool:
     """
     Enrich a single movie with IMDb rating, vote count, trailer URLs,
     multilingual title/overview, and cache it into the DB.
+    `force_refresh` re-fetches all fields of an already cached movie (used by the changes sync).
+    Returns False when fetching or caching failed.
     Each thread has its own DB session (thread-safe).
     """
     db = SessionLocal()
@@ -81,59 +129,67 @@ def enrich_and_cache_one_movie(tmdb_id: int):
         freshly_cached = cached_movie and (date.today() - cached_movie.cache_update_date).days <= 7
 
         if cached_movie:
-            if not freshly_cached:
-                imdb_data = call_omdb_client(cached_movie.imdb_id)
-                cached_movie.imdb_rating = float(imdb_data.get("imdb_rating") or 0)
-                cached_movie.imdb_votes_count = int(imdb_data.get("imdb_votes_count", "0").replace(",", ""))
+            if force_refresh:
+                for field, value in fetch_movie_fields(tmdb_id, db).items():
+                    setattr(cached_movie, field, value)
+                db.commit()
+            elif not freshly_cached:
+                cached_movie.imdb_rating, cached_movie.imdb_votes_count = get_imdb_rating_and_votes(cached_movie.imdb_id, db)
                 cached_movie.cache_update_date = date.today()
                 db.commit()
         else:
-            tmdb_details_en = call_tmdb_media_details_endpoint("movie", tmdb_id, "en")
-            tmdb_details_fr = call_tmdb_media_details_endpoint("movie", tmdb_id, "fr")
-            imdb_data = call_omdb_client(tmdb_details_en["imdb_id"])
-            genre_ids = tmdb_details_en.get("genre_ids", [])
-
-            new_movie = CachedMovie(
-                tmdb_id=tmdb_id,
-                imdb_id=tmdb_details_en["imdb_id"],
-                imdb_rating=float(imdb_data.get("imdb_rating") or 0),
-                imdb_votes_count=int(imdb_data.get("imdb_votes_count", "0").replace(",", "")),
-                release_year=int(tmdb_details_en.get("release_date", "0000")[:4]),
-                poster_url=(f"https://image.tmdb.org/t/p/original{tmdb_details_en.get('poster_path')}" if tmdb_details_en.get("poster_path") else None),
-                title_en=tmdb_details_en.get("title"),
-                title_fr=tmdb_details_fr.get("title"),
-                genre_ids=genre_ids,
-                genre_names_en=[map_id_to_genre("movie", "en", gid) for gid in genre_ids],
-                genre_names_fr=[map_id_to_genre("movie", "fr", gid) for gid in genre_ids],
-                trailer_url_en=call_tmdb_media_videos_endpoint("movie", tmdb_id, "en"),
-                trailer_url_fr=call_tmdb_media_videos_endpoint("movie", tmdb_id, "fr"),
-                overview_en=tmdb_details_en.get("overview"),
-                overview_fr=tmdb_details_fr.get("overview"),
-                cache_update_date=date.today(),
-            )
+            new_movie = CachedMovie(tmdb_id=tmdb_id, **fetch_movie_fields(tmdb_id, db))
 
             try:
                 db.add(new_movie)
                 db.commit()
             except IntegrityError:
+                # Cached concurrently by another task
                 db.rollback()
+        return True
     except Exception:
+        logger.exception("Failed to enrich movie %s", tmdb_id)
         db.rollback()
+        return False
     finally:
         db.close()
 
 
+@traced
 def enrich_and_cache_movies(tmdb_ids: list[int]) -> None:
     """
-    Enrich and cache a list of TMDB movie IDs in parallel.
-    Each thread manages its own DB session.
+    Enrich and cache a list of TMDB movie IDs in parallel on the shared I/O executor.
+    Each task manages its own DB session.
     """
-    task = partial(enrich_and_cache_one_movie)
+    run_in_io_pool(enrich_and_cache_one_movie, tmdb_ids)
+
 
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        executor.map(task, tmdb_ids)
+def resolve_and_cache_one_movie(item: dict, excluded_ids: Collection[int] = ()) -> Optional[int]:
+    """
+    Resolves one LLM-suggested {"title", "year"} item to a TMDB ID, then enriches and caches that movie
+    in the same worker: no task submits to the pool it runs on. None when unresolved or excluded.
+    """
+    if not isinstance(item.get("title"), str):
+        return None
+    tmdb_id = call_tmdb_media_id_by_media_name_endpoint("movie", item["title"], item.get("year"))
+    if tmdb_id is None or tmdb_id in excluded_ids:
+        return None
+    enrich_and_cache_one_movie(tmdb_id)
+    return tmdb_id
 
 
+@traced
+def resolve_and_cache_movies(titles: Iterable[dict], excluded_ids: Collection[int] = ()) -> list[int]:
+    """
+    Resolves and caches LLM-suggested titles in parallel. `titles` may be a streamed LLM answer:
+    each title is dispatched as soon as it is parsed, while the model is still writing the next ones.
+    Unresolved and excluded titles are dropped, input order is kept.
+    """
+    results = run_in_io_pool(lambda item: resolve_and_cache_one_movie(item, excluded_ids), titles)
+    return list(dict.fromkeys(tmdb_id for tmdb_id in results if tmdb_id is not None))
+
+
+@traced
 def fetch_movies_from_cache(tmdb_ids: list[int], db: Session) -> list[CachedMovie]:
     """
     Fetches CachedMovie entries from DB based on tmdb_ids.
@@ -152,9 +208,13 @@ def fetch_movies_from_cache(tmdb_ids: list[int], db: Session) -> list[CachedMovi
     return movies
 
 
-def rerank_and_imdb_filter_movies(movies: list[CachedMovie], filters: MovieSearchFilters) -> list[CachedMovie]:
+@traced
+def rerank_and_imdb_filter_movies(
+    movies: list[CachedMovie], filters: MovieSearchFilters, affinity: Optional[AffinityVector] = None
+) -> list[CachedMovie]:
     """
-    Optionally rerank movies based on IMDb rating or vote count.
+    Optionally rerank movies based on IMDb rating, vote count or, for "personalized",
+    the user's genre / decade affinity.
     Falls back to original TMDB order if sort_by is "popularity.desc".
     """
     
@@ -170,16 +230,21 @@ def rerank_and_imdb_filter_movies(movies: list[CachedMovie], filters: MovieSearc
     if filters.sort_by == "vote_count.desc":
         return sorted(movies, key=lambda m: m.imdb_votes_count or 0, reverse=True)[:30]
 
+    if filters.sort_by == "personalized" and affinity is not None:
+        return rank_by_affinity(movies, affinity)[:30]
+
     # "popularity.desc" or unknown sort → no reranking
     return movies[:30]
 
 
-def to_movie_card(movie: CachedMovie, language: str) -> MovieCard:
+def to_movie_card(movie: CachedMovie, language: str, image_size: str = DEFAULT_POSTER_SIZE) -> MovieCard:
     """
     Converts a CachedMovie DB model to a Pydantic MovieCard,
-    using the correct language (EN/FR) for title, overview, genres, and trailer.
+    using the correct language (EN/FR) for title, overview, genres, and trailer,
+    and the poster URL at `image_size` (w185 / w342 / w500 / original).
     """
     is_french = language == "fr"
+    poster_path = movie.poster_path or poster_path_from_url(movie.poster_url)
 
     return MovieCard(
         tmdb_id=movie.tmdb_id,
@@ -189,14 +254,20 @@ def to_movie_card(movie: CachedMovie, language: str) -> MovieCard:
         release_year=movie.release_year,
         imdb_rating=movie.imdb_rating,
         imdb_votes_count=movie.imdb_votes_count,
-        poster_url=movie.poster_url,
+        poster_path=poster_path,
+        poster_url=build_poster_url(poster_path, image_size) or movie.poster_url,
         trailer_url=movie.trailer_url_fr if is_french else movie.trailer_url_en,
         overview=movie.overview_fr if is_french else movie.overview_en,
     )
 
 
+@traced
+def to_movie_cards(movies: list[CachedMovie], language: str) -> CardList:
+    return CardList("movie", movies, language, to_movie_card)
 
 
+
+@traced
 def recommend_movies_by_filters(filters: MovieSearchFilters, user_id: int, database: Session, language: str) -> list[MovieCard]:
     """
     Recommends a list of high-quality movies that the user hasn't seen,
@@ -208,68 +279,63 @@ def recommend_movies_by_filters(filters: MovieSearchFilters, user_id: int, datab
     tmdb_ids = fetch_unseen_tmdb_ids(filters, user_id, database)
     enrich_and_cache_movies(tmdb_ids)
     cache_movies = fetch_movies_from_cache(tmdb_ids, database)
-    reranked = rerank_and_imdb_filter_movies(cache_movies, filters)
-    return [to_movie_card(m, language) for m in reranked]
+    affinity = load_user_affinity(user_id, "movie", database) if filters.sort_by == "personalized" else None
+    reranked = rerank_and_imdb_filter_movies(cache_movies, filters, affinity)
+    return to_movie_cards(reranked, language)
 
 
+@traced
 def recommend_similar_movies(user_input: str, user_id: int, database: Session, language: str) -> list[MovieCard]:
-    similar_movies = get_similar_titles_with_llm("movie", user_input)
-    if not similar_movies:
-        return []
-
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "movie", movie["title"], movie["year"])
-            for movie in similar_movies
-        ]
-        tmdb_ids = [result for result in (f.result() for f in futures) if result is not None]
-
-    if not tmdb_ids:
-        return []
-
+    """
+    Neighbours from the local similarity index when the reference movie is in the catalog,
+    otherwise LLM suggestions resolved on TMDB.
+    """
     excluded_ids = fetch_excluded_ids("movie", user_id, database)
-    filtered_ids = [mid for mid in tmdb_ids if mid not in excluded_ids]
+    local_ids = [mid for mid in find_similar_tmdb_ids("movie", user_input, database) or [] if mid not in excluded_ids]
+    if local_ids:
+        return to_movie_cards(fetch_movies_from_cache(local_ids, database), language)
 
+    filtered_ids = resolve_and_cache_movies(get_similar_titles_with_llm("movie", user_input), excluded_ids)
     if not filtered_ids:
         return []
 
-    enrich_and_cache_movies(filtered_ids)
     cached_movies = fetch_movies_from_cache(filtered_ids, database)
-    return [to_movie_card(m, language) for m in cached_movies]
+    return to_movie_cards(cached_movies, language)
 
 
+@traced
 def search_movies_by_title(user_input: str, database: Session, language: str) -> list[MovieCard]:
-    matching_movies = extract_movie_titles_with_llm(user_input)
-    if not matching_movies:
-        return []
-
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "movie", movie["title"], movie["year"])
-            for movie in matching_movies
-        ]
-        tmdb_ids = [result for result in (f.result() for f in futures) if result is not None]
+    """
+    Local keyword search over cached titles first; LLM extraction + TMDB search only when nothing matches.
+    """
+    local_ids = search_by_title("movie", user_input, database)
+    if local_ids:
+        return to_movie_cards(fetch_movies_from_cache(local_ids, database), language)
 
-    enrich_and_cache_movies(tmdb_ids)
+    tmdb_ids = resolve_and_cache_movies(extract_movie_titles_with_llm(user_input))
     cached_movies = fetch_movies_from_cache(tmdb_ids, database)
-    return [to_movie_card(m, language) for m in cached_movies]
+    return to_movie_cards(cached_movies, language)
 
 
+@traced
 def recommend_movies_from_description(user_input: str, user_id: int, database: Session, language: str) -> list[MovieCard]:
-    raw_titles = get_titles_from_description_with_llm("movie", user_input)
-    if not raw_titles:
-        return []
-
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "movie", item["title"], item["year"])
-            for item in raw_titles
-        ]
-        tmdb_ids = [res for res in (f.result() for f in futures) if res is not None]
-
+    """
+    Answered from the local full-text index when enough cached movies match every term of the description;
+    otherwise LLM suggestions (resolved on TMDB) come first, followed by the local partial matches.
+    """
     excluded_ids = fetch_excluded_ids("movie", user_id, database)
-    filtered_ids = [mid for mid in tmdb_ids if mid not in excluded_ids]
+    local_ids = [
+        mid for mid in search_by_description("movie", user_input, database, DESCRIPTION_LOCAL_LIMIT, match_all=True)
+        if mid not in excluded_ids
+    ]
+    if len(local_ids) >= DESCRIPTION_LOCAL_MIN_RESULTS:
+        return to_movie_cards(fetch_movies_from_cache(local_ids, database), language)
 
-    enrich_and_cache_movies(filtered_ids)
-    cached = fetch_movies_from_cache(filtered_ids, database)
-    return [to_movie_card(m, language) for m in cached]
+    filtered_ids = resolve_and_cache_movies(get_titles_from_description_with_llm("movie", user_input), excluded_ids)
+
+    local_ids += [
+        mid for mid in search_by_description("movie", user_input, database, DESCRIPTION_LOCAL_LIMIT)
+        if mid not in excluded_ids
+    ]
+    cached = fetch_movies_from_cache(list(dict.fromkeys(filtered_ids + local_ids)), database)
+    return to_movie_cards(cached, language)
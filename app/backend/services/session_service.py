@@ -1,5 +1,8 @@
 from app.backend.models.chat_session_model import ChatSession
+from app.backend.models.chat_message_model import ChatMessage
+from sqlalchemy import func, insert, literal, select
 from sqlalchemy.orm import Session
+from datetime import datetime
 
 
 def get_or_create_chat_session(
@@ -17,7 +20,7 @@ def get_or_create_chat_session(
 
     else:
         try:
-            new_session = ChatSession(id=session_id, user_id=user_id, conversation=[])
+            new_session = ChatSession(id=session_id, user_id=user_id)
             database.add(new_session)
             database.commit()
             return new_session
@@ -25,3 +28,42 @@ def get_or_create_chat_session(
         except Exception as e:
             database.rollback()
             raise RuntimeError(f"Failed to create chat session: {str(e)}")
+
+
+def append_chat_message(session_id: str, role: str, content: str, database: Session, commit: bool = True):
+    """
+    Appends one message in a single INSERT ... SELECT: the next seq is read from
+    the (session_id, seq) primary key inside the same statement, so the cost
+    does not grow with the session length.
+    """
+    next_seq = (
+        select(
+            literal(session_id),
+            func.coalesce(func.max(ChatMessage.seq), 0) + 1,
+            literal(role),
+            literal(content),
+            literal(datetime.now()),
+        )
+        .where(ChatMessage.session_id == session_id)
+    )
+    database.execute(
+        insert(ChatMessage).from_select(
+            ["session_id", "seq", "role", "content", "created_on"], next_seq
+        )
+    )
+    if commit:
+        database.commit()
+
+
+def get_recent_chat_messages(session_id: str, database: Session, limit: int = 4) -> list[dict]:
+    """
+    Last `limit` messages of a session, oldest first, as {"role", "content"} dicts.
+    """
+    rows = (
+        database.query(ChatMessage.role, ChatMessage.content)
+        .filter(ChatMessage.session_id == session_id)
+        .order_by(ChatMessage.seq.desc())
+        .limit(limit)
+        .all()
+    )
+    return [{"role": row.role, "content": row.content} for row in reversed(rows)]
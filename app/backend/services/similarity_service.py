@@ -0,0 +1,238 @@
+import heapq
+import logging
+import math
+from collections import Counter, defaultdict
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.backend.core.config import SIMILARITY_NEIGHBOURS
+from app.backend.core.tracing import traced
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.similar_title_model import SimilarTitle
+from app.backend.models.title_key_model import TitleKey
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.utils.utils import fold_text
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MODELS = {"movie": CachedMovie, "tv": CachedTvShow}
+
+# Final score = weighted overview TF-IDF cosine + genre cosine + release-year proximity
+TEXT_WEIGHT, GENRE_WEIGHT, YEAR_WEIGHT = 0.6, 0.3, 0.1
+YEAR_SCALE = 10.0
+
+# Approximate neighbour search: each title queries with its top terms only, each term keeps
+# only its strongest postings, and only the best accumulated candidates are fully scored
+QUERY_TERMS = 15
+MAX_POSTINGS = 300
+CANDIDATES = 100
+
+INSERT_CHUNK_SIZE = 5000
+
+STOPWORDS = frozenset("""
+    the and for with from that this his her their they them its into who what when where which while
+    after before about over under one two there been has have had was were will would can could
+    but not all out off new young old man woman life world story film movie series show
+    les des une est dans pour par sur qui que avec son ses leur leurs aux elle ils elles mais plus
+    sont ont cette tout tous entre apres avant lui deux vie monde histoire film serie
+""".split())
+
+# Words of "movies like X" requests that never make up a title on their own
+REQUEST_WORDS = frozenset("""
+    movie movies film films show shows series serie tv like similar similaire similaires to as me
+    recommend recommande recommander some something i want give a an the more other others that and or
+    for looking comme au aux des un une le la les du de moi autre autres genre style je veux cherche et ou
+""".split())
+# One-word titles ("Her", "Up", "Heat", "Love") are everyday words: they only count right after
+# one of these cues ("like Heat", "comme Her", "similar to Up") or as the whole request
+SIMILARITY_CUES = frozenset("like comme similar similaire similaires".split())
+CUE_PASS_THROUGH = frozenset("to a the an le la les l un une".split())
+MAX_TITLE_WORDS = 8
+MAX_INPUT_WORDS = 40
+
+
+# ─────────────────────────────────────────────
+# BUILD (offline, see scripts/build_similarity_index.py)
+
+def tokenize(text: Optional[str]) -> list[str]:
+    return [token for token in fold_text(text or "").split() if len(token) > 2 and not token.isdigit() and token not in STOPWORDS]
+
+
+def genre_similarity(a: list[int], b: list[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(set(a) & set(b)) / math.sqrt(len(set(a)) * len(set(b)))
+
+
+def year_similarity(a: Optional[int], b: Optional[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return math.exp(-abs(a - b) / YEAR_SCALE)
+
+
+def build_tfidf_vectors(overviews: list[list[str]]) -> list[dict[str, float]]:
+    """
+    Unit-length sublinear TF-IDF vectors. Terms found in a single overview are dropped: they cannot match anything.
+    """
+    document_frequency = Counter(term for tokens in overviews for term in set(tokens))
+    count = len(overviews)
+    vectors = []
+    for tokens in overviews:
+        weights = {
+            term: (1 + math.log(tf)) * math.log(count / document_frequency[term])
+            for term, tf in Counter(tokens).items() if document_frequency[term] > 1
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        vectors.append({term: w / norm for term, w in weights.items()} if norm else {})
+    return vectors
+
+
+def nearest_neighbours(rows: list, neighbours: int) -> dict[int, list[tuple[int, float]]]:
+    """
+    (tmdb_id → [(similar tmdb_id, score)], best first) for catalog rows with tmdb_id, overview_en,
+    overview_fr, genre_ids and release_year.
+    """
+    vectors = build_tfidf_vectors([tokenize(row.overview_en) + tokenize(row.overview_fr) for row in rows])
+
+    postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+    for index, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings[term].append((index, weight))
+    for term, posting in postings.items():
+        if len(posting) > MAX_POSTINGS:
+            postings[term] = heapq.nlargest(MAX_POSTINGS, posting, key=lambda item: item[1])
+
+    result = {}
+    for index, vector in enumerate(vectors):
+        row = rows[index]
+        scores: dict[int, float] = defaultdict(float)
+        for term, weight in heapq.nlargest(QUERY_TERMS, vector.items(), key=lambda item: item[1]):
+            for other, other_weight in postings[term]:
+                if other != index:
+                    scores[other] += weight * other_weight
+
+        ranked = []
+        for other, text_score in heapq.nlargest(CANDIDATES, scores.items(), key=lambda item: item[1]):
+            candidate = rows[other]
+            score = (
+                TEXT_WEIGHT * text_score
+                + GENRE_WEIGHT * genre_similarity(row.genre_ids, candidate.genre_ids)
+                + YEAR_WEIGHT * year_similarity(row.release_year, candidate.release_year)
+            )
+            ranked.append((candidate.tmdb_id, round(score, 4)))
+        if ranked:
+            result[row.tmdb_id] = heapq.nlargest(neighbours, ranked, key=lambda item: item[1])
+    return result
+
+
+@traced
+def build_similarity_index(database: Session, media_type: str, neighbours: int = SIMILARITY_NEIGHBOURS) -> dict:
+    """
+    Rebuilds the neighbour lists and title keys of one media type from the cached catalog.
+    Does not commit. Returns counts.
+    """
+    model = CATALOG_MODELS[media_type]
+    rows = database.execute(
+        select(model.tmdb_id, model.title_en, model.title_fr, model.overview_en, model.overview_fr,
+               model.genre_ids, model.release_year)
+    ).all()
+
+    similar = nearest_neighbours(rows, neighbours)
+    database.execute(delete(SimilarTitle).where(SimilarTitle.media_type == media_type))
+    neighbour_rows = [
+        {"media_type": media_type, "tmdb_id": tmdb_id, "rank": rank, "similar_tmdb_id": similar_id, "score": score}
+        for tmdb_id, ranked in similar.items()
+        for rank, (similar_id, score) in enumerate(ranked)
+    ]
+    for start in range(0, len(neighbour_rows), INSERT_CHUNK_SIZE):
+        database.execute(SimilarTitle.__table__.insert(), neighbour_rows[start:start + INSERT_CHUNK_SIZE])
+
+    database.execute(delete(TitleKey).where(TitleKey.media_type == media_type))
+    keys = {
+        (key, row.tmdb_id)
+        for row in rows
+        for key in (fold_text(row.title_en or ""), fold_text(row.title_fr or ""))
+        if key
+    }
+    key_rows = [
+        {"media_type": media_type, "key": key, "tmdb_id": tmdb_id, "word_count": len(key.split())}
+        for key, tmdb_id in keys
+    ]
+    for start in range(0, len(key_rows), INSERT_CHUNK_SIZE):
+        database.execute(TitleKey.__table__.insert(), key_rows[start:start + INSERT_CHUNK_SIZE])
+
+    summary = {"titles": len(rows), "with_neighbours": len(similar), "title_keys": len(key_rows)}
+    logger.info("Similarity index for %s rebuilt: %s", media_type, summary)
+    return summary
+
+
+# ─────────────────────────────────────────────
+# LOOKUP (request path)
+
+def cued_words(words: list[str]) -> set[str]:
+    """
+    The words that may be a one-word title: those following a similarity cue, or the only non-request word.
+    """
+    cued, after_cue = set(), False
+    for word in words:
+        if word in SIMILARITY_CUES:
+            after_cue = True
+        elif after_cue and word in CUE_PASS_THROUGH:
+            continue
+        else:
+            if after_cue and word not in REQUEST_WORDS:
+                cued.add(word)
+            after_cue = False
+
+    content = [word for word in words if word not in REQUEST_WORDS]
+    if len(content) == 1:
+        cued.add(content[0])
+    return cued
+
+
+@traced
+def find_reference_title(media_type: str, user_input: str, database: Session) -> Optional[int]:
+    """
+    TMDB ID of the catalog title named in `user_input` ("films comme Amélie"), or None.
+    Longest title wins, then the most voted one among same-name titles.
+    """
+    words = fold_text(user_input).split()[:MAX_INPUT_WORDS]
+    phrases = {
+        " ".join(words[start:end])
+        for start in range(len(words))
+        for end in range(start + 2, min(len(words), start + MAX_TITLE_WORDS) + 1)
+        if not set(words[start:end]) <= REQUEST_WORDS
+    }
+    phrases |= cued_words(words)
+    if not phrases:
+        return None
+
+    model = CATALOG_MODELS[media_type]
+    match = database.execute(
+        select(TitleKey.tmdb_id)
+        .join(model, model.tmdb_id == TitleKey.tmdb_id)
+        .where(TitleKey.media_type == media_type, TitleKey.key.in_(phrases))
+        .order_by(TitleKey.word_count.desc(), model.imdb_votes_count.desc())
+        .limit(1)
+    ).scalar()
+    return match
+
+
+@traced
+def find_similar_tmdb_ids(media_type: str, user_input: str, database: Session) -> Optional[list[int]]:
+    """
+    Precomputed neighbours of the title named in `user_input`, best first.
+    None when no catalog title is recognized or the index has nothing for it (callers fall back to the LLM).
+    """
+    reference = find_reference_title(media_type, user_input, database)
+    if reference is None:
+        return None
+
+    similar_ids = database.execute(
+        select(SimilarTitle.similar_tmdb_id)
+        .where(SimilarTitle.media_type == media_type, SimilarTitle.tmdb_id == reference)
+        .order_by(SimilarTitle.rank)
+    ).scalars().all()
+    return similar_ids or None
@@ -0,0 +1,181 @@
+from collections import Counter
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_media_model import UserMedia
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.schemas.stats_schemas import UserStats
+from app.backend.utils.utils import map_id_to_genre
+
+CATALOG_MODELS = {"movie": CachedMovie, "tv": CachedTvShow}
+COUNTED_STATUSES = ("seen", "towatchlater")
+TOP_N = 3
+SNAPSHOT_CHUNK_SIZE = 500
+
+
+# ─────────────────────────────────────────────
+# DELTAS
+def catalog_snapshot(row) -> dict:
+    """
+    The catalog fields a seen title contributes, as stored in user_media.stat_snapshot.
+    """
+    return {"genre_ids": list(row.genre_ids or []), "release_year": row.release_year, "imdb_rating": row.imdb_rating}
+
+
+def catalog_deltas(media_type: str, snapshot: dict, sign: int) -> Counter:
+    """
+    What one seen title adds to (sign=+1) or removes from (sign=-1) the genre / year / rating counters.
+    """
+    deltas = Counter()
+    for genre_id in snapshot.get("genre_ids") or []:
+        deltas[("genre", f"{media_type}:{genre_id}")] += sign
+    if snapshot.get("release_year"):
+        deltas[("year", str(snapshot["release_year"]))] += sign
+    if snapshot.get("imdb_rating"):
+        deltas[("rating", "sum")] += sign * snapshot["imdb_rating"]
+        deltas[("rating", "n")] += sign
+    return deltas
+
+
+def record_status_changes(
+    database: Session, user_id: int, changes: Iterable[tuple[str, int, Optional[str], str]]
+) -> dict[tuple[str, int], Optional[dict]]:
+    """
+    Moves the user's counters for (media_type, tmdb_id, old_status, new_status) changes; "none" / None mean no entry.
+    A title entering "seen" adds its current catalog row (nothing if it is not cached); a title leaving "seen"
+    subtracts the snapshot stored on its user_media row, so the counters never drift from what was added.
+    Returns {(media_type, tmdb_id): snapshot} for the titles entering "seen": the caller stores it on the row.
+    Does not commit: call it inside the transaction that changes user_media.
+    """
+    deltas = Counter()
+    entering: dict[str, list[int]] = {"movie": [], "tv": []}
+    leaving: list[tuple[str, int]] = []
+
+    for media_type, tmdb_id, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        for status, sign in ((old_status, -1), (new_status, +1)):
+            if status in COUNTED_STATUSES:
+                deltas[(status, "")] += sign
+        if new_status == "seen":
+            entering[media_type].append(tmdb_id)
+        elif old_status == "seen":
+            leaving.append((media_type, tmdb_id))
+
+    snapshots: dict[tuple[str, int], Optional[dict]] = {}
+    for media_type, tmdb_ids in entering.items():
+        snapshots.update({(media_type, tmdb_id): None for tmdb_id in tmdb_ids})
+        if not tmdb_ids:
+            continue
+        model = CATALOG_MODELS[media_type]
+        for row in database.execute(
+            select(model.tmdb_id, model.genre_ids, model.release_year, model.imdb_rating).where(model.tmdb_id.in_(tmdb_ids))
+        ):
+            snapshot = catalog_snapshot(row)
+            snapshots[(media_type, row.tmdb_id)] = snapshot
+            deltas.update(catalog_deltas(media_type, snapshot, +1))
+
+    for start in range(0, len(leaving), SNAPSHOT_CHUNK_SIZE):
+        for media_type, snapshot in database.execute(
+            select(UserMedia.media_type, UserMedia.stat_snapshot).where(
+                UserMedia.user_id == user_id,
+                tuple_(UserMedia.media_type, UserMedia.tmdb_id).in_(leaving[start:start + SNAPSHOT_CHUNK_SIZE]),
+                UserMedia.stat_snapshot.is_not(None),
+            )
+        ):
+            deltas.update(catalog_deltas(media_type, snapshot, -1))
+
+    apply_counter_deltas(database, user_id, deltas)
+    return snapshots
+
+
+def apply_counter_deltas(database: Session, user_id: int, deltas: Counter):
+    values = [
+        {"user_id": user_id, "kind": kind, "bucket": bucket, "value": delta}
+        for (kind, bucket), delta in deltas.items() if delta
+    ]
+    if not values:
+        return
+    statement = insert(UserStatCounter).values(values)
+    database.execute(statement.on_conflict_do_update(
+        index_elements=[UserStatCounter.user_id, UserStatCounter.kind, UserStatCounter.bucket],
+        set_={"value": UserStatCounter.value + statement.excluded.value},
+    ))
+
+
+# ─────────────────────────────────────────────
+# READ
+def get_user_stats(user_id: int, database: Session, language: str = "en") -> UserStats:
+    """
+    UserStats from the user's counters only: one indexed read, whatever the library size.
+    """
+    counters = database.execute(
+        select(UserStatCounter.kind, UserStatCounter.bucket, UserStatCounter.value)
+        .where(UserStatCounter.user_id == user_id, UserStatCounter.value != 0)
+    ).all()
+
+    totals, genres, years = {}, Counter(), Counter()
+    for kind, bucket, value in counters:
+        if kind == "genre":
+            media_type, genre_id = bucket.split(":", 1)
+            try:
+                genres[map_id_to_genre(media_type, language, int(genre_id))] += value
+            except ValueError:
+                continue
+        elif kind == "year":
+            years[int(bucket)] += value
+        else:
+            totals[(kind, bucket)] = value
+
+    rated = totals.get(("rating", "n"), 0)
+    year_count = sum(years.values())
+    return UserStats(
+        total_seen=int(totals.get(("seen", ""), 0)),
+        top_genres=[name for name, _ in genres.most_common(TOP_N)],
+        average_rating_seen=round(totals.get(("rating", "sum"), 0) / rated, 2) if rated else 0.0,
+        most_watched_years=[year for year, _ in years.most_common(TOP_N)],
+        average_release_year=round(sum(y * n for y, n in years.items()) / year_count) if year_count else 0,
+        watch_later_count=int(totals.get(("towatchlater", ""), 0)),
+    )
+
+
+# ─────────────────────────────────────────────
+# REBUILD (backfill, or after catalog ratings were refreshed)
+def rebuild_user_stats(database: Session, user_id: int) -> int:
+    """
+    Recomputes one user's counters from user_media and the catalog, and re-snapshots every seen title
+    (titles cached since they were marked seen are counted from now on). Does not commit.
+    Returns the number of counters.
+    """
+    database.execute(delete(UserStatCounter).where(UserStatCounter.user_id == user_id))
+
+    deltas = Counter()
+    for media_type, model in CATALOG_MODELS.items():
+        for status, count in database.execute(
+            select(UserMedia.status, func.count())
+            .where(UserMedia.user_id == user_id, UserMedia.media_type == media_type, UserMedia.status.in_(COUNTED_STATUSES))
+            .group_by(UserMedia.status)
+        ):
+            deltas[(status, "")] += count
+
+        rows = database.execute(
+            select(UserMedia.id, model.tmdb_id, model.genre_ids, model.release_year, model.imdb_rating)
+            .outerjoin(model, model.tmdb_id == UserMedia.tmdb_id)
+            .where(UserMedia.user_id == user_id, UserMedia.media_type == media_type, UserMedia.status == "seen")
+        ).all()
+        snapshots = []
+        for row in rows:
+            snapshot = catalog_snapshot(row) if row.tmdb_id is not None else None
+            snapshots.append({"id": row.id, "stat_snapshot": snapshot})
+            if snapshot:
+                deltas.update(catalog_deltas(media_type, snapshot, +1))
+        if snapshots:
+            database.execute(update(UserMedia), snapshots)
+
+    apply_counter_deltas(database, user_id, deltas)
+    return sum(1 for delta in deltas.values() if delta)
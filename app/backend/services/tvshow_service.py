@@ -1,9 +1,16 @@
+import logging
 from sqlalchemy.orm import Session
 from datetime import date
-from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Iterable, Optional
 
 from app.backend.core.database import SessionLocal
+from app.backend.core.executor import run_in_io_pool
+from app.backend.core.tracing import traced
+from app.backend.services.card_cache import CardList
+from app.backend.services.similarity_service import find_similar_tmdb_ids
+from app.backend.services.catalog_search_service import search_by_description, search_by_title
+from app.backend.core.config import DESCRIPTION_LOCAL_MIN_RESULTS, DESCRIPTION_LOCAL_LIMIT
+from app.backend.services.affinity_service import AffinityVector, load_user_affinity, rank_by_affinity
 from app.backend.schemas.tvshow_schemas import TvShowSearchFilters, TvShowCard
 from app.backend.models.tvshow_model import CachedTvShow
 from app.backend.models.user_media_model import UserMedia
@@ -13,15 +20,21 @@ from app.backend.core.tmdb_client import (
     call_tmdb_media_details_endpoint,
     call_tmdb_media_videos_endpoint,
     call_tmdb_media_id_by_media_name_endpoint,
+    build_poster_url,
+    poster_path_from_url,
+    DEFAULT_POSTER_SIZE,
 )
 from app.backend.services.llm_service import (
     get_similar_titles_with_llm,
     extract_tvshow_titles_with_llm,
     get_titles_from_description_with_llm,
 )
-from app.backend.core.omdb_client import call_omdb_client
+from app.backend.services.imdb_ratings_service import get_imdb_rating_and_votes
 
+logger = logging.getLogger(__name__)
 
+
+@traced
 def fetch_excluded_ids(media_type: str, user_id: int, database: Session) -> set[int]:
     """
     Fetches a set of TMDB IDs for a given user and media type that are marked as
@@ -37,6 +50,7 @@ def fetch_excluded_ids(media_type: str, user_id: int, database: Session) -> set[
     }
 
 
+@traced
 def fetch_unseen_tmdb_ids(filters: TvShowSearchFilters, user_id: int, database: Session) -> list[int]:
     """
     Fetch up to 50 TMDB TV shows that:
@@ -62,77 +76,115 @@ def fetch_unseen_tmdb_ids(filters: TvShowSearchFilters, user_id: int, database:
     return results
 
 
-def enrich_and_cache_one_tvshow(tmdb_id: int):
+@traced
+def fetch_tvshow_fields(tmdb_id: int, db: Session) -> dict:
+    """
+    Fetches everything needed to cache a TV show from TMDB (EN/FR details, trailers)
+    and IMDb (rating, votes). Returns CachedTvShow column values.
+    """
+    tmdb_details_en = call_tmdb_media_details_endpoint("tv", tmdb_id, "en")
+    tmdb_details_fr = call_tmdb_media_details_endpoint("tv", tmdb_id, "fr")
+    imdb_id = tmdb_details_en.get("imdb_id")
+
+    imdb_rating = 0.0
+    imdb_votes_count = 0
+    if imdb_id:
+        imdb_rating, imdb_votes_count = get_imdb_rating_and_votes(imdb_id, db)
+
+    genre_ids = [g["id"] for g in tmdb_details_en.get("genres", [])]
+    return dict(
+        imdb_id=imdb_id,
+        imdb_rating=imdb_rating,
+        imdb_votes_count=imdb_votes_count,
+        release_year=int(tmdb_details_en.get("first_air_date", "0000")[:4]),
+        poster_url=build_poster_url(tmdb_details_en.get("poster_path"), "original"),
+        poster_path=tmdb_details_en.get("poster_path"),
+        title_en=tmdb_details_en.get("name"),
+        title_fr=tmdb_details_fr.get("name"),
+        genre_ids=genre_ids,
+        genre_names_en=[map_id_to_genre("tv", "en", gid) for gid in genre_ids],
+        genre_names_fr=[map_id_to_genre("tv", "fr", gid) for gid in genre_ids],
+        trailer_url_en=call_tmdb_media_videos_endpoint("tv", tmdb_id, "en"),
+        trailer_url_fr=call_tmdb_media_videos_endpoint("tv", tmdb_id, "fr"),
+        overview_en=tmdb_details_en.get("overview"),
+        overview_fr=tmdb_details_fr.get("overview"),
+        cache_update_date=date.today(),
+    )
+
+
+@traced
+def enrich_and_cache_one_tvshow(tmdb_id: int, force_refresh: bool = False) -> bool:
     """
     Enrich a single TV show with IMDb rating, vote count, trailer URLs,
     multilingual title/overview, and cache it into the DB.
+    `force_refresh` re-fetches all fields of an already cached show (used by the changes sync).
+    Returns False when fetching or caching failed.
     Creates its own DB session (thread-safe).
     """
     db = SessionLocal()
     try:
         cached_tvshow = db.query(CachedTvShow).filter(CachedTvShow.tmdb_id == tmdb_id).first()
         if cached_tvshow:
+            if force_refresh:
+                for field, value in fetch_tvshow_fields(tmdb_id, db).items():
+                    setattr(cached_tvshow, field, value)
+                db.commit()
+                return True
             age = (date.today() - cached_tvshow.cache_update_date).days
             if age <= 7:
-                return
+                return True
             if cached_tvshow.imdb_id:
-                imdb_data = call_omdb_client(cached_tvshow.imdb_id)
-                cached_tvshow.imdb_rating = float(imdb_data.get("imdb_rating") or 0)
-                cached_tvshow.imdb_votes_count = int(imdb_data.get("imdb_votes_count", "0").replace(",", ""))
+                cached_tvshow.imdb_rating, cached_tvshow.imdb_votes_count = get_imdb_rating_and_votes(cached_tvshow.imdb_id, db)
                 cached_tvshow.cache_update_date = date.today()
                 db.commit()
         else:
-            tmdb_details_en = call_tmdb_media_details_endpoint("tv", tmdb_id, "en")
-            tmdb_details_fr = call_tmdb_media_details_endpoint("tv", tmdb_id, "fr")
-            imdb_id = tmdb_details_en.get("imdb_id")
-
-            imdb_rating = 0.0
-            imdb_votes_count = 0
-            if imdb_id:
-                imdb_data = call_omdb_client(imdb_id)
-                imdb_rating = float(imdb_data.get("imdb_rating") or 0)
-                imdb_votes_count = int(imdb_data.get("imdb_votes_count", "0").replace(",", ""))
-
-            genre_ids = [g["id"] for g in tmdb_details_en.get("genres", [])]
-            new_tvshow = CachedTvShow(
-                tmdb_id=tmdb_id,
-                imdb_id=imdb_id,
-                imdb_rating=imdb_rating,
-                imdb_votes_count=imdb_votes_count,
-                release_year=int(tmdb_details_en.get("first_air_date", "0000")[:4]),
-                poster_url=(
-                    f"https://image.tmdb.org/t/p/original{tmdb_details_en.get('poster_path')}"
-                    if tmdb_details_en.get("poster_path") else None
-                ),
-                title_en=tmdb_details_en.get("name"),
-                title_fr=tmdb_details_fr.get("name"),
-                genre_ids=genre_ids,
-                genre_names_en=[map_id_to_genre("tv", "en", gid) for gid in genre_ids],
-                genre_names_fr=[map_id_to_genre("tv", "fr", gid) for gid in genre_ids],
-                trailer_url_en=call_tmdb_media_videos_endpoint("tv", tmdb_id, "en"),
-                trailer_url_fr=call_tmdb_media_videos_endpoint("tv", tmdb_id, "fr"),
-                overview_en=tmdb_details_en.get("overview"),
-                overview_fr=tmdb_details_fr.get("overview"),
-                cache_update_date=date.today(),
-            )
+            new_tvshow = CachedTvShow(tmdb_id=tmdb_id, **fetch_tvshow_fields(tmdb_id, db))
             db.add(new_tvshow)
             db.commit()
+        return True
     except Exception:
+        logger.exception("Failed to enrich TV show %s", tmdb_id)
         db.rollback()
+        return False
     finally:
         db.close()
 
 
+@traced
 def enrich_and_cache_tvshows(tmdb_ids: list[int]) -> None:
     """
-    Enrich and cache a list of TMDB TV show IDs in parallel.
-    Each thread manages its own DB session.
+    Enrich and cache a list of TMDB TV show IDs in parallel on the shared I/O executor.
+    Each task manages its own DB session.
+    """
+    run_in_io_pool(enrich_and_cache_one_tvshow, tmdb_ids)
+
+
+def resolve_and_cache_one_tvshow(item: dict, excluded_ids: Collection[int] = ()) -> Optional[int]:
+    """
+    Resolves one LLM-suggested {"title", "year"} item to a TMDB ID, then enriches and caches that TV show
+    in the same worker: no task submits to the pool it runs on. None when unresolved or excluded.
+    """
+    if not isinstance(item.get("title"), str):
+        return None
+    tmdb_id = call_tmdb_media_id_by_media_name_endpoint("tv", item["title"], item.get("year"))
+    if tmdb_id is None or tmdb_id in excluded_ids:
+        return None
+    enrich_and_cache_one_tvshow(tmdb_id)
+    return tmdb_id
+
+
+@traced
+def resolve_and_cache_tvshows(titles: Iterable[dict], excluded_ids: Collection[int] = ()) -> list[int]:
+    """
+    Resolves and caches LLM-suggested titles in parallel. `titles` may be a streamed LLM answer:
+    each title is dispatched as soon as it is parsed, while the model is still writing the next ones.
+    Unresolved and excluded titles are dropped, input order is kept.
     """
-    task = partial(enrich_and_cache_one_tvshow)
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        executor.map(task, tmdb_ids)
+    results = run_in_io_pool(lambda item: resolve_and_cache_one_tvshow(item, excluded_ids), titles)
+    return list(dict.fromkeys(tmdb_id for tmdb_id in results if tmdb_id is not None))
 
 
+@traced
 def fetch_tvshows_from_cache(tmdb_ids: list[int], db: Session) -> list[CachedTvShow]:
     """
     Fetches CachedTvShow entries from DB based on tmdb_ids.
@@ -146,9 +198,13 @@ def fetch_tvshows_from_cache(tmdb_ids: list[int], db: Session) -> list[CachedTvS
     return tvshows
 
 
-def rerank_and_imdb_filter_tvshows(tvshows: list[CachedTvShow], filters: TvShowSearchFilters) -> list[CachedTvShow]:
+@traced
+def rerank_and_imdb_filter_tvshows(
+    tvshows: list[CachedTvShow], filters: TvShowSearchFilters, affinity: Optional[AffinityVector] = None
+) -> list[CachedTvShow]:
     """
-    Optionally filter and rerank TV shows based on IMDb rating or vote count.
+    Optionally filter and rerank TV shows based on IMDb rating, vote count or, for "personalized",
+    the user's genre / decade affinity.
     Falls back to original TMDB order if sort_by is "popularity.desc" or unknown.
     """
     filtered = [
@@ -163,15 +219,20 @@ def rerank_and_imdb_filter_tvshows(tvshows: list[CachedTvShow], filters: TvShowS
     if filters.sort_by == "vote_count.desc":
         return sorted(filtered, key=lambda tv: tv.imdb_votes_count or 0, reverse=True)[:30]
 
+    if filters.sort_by == "personalized" and affinity is not None:
+        return rank_by_affinity(filtered, affinity)[:30]
+
     return filtered[:30]
 
 
-def to_tvshow_card(tvshow: CachedTvShow, language: str) -> TvShowCard:
+def to_tvshow_card(tvshow: CachedTvShow, language: str, image_size: str = DEFAULT_POSTER_SIZE) -> TvShowCard:
     """
     Converts a CachedTvShow DB model to a Pydantic TvShowCard,
-    using the correct language (EN/FR) for title, overview, genres, and trailer.
+    using the correct language (EN/FR) for title, overview, genres, and trailer,
+    and the poster URL at `image_size` (w185 / w342 / w500 / original).
     """
     is_french = language == "fr"
+    poster_path = tvshow.poster_path or poster_path_from_url(tvshow.poster_url)
     return TvShowCard(
         tmdb_id=tvshow.tmdb_id,
         imdb_id=tvshow.imdb_id,
@@ -180,14 +241,20 @@ def to_tvshow_card(tvshow: CachedTvShow, language: str) -> TvShowCard:
         release_year=tvshow.release_year,
         imdb_rating=tvshow.imdb_rating,
         imdb_votes_count=tvshow.imdb_votes_count,
-        poster_url=tvshow.poster_url,
+        poster_path=poster_path,
+        poster_url=build_poster_url(poster_path, image_size) or tvshow.poster_url,
         trailer_url=tvshow.trailer_url_fr if is_french else tvshow.trailer_url_en,
         overview=tvshow.overview_fr if is_french else tvshow.overview_en,
     )
 
 
+@traced
+def to_tvshow_cards(tvshows: list[CachedTvShow], language: str) -> CardList:
+    return CardList("tv", tvshows, language, to_tvshow_card)
+
 
 
+@traced
 def recommend_tvshows_by_filters(filters: TvShowSearchFilters, user_id: int, database: Session, language: str) -> list[TvShowCard]:
     """
     Recommends a list of high-quality TV shows that the user hasn't seen,
@@ -198,69 +265,62 @@ def recommend_tvshows_by_filters(filters: TvShowSearchFilters, user_id: int, dat
     tmdb_ids = fetch_unseen_tmdb_ids(filters, user_id, database)
     enrich_and_cache_tvshows(tmdb_ids)
     cached_tvshows = fetch_tvshows_from_cache(tmdb_ids, database)
-    reranked = rerank_and_imdb_filter_tvshows(cached_tvshows, filters)
-    return [to_tvshow_card(tv, language) for tv in reranked]
+    affinity = load_user_affinity(user_id, "tv", database) if filters.sort_by == "personalized" else None
+    reranked = rerank_and_imdb_filter_tvshows(cached_tvshows, filters, affinity)
+    return to_tvshow_cards(reranked, language)
 
 
+@traced
 def recommend_similar_tvshows(user_input: str, user_id: int, database: Session, language: str) -> list[TvShowCard]:
     """
-    Main entrypoint: LLM-driven similar TV show recommender
+    Main entrypoint: similar TV show recommender. Served from the local similarity index
+    when the reference show is in the catalog, LLM-driven otherwise.
     """
-    similar_tvshows = get_similar_titles_with_llm("tv", user_input)
-    if not similar_tvshows:
-        return []
-
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "tv", tvshow["title"], tvshow["year"])
-            for tvshow in similar_tvshows
-        ]
-        tmdb_ids = [result for result in (f.result() for f in futures) if result is not None]
-
     excluded_ids = fetch_excluded_ids("tv", user_id, database)
-    filtered_ids = [mid for mid in tmdb_ids if mid not in excluded_ids]
-    enrich_and_cache_tvshows(filtered_ids)
+    local_ids = [tid for tid in find_similar_tmdb_ids("tv", user_input, database) or [] if tid not in excluded_ids]
+    if local_ids:
+        return to_tvshow_cards(fetch_tvshows_from_cache(local_ids, database), language)
+
+    filtered_ids = resolve_and_cache_tvshows(get_similar_titles_with_llm("tv", user_input), excluded_ids)
     cached_tvshows = fetch_tvshows_from_cache(filtered_ids, database)
-    return [to_tvshow_card(tv, language) for tv in cached_tvshows]
+    return to_tvshow_cards(cached_tvshows, language)
 
 
+@traced
 def search_tvshows_by_title(user_input: str, database: Session, language: str) -> list[TvShowCard]:
     """
-    Main entrypoint: LLM-driven keyword-based TV show search
+    Main entrypoint: keyword-based TV show search. Local keyword search over cached titles first,
+    LLM-driven extraction + TMDB search only when nothing matches.
     """
-    matching_tvshows = extract_tvshow_titles_with_llm(user_input)
-    if not matching_tvshows:
-        return []
+    local_ids = search_by_title("tv", user_input, database)
+    if local_ids:
+        return to_tvshow_cards(fetch_tvshows_from_cache(local_ids, database), language)
 
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "tv", tvshow["title"], tvshow["year"])
-            for tvshow in matching_tvshows
-        ]
-        tmdb_ids = [result for result in (f.result() for f in futures) if result is not None]
-
-    enrich_and_cache_tvshows(tmdb_ids)
+    tmdb_ids = resolve_and_cache_tvshows(extract_tvshow_titles_with_llm(user_input))
     cached_tvshows = fetch_tvshows_from_cache(tmdb_ids, database)
-    return [to_tvshow_card(tv, language) for tv in cached_tvshows]
+    return to_tvshow_cards(cached_tvshows, language)
 
 
+@traced
 def recommend_tvshows_from_description(user_input: str, user_id: int, database: Session, language: str) -> list[TvShowCard]:
     """
-    LLM-powered recommendation based on free-form user description of mood, theme, or story (TV shows).
+    Recommendation based on free-form user description of mood, theme, or story (TV shows).
+    Answered from the local full-text index when enough cached shows match every term;
+    otherwise LLM suggestions come first, followed by the local partial matches.
     """
-    raw_titles = get_titles_from_description_with_llm("tv", user_input)
-    if not raw_titles:
-        return []
+    excluded_ids = fetch_excluded_ids("tv", user_id, database)
+    local_ids = [
+        tid for tid in search_by_description("tv", user_input, database, DESCRIPTION_LOCAL_LIMIT, match_all=True)
+        if tid not in excluded_ids
+    ]
+    if len(local_ids) >= DESCRIPTION_LOCAL_MIN_RESULTS:
+        return to_tvshow_cards(fetch_tvshows_from_cache(local_ids, database), language)
 
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = [
-            executor.submit(call_tmdb_media_id_by_media_name_endpoint, "tv", item["title"], item["year"])
-            for item in raw_titles
-        ]
-        tmdb_ids = [res for res in (f.result() for f in futures) if res is not None]
+    filtered_ids = resolve_and_cache_tvshows(get_titles_from_description_with_llm("tv", user_input), excluded_ids)
 
-    excluded_ids = fetch_excluded_ids("tv", user_id, database)
-    filtered_ids = [mid for mid in tmdb_ids if mid not in excluded_ids]
-    enrich_and_cache_tvshows(filtered_ids)
-    cached = fetch_tvshows_from_cache(filtered_ids, database)
-    return [to_tvshow_card(tv, language) for tv in cached]
+    local_ids += [
+        tid for tid in search_by_description("tv", user_input, database, DESCRIPTION_LOCAL_LIMIT)
+        if tid not in excluded_ids
+    ]
+    cached = fetch_tvshows_from_cache(list(dict.fromkeys(filtered_ids + local_ids)), database)
+    return to_tvshow_cards(cached, language)
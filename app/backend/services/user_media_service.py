@@ -1,11 +1,19 @@
-from typing import Tuple
+import base64
+import json
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from sqlalchemy import String, and_, delete, func, or_, select, tuple_, type_coerce, union_all
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 from app.backend.models.user_media_model import UserMedia
+from app.backend.services.card_cache import get_card_json
+from app.backend.services.stats_service import record_status_changes
+from app.backend.services.version_service import bump_library_version
 
 # these may stay separate for now
 from app.backend.schemas.movie_schemas import MovieCard
-from app.backend.services.movie_service import fetch_movies_from_cache, to_movie_card
-from app.backend.services.tvshow_service import fetch_tvshows_from_cache, to_tvshow_card
+from app.backend.services.movie_service import fetch_movies_from_cache, to_movie_card, to_movie_cards
+from app.backend.services.tvshow_service import fetch_tvshows_from_cache, to_tvshow_card, to_tvshow_cards
 from app.backend.schemas.tvshow_schemas import TvShowCard
 
 
@@ -29,22 +37,30 @@ def update_user_media_status(
 
         if status == "none":
             if existing:
+                record_status_changes(database, user_id, [(media_type, tmdb_id, existing.status, status)])
                 database.delete(existing)
+                bump_library_version(database, user_id)
                 database.commit()
                 return True, f"{media_type.title()} removed from list"
             else:
                 return True, "No entry to remove"
 
+        old_status = existing.status if existing else None
+        snapshots = record_status_changes(database, user_id, [(media_type, tmdb_id, old_status, status)])
         if existing:
+            if old_status != status:
+                existing.stat_snapshot = snapshots.get((media_type, tmdb_id))
             existing.status = status
         else:
             database.add(UserMedia(
                 media_type=media_type,
                 user_id=user_id,
                 tmdb_id=tmdb_id,
-                status=status
+                status=status,
+                stat_snapshot=snapshots.get((media_type, tmdb_id)),
             ))
 
+        bump_library_version(database, user_id)
         database.commit()
         return True, f"{media_type.title()} status updated successfully"
 
@@ -53,6 +69,64 @@ def update_user_media_status(
         return False, f"Database Error: {e}"
     
 
+BATCH_CHUNK_SIZE = 500
+
+
+def apply_user_media_statuses(user_id: int, items: list[tuple[str, int, str]], database: Session, commit: bool = True) -> dict:
+    """
+    Sets many (media_type, tmdb_id, status) entries at once: one SELECT + upsert / delete per chunk,
+    a single stats update and library version bump, instead of a SELECT + write + commit per title.
+    The last status wins for duplicates; unchanged entries keep their updated_at.
+    """
+    latest = {(media_type, tmdb_id): status for media_type, tmdb_id, status in items}
+    removals = [key for key, status in latest.items() if status == "none"]
+
+    keys = list(latest)
+    previous = {}
+    for start in range(0, len(keys), BATCH_CHUNK_SIZE):
+        previous.update({
+            (media_type, tmdb_id): status
+            for media_type, tmdb_id, status in database.execute(
+                select(UserMedia.media_type, UserMedia.tmdb_id, UserMedia.status).where(
+                    UserMedia.user_id == user_id,
+                    tuple_(UserMedia.media_type, UserMedia.tmdb_id).in_(keys[start:start + BATCH_CHUNK_SIZE]),
+                )
+            )
+        })
+    snapshots = record_status_changes(
+        database, user_id, [(media_type, tmdb_id, previous.get((media_type, tmdb_id)), status) for (media_type, tmdb_id), status in latest.items()]
+    )
+    upserts = [
+        {"user_id": user_id, "media_type": media_type, "tmdb_id": tmdb_id, "status": status,
+         "stat_snapshot": snapshots.get((media_type, tmdb_id))}
+        for (media_type, tmdb_id), status in latest.items() if status != "none"
+    ]
+
+    updated = removed = 0
+    for start in range(0, len(upserts), BATCH_CHUNK_SIZE):
+        statement = insert(UserMedia).values(upserts[start:start + BATCH_CHUNK_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=[UserMedia.user_id, UserMedia.tmdb_id, UserMedia.media_type],
+            set_={"status": statement.excluded.status, "stat_snapshot": statement.excluded.stat_snapshot, "updated_at": func.now()},
+            where=UserMedia.status != statement.excluded.status,
+        )
+        updated += database.execute(statement).rowcount
+
+    for start in range(0, len(removals), BATCH_CHUNK_SIZE):
+        removed += database.execute(
+            delete(UserMedia).where(
+                UserMedia.user_id == user_id,
+                tuple_(UserMedia.media_type, UserMedia.tmdb_id).in_(removals[start:start + BATCH_CHUNK_SIZE]),
+            )
+        ).rowcount
+
+    if updated or removed:
+        bump_library_version(database, user_id)
+    if commit:
+        database.commit()
+    return {"updated": updated, "removed": removed}
+
+
 def get_user_media_by_status(
     media_type: str,
     user_id: int,
@@ -78,11 +152,114 @@ def get_user_media_by_status(
 
     if media_type == "movie":
         cached = fetch_movies_from_cache(listed_ids, database)
-        return [to_movie_card(m, language) for m in cached]
+        return to_movie_cards(cached, language)
     
     elif media_type == "tv":
         cached = fetch_tvshows_from_cache(listed_ids, database)
-        return [to_tvshow_card(m, language) for m in cached]
+        return to_tvshow_cards(cached, language)
 
     else:
-        return []  
+        return []
+
+
+# ─────────────────────────────────────────────
+# LIBRARY (all media types + statuses, keyset pagination)
+MEDIA_TYPES = ("movie", "tv")
+LIBRARY_STATUSES = ("seen", "towatchlater", "hidden")
+
+
+@dataclass
+class LibraryEntry:
+    media_type: str
+    status: str
+    updated_at: str     # as stored, so it round-trips exactly through the cursor
+    row: object         # CachedMovie / CachedTvShow
+
+
+def encode_library_cursor(updated_at: str, entry_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([updated_at, entry_id]).encode("utf-8")).decode("ascii")
+
+
+def decode_library_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Raises ValueError on anything that is not a cursor we issued.
+    """
+    try:
+        updated_at, entry_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(updated_at, str) or not isinstance(entry_id, int):
+        raise ValueError("Invalid cursor")
+    return updated_at, entry_id
+
+
+def get_user_library_page(
+    user_id: int,
+    database: Session,
+    media_type: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Tuple[list[LibraryEntry], Optional[str]]:
+    """
+    One page of the user's library, newest change first, with the cursor of the next page.
+    Each (media_type, status) pair is a bounded range scan on ix_user_media_library,
+    merged in a single UNION ALL, so page cost stays flat however large the library is.
+    """
+    # Compared as stored text: no CAST, so the index still serves the range
+    updated_at = type_coerce(UserMedia.updated_at, String)
+
+    branches = []
+    for branch_media_type in ([media_type] if media_type else MEDIA_TYPES):
+        for branch_status in ([status] if status else LIBRARY_STATUSES):
+            query = (
+                select(UserMedia.id, UserMedia.tmdb_id, UserMedia.media_type, UserMedia.status, updated_at.label("updated_at"))
+                .where(
+                    UserMedia.user_id == user_id,
+                    UserMedia.media_type == branch_media_type,
+                    UserMedia.status == branch_status,
+                )
+            )
+            if cursor:
+                cursor_updated_at, cursor_id = decode_library_cursor(cursor)
+                query = query.where(
+                    updated_at <= cursor_updated_at,
+                    or_(updated_at < cursor_updated_at, and_(updated_at == cursor_updated_at, UserMedia.id < cursor_id)),
+                )
+            branch = query.order_by(UserMedia.updated_at.desc(), UserMedia.id.desc()).limit(limit + 1)
+            branches.append(select(branch.subquery()))
+
+    merged = union_all(*branches).subquery()
+    rows = database.execute(
+        select(merged).order_by(merged.c.updated_at.desc(), merged.c.id.desc()).limit(limit + 1)
+    ).all()
+
+    page, has_more = rows[:limit], len(rows) > limit
+    next_cursor = encode_library_cursor(page[-1].updated_at, page[-1].id) if has_more else None
+
+    cached = {
+        "movie": {m.tmdb_id: m for m in fetch_movies_from_cache([r.tmdb_id for r in page if r.media_type == "movie"], database)},
+        "tv": {t.tmdb_id: t for t in fetch_tvshows_from_cache([r.tmdb_id for r in page if r.media_type == "tv"], database)},
+    }
+    entries = [
+        LibraryEntry(r.media_type, r.status, r.updated_at, cached[r.media_type][r.tmdb_id])
+        for r in page if r.tmdb_id in cached.get(r.media_type, {})
+    ]
+    return entries, next_cursor
+
+
+def render_library_page(entries: list[LibraryEntry], next_cursor: Optional[str], language: str, image_size: str) -> bytes:
+    """
+    LibraryPage JSON, with every card spliced from the card JSON cache.
+    """
+    builders = {"movie": to_movie_card, "tv": to_tvshow_card}
+    items = b",".join(
+        b'{"media_type":%s,"status":%s,"updated_at":%s,"card":%s}' % (
+            json.dumps(entry.media_type).encode("utf-8"),
+            json.dumps(entry.status).encode("utf-8"),
+            json.dumps(entry.updated_at.replace(" ", "T")).encode("utf-8"),
+            get_card_json(entry.media_type, entry.row, language, image_size, builders[entry.media_type]),
+        )
+        for entry in entries
+    )
+    return b'{"items":[%s],"next_cursor":%s}' % (items, json.dumps(next_cursor).encode("utf-8"))
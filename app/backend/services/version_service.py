@@ -0,0 +1,120 @@
+import hashlib
+import json
+from typing import Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event, literal, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.backend.models.catalog_version_model import CatalogVersion
+from app.backend.models.library_version_model import LibraryVersion
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_media_model import UserMedia
+
+
+
+# ─────────────────────────────────────────────
+# CATALOG ROW VERSIONS
+def next_catalog_version(connection, media_type: str) -> int:
+    """
+    Hands out the next row_version for a media type (a per-type sequence in catalog_versions).
+    Runs on the caller's connection, so it commits or rolls back with the row change itself.
+    """
+    statement = (
+        insert(CatalogVersion)
+        .values(media_type=media_type, version=1)
+        .on_conflict_do_update(index_elements=[CatalogVersion.media_type], set_={"version": CatalogVersion.version + 1})
+        .returning(CatalogVersion.version)
+    )
+    return connection.execute(statement).scalar_one()
+
+
+def _stamp_row_version(media_type: str):
+    def stamp(mapper, connection, target):
+        target.row_version = next_catalog_version(connection, media_type)
+        bump_listing_library_versions(connection, media_type, [target.tmdb_id])
+    return stamp
+
+
+def _bump_on_delete(media_type: str):
+    def bump(mapper, connection, target):
+        next_catalog_version(connection, media_type)
+        bump_listing_library_versions(connection, media_type, [target.tmdb_id])
+    return bump
+
+
+for _model, _media_type in ((CachedMovie, "movie"), (CachedTvShow, "tv")):
+    event.listen(_model, "before_insert", _stamp_row_version(_media_type))
+    event.listen(_model, "before_update", _stamp_row_version(_media_type))
+    event.listen(_model, "after_delete", _bump_on_delete(_media_type))
+
+
+# ─────────────────────────────────────────────
+# USER LIBRARY VERSIONS
+def bump_library_version(database: Session, user_id: int):
+    """
+    Marks the user's library as changed. Does not commit: call it inside the transaction that changes user_media.
+    """
+    database.execute(
+        insert(LibraryVersion)
+        .values(user_id=user_id, version=1)
+        .on_conflict_do_update(index_elements=[LibraryVersion.user_id], set_={"version": LibraryVersion.version + 1})
+    )
+
+
+def bump_listing_library_versions(connection, media_type: str, tmdb_ids):
+    """
+    Bumps the library version of every user whose list holds one of `tmdb_ids` (a list or a select),
+    so their cached library responses go stale when those catalog rows change.
+    Runs on the caller's connection, inside the transaction that changes the catalog rows.
+    """
+    listing_users = (
+        select(UserMedia.user_id, literal(1))
+        .where(UserMedia.media_type == media_type, UserMedia.tmdb_id.in_(tmdb_ids))
+        .distinct()
+    )
+    connection.execute(
+        insert(LibraryVersion)
+        .from_select([LibraryVersion.user_id, LibraryVersion.version], listing_users)
+        .on_conflict_do_update(index_elements=[LibraryVersion.user_id], set_={"version": LibraryVersion.version + 1})
+    )
+
+
+# ─────────────────────────────────────────────
+# ETAGS
+def library_etag(database: Session, user_id: int, media_types: Iterable[str], *variant) -> str:
+    """
+    Strong ETag of a library response: the user's library version and whatever else shapes the body
+    (status, language, poster size, page). Catalog changes to listed titles bump the library version,
+    so this only reads library_versions, never user_media or the catalog.
+    """
+    media_types = sorted(media_types)
+    library_version = database.execute(
+        select(LibraryVersion.version).where(LibraryVersion.user_id == user_id)
+    ).scalar() or 0
+
+    key = [user_id, library_version, media_types, list(variant)]
+    return '"%s"' % hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()[:32]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(request: Request, etag: str, render: Callable[[], Response]) -> Response:
+    """
+    304 when the client already holds `etag`, otherwise the rendered response. Both carry the ETag,
+    and `no-cache` so clients always revalidate instead of reusing a list blindly.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response = render()
+    response.headers.update(headers)
+    return response
@@ -1,4 +1,7 @@
 import json
+import re
+import unicodedata
+from functools import lru_cache
 from pathlib import Path
 
 # Mappings File Directory :
@@ -16,8 +19,10 @@ def read_json(path):
         return json.load(f)
 
 
-# Load Genre Mapping only once:
-GENRE_MAPPING = read_json(MAPPING_FILE_PATH)
+# Load Genre Mapping only once, on first lookup:
+@lru_cache(maxsize=1)
+def get_genre_mapping() -> dict:
+    return read_json(MAPPING_FILE_PATH)
 
 
 def map_genre_to_id(media_type: str, language: str, genre: str) -> int | None:
@@ -25,7 +30,7 @@ def map_genre_to_id(media_type: str, language: str, genre: str) -> int | None:
     if not isinstance(genre, str) or not genre.strip():
         return None
 
-    mapping = GENRE_MAPPING.get(media_type).get(language).get("genre_to_id", {})
+    mapping = get_genre_mapping().get(media_type).get(language).get("genre_to_id", {})
 
     genre_id = mapping.get(genre.lower().strip())
 
@@ -37,10 +42,23 @@ def map_genre_to_id(media_type: str, language: str, genre: str) -> int | None:
 
 def map_id_to_genre(media_type: str, language: str, id: int) -> str:
 
-    mapping = GENRE_MAPPING.get(media_type).get(language).get("id_to_genre", {})
+    mapping = get_genre_mapping().get(media_type).get(language).get("id_to_genre", {})
 
     genre_name = mapping.get(str(id))
     
     if genre_name is None:
         raise ValueError(f"Genre with id : {id}, was not found in mapping.")
     return genre_name.lower()
+
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def fold_text(text: str) -> str:
+    """
+    Lowercase, accents stripped, punctuation collapsed to single spaces:
+    "Amélie (Le Fabuleux Destin d'…)" → "amelie le fabuleux destin d".
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.lower()).strip()
@@ -1,5 +1,7 @@
 import pytest
 
+from app.backend.core.security import PasswordHashingBusy
+
 # ---------- SIGNUP TESTS ----------
 
 def test_signup_success(client):
@@ -138,3 +140,19 @@ def test_login_missing_password(client):
 
     response = client.post("/auth/login", json=login_payload)
     assert response.status_code == 422
+
+
+def test_login_returns_503_when_hash_pool_is_busy(client, mocker):
+    client.post("/auth/signup", json={
+        "first_name": "Busy",
+        "last_name": "Pool",
+        "email": "busy@example.com",
+        "password": "password123"
+    })
+    mocker.patch(
+        "app.backend.services.auth_service.verify_password_async", side_effect=PasswordHashingBusy()
+    )
+
+    response = client.post("/auth/login", json={"email": "busy@example.com", "password": "password123"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
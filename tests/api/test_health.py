@@ -0,0 +1,14 @@
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_metrics_exposes_request_spans_and_executor_stats(client):
+    client.get("/health")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'span="http GET /health"' in response.text
+    assert "app_io_executor_queue_depth" in response.text
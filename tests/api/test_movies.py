@@ -209,3 +209,28 @@ def test_movies_search_vote_count_threshold(client, user_token):
     assert response.status_code == 200
     for movie in response.json():
         assert movie["imdb_votes_count"] >= 100000
+
+
+def test_search_by_title_is_served_from_the_local_catalog(client, user_token, test_db_session, mocker):
+    from datetime import date
+    from app.backend.models.movie_model import CachedMovie
+    from app.backend.models.tvshow_model import CachedTvShow
+
+    for model, tmdb_id, title in ((CachedMovie, 27205, "Inception"), (CachedTvShow, 1396, "Breaking Bad")):
+        test_db_session.add(model(
+            tmdb_id=tmdb_id, imdb_id=f"tt{tmdb_id:07d}", imdb_rating=8.8, imdb_votes_count=1000, release_year=2010,
+            poster_url="https://image.tmdb.org/t/p/original/x.jpg", genre_ids=[18], title_en=title,
+            cache_update_date=date(2025, 1, 1),
+        ))
+    test_db_session.commit()
+    mocker.patch("app.backend.services.movie_service.extract_movie_titles_with_llm", side_effect=AssertionError)
+    mocker.patch("app.backend.services.tvshow_service.extract_tvshow_titles_with_llm", side_effect=AssertionError)
+
+    headers = {"Authorization": f"Bearer {user_token}"}
+    response = client.post("/movies/search-by-title", headers=headers, json={"keywords": "inception"})
+    assert response.status_code == 200
+    assert [card["tmdb_id"] for card in response.json()] == [27205]
+
+    response = client.post("/tvshows/search-by-title", headers=headers, json={"keywords": "breaking"})
+    assert response.status_code == 200
+    assert [card["tmdb_id"] for card in response.json()] == [1396]
@@ -118,4 +118,100 @@ def test_removed_movie_is_not_in_any_list(client, user_token):
 
     assert all(603 not in [m["tmdb_id"] for m in lst] for lst in [seen, later, hidden])
 
-    """
\ No newline at end of file
+    """
+
+def test_get_seen_movies_rejects_unknown_image_size(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+    response = client.get("/users/me/movies/seen?preferred_image_size=w9999", headers=headers)
+    assert response.status_code == 422
+
+
+def test_library_lists_all_media_and_rejects_bad_cursor(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+    client.post("/users/me/movies/update_status", json={"tmdb_id": 12345, "status": "seen"}, headers=headers)
+
+    response = client.get("/users/me/library?limit=10", headers=headers)
+    assert response.status_code == 200
+    # No catalog row for 12345 in the test DB: the entry is listed only once cached
+    assert response.json() == {"items": [], "next_cursor": None}
+
+    assert client.get("/users/me/library?cursor=bogus", headers=headers).status_code == 400
+
+
+def test_seen_movies_revalidates_with_etag(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+    first = client.get("/users/me/movies/seen", headers=headers)
+    etag = first.headers["ETag"]
+
+    unchanged = client.get("/users/me/movies/seen", headers={**headers, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+
+    client.post("/users/me/movies/update_status", json={"tmdb_id": 12345, "status": "seen"}, headers=headers)
+    changed = client.get("/users/me/movies/seen", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_not_modified_library_skips_catalog_and_user_media(client, user_token, test_db_session):
+    from sqlalchemy import event
+
+    from datetime import date
+    from app.backend.models.movie_model import CachedMovie
+
+    headers = {"Authorization": f"Bearer {user_token}"}
+    test_db_session.add(CachedMovie(
+        tmdb_id=603, imdb_id="tt0133093", imdb_rating=8.7, imdb_votes_count=2000000, release_year=1999,
+        poster_url="https://image.tmdb.org/t/p/original/matrix.jpg", genre_ids=[28], title_en="The Matrix",
+        cache_update_date=date(2025, 1, 1),
+    ))
+    test_db_session.commit()
+    client.post("/users/me/movies/update_status", json={"tmdb_id": 603, "status": "seen"}, headers=headers)
+    first = client.get("/users/me/library", headers=headers)
+    assert first.json()["items"][0]["card"]["title"] == "The Matrix"
+    etag = first.headers["ETag"]
+
+    statements = []
+    engine = test_db_session.get_bind()
+    capture = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get("/users/me/library", headers={**headers, "If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 304
+    assert not any(table in s for s in statements for table in ("FROM movies", "FROM tvshows", "FROM user_media"))
+
+
+def test_batch_statuses_update_every_list(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+    items = [
+        {"media_type": "movie", "tmdb_id": 1, "status": "seen"},
+        {"media_type": "tv", "tmdb_id": 2, "status": "hidden"},
+        {"media_type": "movie", "tmdb_id": 3, "status": "none"},
+    ]
+    response = client.post("/users/me/statuses", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "updated": 2, "removed": 0}
+
+
+def test_import_rejects_unknown_csv(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}", "Content-Type": "text/csv"}
+    response = client.post("/users/me/import", content=b"foo,bar\n1,2\n", headers=headers)
+    assert response.status_code == 400
+
+    response = client.post("/users/me/import", content=b"Const,Title\n", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["rows"] == 0
+
+
+def test_stats_count_statuses(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+    client.post("/users/me/movies/update_status", json={"tmdb_id": 1, "status": "seen"}, headers=headers)
+    client.post("/users/me/tvshows/update_status", json={"tmdb_id": 2, "status": "towatchlater"}, headers=headers)
+
+    response = client.get("/users/me/stats", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["total_seen"] == 1
+    assert response.json()["watch_later_count"] == 1
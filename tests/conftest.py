@@ -9,6 +9,8 @@ from app.backend.main import app
 
 
 from app.backend.core.dependencies import get_db
+from app.backend.core.auth_cache import clear_auth_caches
+from app.backend.services.card_cache import clear_card_cache
 import gc 
 
 # Step 1: Define a file-based DB
@@ -41,6 +43,10 @@ def setup_test_db():
     # Override get_db for all tests
     app.dependency_overrides[get_db] = override_get_db
 
+    # Users and cached rows are recreated per test: don't serve entries cached by a previous one
+    clear_auth_caches()
+    clear_card_cache()
+
     # Yield so tests can run
     yield
 
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.backend.core import auth_cache
+from app.backend.core.dependencies import get_current_user
+from app.backend.core.security import create_access_token
+from app.backend.models.user_model import User
+
+
+def make_user(database, email="cache@example.com") -> User:
+    user = User(first_name="Cache", last_name="Test", email=email, password_hash="x")
+    database.add(user)
+    database.commit()
+    return user
+
+
+def credentials(email: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": email}))
+
+
+def test_token_is_decoded_once(mocker, test_db_session):
+    make_user(test_db_session)
+    decode = mocker.spy(auth_cache, "decode_access_token")
+    token = credentials("cache@example.com")
+
+    first = get_current_user(token, test_db_session)
+    second = get_current_user(token, test_db_session)
+
+    assert first == second
+    assert decode.call_count == 1
+
+
+def test_principal_served_from_cache_and_invalidated_on_update(test_db_session):
+    user = make_user(test_db_session)
+    token = credentials("cache@example.com")
+    assert get_current_user(token, test_db_session).first_name == "Cache"
+
+    # A cache hit does not touch the DB at all
+    assert get_current_user(token, database=None).id == user.id
+
+    user.first_name = "Renamed"
+    test_db_session.commit()
+    assert get_current_user(token, test_db_session).first_name == "Renamed"
+
+
+def test_principal_is_evicted_on_commit_not_on_flush(test_db_session):
+    user = make_user(test_db_session)
+    token = credentials("cache@example.com")
+    get_current_user(token, test_db_session)
+
+    user.first_name = "Flushed"
+    test_db_session.flush()
+    assert get_current_user(token, database=None).first_name == "Cache"
+
+    test_db_session.rollback()
+    assert get_current_user(token, database=None).first_name == "Cache"
+
+    user.first_name = "Committed"
+    test_db_session.commit()
+    assert get_current_user(token, test_db_session).first_name == "Committed"
+
+
+def test_invalid_token_is_rejected(test_db_session):
+    bad = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt")
+    with pytest.raises(HTTPException):
+        get_current_user(bad, test_db_session)
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from app.backend.core.executor import IOExecutor
+
+
+def test_map_preserves_input_order():
+    executor = IOExecutor(max_workers=4, per_request_limit=2)
+    try:
+        results = executor.map(lambda x: x * 2, [3, 1, 2])
+        assert results == [6, 2, 4]
+    finally:
+        executor.shutdown()
+
+
+def test_map_respects_per_request_limit():
+    executor = IOExecutor(max_workers=8, per_request_limit=2)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def task(_):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+
+    try:
+        executor.map(task, range(10))
+        assert peak <= 2
+    finally:
+        executor.shutdown()
+
+
+def test_map_dispatches_generator_items_as_they_are_produced():
+    executor = IOExecutor(max_workers=4, per_request_limit=4)
+    first_started = threading.Event()
+
+    def items():
+        yield 1
+        # The first task runs while the producer is still working on the next item
+        assert first_started.wait(timeout=5)
+        yield 2
+
+    def task(x):
+        if x == 1:
+            first_started.set()
+        return x * 10
+
+    try:
+        assert executor.map(task, items()) == [10, 20]
+    finally:
+        executor.shutdown()
+
+
+def test_stats_track_submitted_and_completed():
+    executor = IOExecutor(max_workers=2, per_request_limit=2)
+    try:
+        executor.map(lambda x: x, range(5))
+        stats = executor.stats()
+        assert stats["submitted_total"] == 5
+        assert stats["completed_total"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["active"] == 0
+        assert stats["wait_seconds_max"] >= 0
+    finally:
+        executor.shutdown()
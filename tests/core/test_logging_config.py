@@ -0,0 +1,28 @@
+import json
+import logging
+
+from app.backend.core.logging_config import DebugSampler, StructuredFormatter
+
+
+def make_record(level: int, msg: str = "hello", **fields) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, None, None)
+    record.__dict__.update(fields)
+    return record
+
+
+def test_debug_sampler_only_drops_debug_records():
+    sampler = DebugSampler(rate=0.0)
+    assert sampler.filter(make_record(logging.DEBUG)) is False
+    assert sampler.filter(make_record(logging.INFO)) is True
+    assert DebugSampler(rate=1.0).filter(make_record(logging.DEBUG)) is True
+
+
+def test_structured_formatter_renders_extra_fields():
+    record = make_record(logging.INFO, "TMDB discover page fetched", page=2, results=20)
+
+    text = StructuredFormatter().format(record)
+    assert text.endswith("TMDB discover page fetched | page=2 results=20")
+
+    entry = json.loads(StructuredFormatter(as_json=True).format(record))
+    assert entry["level"] == "INFO"
+    assert entry["page"] == 2 and entry["results"] == 20
@@ -0,0 +1,27 @@
+import json
+import subprocess
+import sys
+
+
+def test_importing_the_app_defers_heavy_dependencies():
+    # Fresh interpreter: the test session itself may already have imported them
+    code = (
+        "import json, sys\n"
+        "import app.backend.main\n"
+        "from app.backend.utils.utils import get_genre_mapping\n"
+        "print(json.dumps({'openai': 'openai' in sys.modules, 'genres': get_genre_mapping.cache_info().currsize}))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    loaded = json.loads(output.strip().splitlines()[-1])
+    assert loaded == {"openai": False, "genres": 0}
+
+
+def test_openai_client_is_built_once(mocker):
+    from app.backend.core import openai_client
+
+    mocker.patch.object(openai_client, "_openai_client", None)
+    constructor = mocker.patch("openai.OpenAI")
+
+    assert openai_client.get_openai_client() is openai_client.get_openai_client()
+    assert constructor.call_count == 1
@@ -0,0 +1,45 @@
+from app.backend.core.executor import IOExecutor
+from app.backend.core.tracing import (
+    end_trace,
+    render_prometheus,
+    reset_histograms,
+    span,
+    start_trace,
+    traced,
+)
+
+
+@traced
+def enrich(item):
+    return item
+
+
+def test_spans_propagate_into_executor_threads():
+    reset_histograms()
+    executor = IOExecutor(max_workers=4, per_request_limit=4)
+    token = start_trace()
+    try:
+        with span("request"):
+            executor.map(enrich, range(3))
+    finally:
+        trace = end_trace(token)
+        executor.shutdown()
+
+    worker_spans = [s for s in trace.spans if s[0] == "test_tracing.enrich"]
+    assert len(worker_spans) == 3
+    assert all(parent == "request" for _, parent, _, _ in worker_spans)
+
+
+def test_render_prometheus_exposes_cumulative_histograms():
+    reset_histograms()
+    with span("stage"):
+        pass
+    with span("stage"):
+        pass
+
+    text = render_prometheus({"app_io_executor_queue_depth": 0, "app_io_executor_submitted_total": 7})
+
+    assert 'app_span_duration_seconds_bucket{span="stage",le="+Inf"} 2' in text
+    assert 'app_span_duration_seconds_count{span="stage"} 2' in text
+    assert "# TYPE app_io_executor_queue_depth gauge" in text
+    assert "# TYPE app_io_executor_submitted_total counter" in text
@@ -0,0 +1,33 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.backend.scripts.backfill_poster_paths import backfill_poster_paths
+
+
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        for table in ("movies", "tvshows"):
+            connection.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, poster_url VARCHAR NOT NULL)"))
+        connection.execute(text(
+            "INSERT INTO movies VALUES "
+            "(1, 'https://image.tmdb.org/t/p/original/abc.jpg'), (2, 'https://example.com/poster.jpg')"
+        ))
+        connection.execute(text("INSERT INTO tvshows VALUES (1, 'https://image.tmdb.org/t/p/original/show.png')"))
+    return engine
+
+
+def test_backfill_adds_column_and_fills_tmdb_paths(tmp_path):
+    engine = legacy_engine(tmp_path)
+
+    assert backfill_poster_paths(engine) == {"movie": 1, "tv": 1}
+
+    assert "poster_path" in {c["name"] for c in inspect(engine).get_columns("movies")}
+    with engine.connect() as connection:
+        movies = connection.execute(text("SELECT id, poster_path FROM movies ORDER BY id")).fetchall()
+        shows = connection.execute(text("SELECT poster_path FROM tvshows")).fetchall()
+    assert [tuple(row) for row in movies] == [(1, "/abc.jpg"), (2, None)]
+    assert shows[0][0] == "/show.png"
+
+    # Re-running only revisits rows that still have no path
+    assert backfill_poster_paths(engine) == {"movie": 0, "tv": 0}
+    engine.dispose()
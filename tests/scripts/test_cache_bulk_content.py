@@ -0,0 +1,77 @@
+import pytest
+import requests
+
+from app.backend.core.executor import IOExecutor
+from app.backend.scripts import cache_bulk_content as bulk
+
+
+@pytest.fixture()
+def executor():
+    executor = IOExecutor(max_workers=2, per_request_limit=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture()
+def small_crawl(mocker):
+    # 2 genres x 1 year x 2 languages = 4 combinations, overlapping results
+    mocker.patch.object(bulk, "YEARS", [2010])
+    mocker.patch.object(bulk, "SLEEP_BETWEEN_CALLS", 0)
+    discover = mocker.patch.object(
+        bulk, "call_tmdb_discover_media_endpoint",
+        side_effect=lambda media_type, filters, page, raise_errors: [{"id": 1}, {"id": 2}, {"id": filters.genre_id}],
+    )
+    enrich = mocker.Mock(return_value=True)
+    mocker.patch.dict(bulk.CRAWL_TARGETS["movie"], {"genres": ["drama", "comedy"], "enrich": enrich})
+    return discover, enrich
+
+
+def test_crawl_dedupes_ids_before_enriching(tmp_path, test_db_session, executor, small_crawl):
+    discover, enrich = small_crawl
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    bulk.crawl_media("movie", test_db_session, executor, {}, checkpoint_path, max_pages=3)
+
+    assert discover.call_count == 4  # short page -> one call per combination
+    enriched_ids = sorted(call.args[0] for call in enrich.call_args_list)
+    assert enriched_ids == [1, 2, 18, 35]
+
+
+def test_crawl_resumes_from_checkpoint(tmp_path, test_db_session, executor, small_crawl):
+    discover, enrich = small_crawl
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    bulk.crawl_media("movie", test_db_session, executor, {}, checkpoint_path, max_pages=3)
+    discover.reset_mock()
+    enrich.reset_mock()
+
+    checkpoint = bulk.load_checkpoint(checkpoint_path)
+    bulk.crawl_media("movie", test_db_session, executor, checkpoint, checkpoint_path, max_pages=3)
+
+    discover.assert_not_called()
+    enrich.assert_not_called()
+
+
+def test_failed_discover_and_enrich_are_not_checkpointed(tmp_path, test_db_session, executor, small_crawl):
+    discover, enrich = small_crawl
+
+    def flaky_discover(media_type, filters, page, raise_errors):
+        if filters.original_language == "fr":
+            raise requests.ConnectionError("TMDB down")
+        return [{"id": 1}, {"id": filters.genre_id}]
+
+    discover.side_effect = flaky_discover
+    enrich.side_effect = lambda tmdb_id: tmdb_id != 1
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    bulk.crawl_media("movie", test_db_session, executor, {}, checkpoint_path, max_pages=3)
+
+    state = bulk.load_checkpoint(checkpoint_path)["movie"]
+    assert state["done_combos"] == ["comedy|2010|en", "drama|2010|en"]
+    assert state["enriched"] == [18, 35]
+
+
+def test_estimate_upstream_calls():
+    estimate = bulk.estimate_upstream_calls("movie", pending_combos=10, max_pages=5)
+    assert estimate["discover_calls"] == 50
+    assert estimate["max_enrich_calls"] == 50 * bulk.TMDB_PAGE_SIZE * 5
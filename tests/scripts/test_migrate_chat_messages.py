@@ -0,0 +1,36 @@
+import json
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.backend.scripts.migrate_chat_messages import migrate_chat_messages
+
+
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE chat_sessions (id VARCHAR PRIMARY KEY, user_id INTEGER NOT NULL, "
+            "conversation JSON NOT NULL, created_on DATETIME)"
+        ))
+        conversation = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}]
+        connection.execute(
+            text("INSERT INTO chat_sessions VALUES ('s1', 1, :conv, '2025-07-27 01:37:11'), ('s2', 1, '[]', NULL)"),
+            {"conv": json.dumps(conversation)},
+        )
+    return engine
+
+
+def test_migration_copies_blobs_and_drops_column(tmp_path):
+    engine = legacy_engine(tmp_path)
+
+    summary = migrate_chat_messages(engine)
+
+    assert summary == {"sessions": 2, "messages": 2}
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT seq, role, content FROM chat_messages ORDER BY seq")).fetchall()
+    assert [tuple(r) for r in rows] == [(1, "user", "Hi"), (2, "assistant", "Hello!")]
+    assert "conversation" not in {c["name"] for c in inspect(engine).get_columns("chat_sessions")}
+
+    # Re-running on a migrated DB is a no-op
+    assert migrate_chat_messages(engine) == {"sessions": 0, "messages": 0}
+    engine.dispose()
@@ -0,0 +1,34 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.backend.scripts.migrate_row_versions import migrate_row_versions
+
+
+def test_migration_adds_columns_and_tables_once(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+        for table in ("movies", "tvshows"):
+            connection.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, tmdb_id INTEGER)"))
+        connection.execute(text("INSERT INTO movies VALUES (1, 603)"))
+
+    assert migrate_row_versions(engine) == ["movies.row_version", "tvshows.row_version", "catalog_versions", "library_versions"]
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT row_version FROM movies")).scalar() == 0
+    assert {"catalog_versions", "library_versions"} <= set(inspect(engine).get_table_names())
+
+    assert migrate_row_versions(engine) == []
+    engine.dispose()
+
+
+def test_migration_indexes_user_media_by_title(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+        for table in ("movies", "tvshows"):
+            connection.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, tmdb_id INTEGER)"))
+        connection.execute(text("CREATE TABLE user_media (id INTEGER PRIMARY KEY, user_id INTEGER, tmdb_id INTEGER, media_type VARCHAR)"))
+
+    assert "ix_user_media_title" in migrate_row_versions(engine)
+    assert "ix_user_media_title" in {index["name"] for index in inspect(engine).get_indexes("user_media")}
+    assert migrate_row_versions(engine) == []
+    engine.dispose()
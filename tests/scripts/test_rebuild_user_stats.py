@@ -0,0 +1,40 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app.backend.core.database import Base
+from app.backend.models.user_media_model import UserMedia
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.scripts.rebuild_user_stats import rebuild_all_user_stats
+from app.backend.services.stats_service import get_user_stats
+
+
+def test_rebuild_backfills_every_user(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    Base.metadata.create_all(bind=engine)
+    UserStatCounter.__table__.drop(engine)
+    with Session(bind=engine) as database:
+        database.add_all([
+            UserMedia(user_id=1, tmdb_id=10, media_type="movie", status="seen"),
+            UserMedia(user_id=1, tmdb_id=11, media_type="movie", status="towatchlater"),
+            UserMedia(user_id=2, tmdb_id=10, media_type="tv", status="seen"),
+        ])
+        database.commit()
+
+    assert rebuild_all_user_stats(engine) == {"users": 2, "counters": 3}
+    assert rebuild_all_user_stats(engine) == {"users": 2, "counters": 3}
+    with Session(bind=engine) as database:
+        assert get_user_stats(1, database).watch_later_count == 1
+        assert get_user_stats(2, database).total_seen == 1
+    engine.dispose()
+
+
+def test_rebuild_adds_the_snapshot_column_to_an_old_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE user_media DROP COLUMN stat_snapshot"))
+        connection.execute(text("INSERT INTO user_media (user_id, tmdb_id, media_type, status) VALUES (1, 10, 'movie', 'seen')"))
+
+    assert rebuild_all_user_stats(engine) == {"users": 1, "counters": 1}
+    assert "stat_snapshot" in {column["name"] for column in inspect(engine).get_columns("user_media")}
+    engine.dispose()
@@ -0,0 +1,26 @@
+import json
+
+from app.backend.scripts.train_intent_classifier import evaluate, read_labelled_turns, train_classifier
+
+
+def test_train_and_evaluate_from_json_logs(tmp_path):
+    lines = ["2025-07-30 12:00:00 [INFO] app.backend.main - text log line", json.dumps({"message": "Request done"})]
+    lines.append(json.dumps({"message": "Chat intent classified", "source": "local", "query": "hi", "intent": "error"}))
+    for title in ("Inception", "Heat", "Alien", "Drive", "Parasite", "Oldboy"):
+        lines.append(json.dumps({"source": "llm", "query": f"movies like {title}", "intent": "similar_media", "media_type": "movie"}))
+        lines.append(json.dumps({"source": "llm", "query": f"shows like {title}", "intent": "similar_media", "media_type": "tv"}))
+        lines.append(json.dumps({"source": "llm", "query": f"comedies from the 90s {title}", "intent": "filters_parsing",
+                                 "media_type": "movie", "selected_media_type": "movie"}))
+    (tmp_path / "app.log").write_text("\n".join(lines), encoding="utf-8")
+
+    turns = read_labelled_turns([tmp_path / "app.log"])
+    assert len(turns) == 18
+    assert {turn["intent"] for turn in turns} == {"similar_media", "filters_parsing"}
+
+    report = evaluate(train_classifier(turns), turns, [0.5, 0.99])
+    assert report["turns"] == 18
+    assert report["top1_accuracy"] == 1.0
+    low, high = report["thresholds"]
+    assert low["coverage"] >= high["coverage"]
+    assert low["accuracy"] == 1.0
+    assert report["latency_p50_ms"] > 0
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.backend.core.config import CHAT_INTENT_CONFIG
+from app.backend.scripts import upstream_stub_server as stub
+from app.backend.scripts.load_test import percentile
+
+
+@pytest.fixture()
+def settings(tmp_path):
+    return stub.StubSettings(mode="replay", cassette_dir=tmp_path)
+
+
+def test_replay_miss_serves_synthetic_tmdb_discover(settings):
+    client = TestClient(stub.create_stub_app(settings))
+    response = client.get("/tmdb/discover/movie", params={"api_key": "x", "with_genres": 35, "page": 2})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 20
+    assert all(item["genre_ids"] == [35] for item in results)
+
+
+def test_replay_miss_returns_404_when_configured(settings):
+    settings.on_miss = "404"
+    client = TestClient(stub.create_stub_app(settings))
+    assert client.get("/omdb/", params={"i": "tt0133093"}).status_code == 404
+
+
+def test_record_then_replay_ignores_api_key(mocker, settings):
+    upstream = mocker.patch.object(stub.requests, "get")
+    upstream.return_value.status_code = 200
+    upstream.return_value.json.return_value = {"imdbRating": "8.7", "imdbVotes": "2,150,000"}
+
+    settings.mode = "record"
+    client = TestClient(stub.create_stub_app(settings))
+    client.get("/omdb/", params={"i": "tt0133093", "apikey": "real-key"})
+
+    settings.mode = "replay"
+    response = client.get("/omdb/", params={"i": "tt0133093", "apikey": "other-key"})
+    assert response.json() == {"imdbRating": "8.7", "imdbVotes": "2,150,000"}
+    upstream.assert_called_once()
+
+
+def test_error_injection(settings):
+    settings.error_rate = 1.0
+    client = TestClient(stub.create_stub_app(settings))
+    assert client.get("/tmdb/movie/603").status_code in (429, 500, 503)
+
+
+def test_synthetic_openai_intent_is_valid_chat_completion(settings):
+    client = TestClient(stub.create_stub_app(settings))
+    body = {
+        "model": "gpt-4.1-nano",
+        "messages": [
+            {"role": "system", "content": CHAT_INTENT_CONFIG["prompt"]},
+            {"role": "user", "content": "a good crime series"},
+        ],
+    }
+    response = client.post("/openai/v1/chat/completions", json=body)
+
+    content = json.loads(response.json()["choices"][0]["message"]["content"])
+    assert content["intent"] == "filters_parsing"
+    assert content["media_type"] == "tv"
+
+
+def test_streamed_openai_answer_matches_the_full_one(settings):
+    client = TestClient(stub.create_stub_app(settings))
+    body = {"model": "gpt-4.1-nano", "messages": [{"role": "system", "content": "x"}, {"role": "user", "content": "heists"}]}
+    full = client.post("/openai/v1/chat/completions", json=body).json()["choices"][0]["message"]["content"]
+
+    response = client.post("/openai/v1/chat/completions", json={**body, "stream": True})
+    events = [line.removeprefix("data: ") for line in response.text.splitlines() if line.startswith("data: ")]
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event)["choices"][0] for event in events[:-1]]
+    assert "".join(chunk["delta"].get("content", "") for chunk in chunks) == full
+    assert chunks[-1]["finish_reason"] == "stop"
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
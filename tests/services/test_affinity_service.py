@@ -0,0 +1,55 @@
+from datetime import date
+
+import pytest
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.schemas.movie_schemas import MovieSearchFilters
+from app.backend.services.affinity_service import AffinityVector, load_user_affinity, rank_by_affinity
+from app.backend.services.movie_service import rerank_and_imdb_filter_movies
+from app.backend.services.user_media_service import apply_user_media_statuses, update_user_media_status
+
+
+def movie(tmdb_id: int, genre_ids: list[int], year: int, rating: float = 7.0) -> CachedMovie:
+    return CachedMovie(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=rating,
+        imdb_votes_count=1000,
+        release_year=year,
+        poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+        genre_ids=genre_ids,
+        title_en=f"Title {tmdb_id}",
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+@pytest.fixture()
+def horror_fan(test_db_session):
+    test_db_session.add_all([movie(1, [27], 1981), movie(2, [27, 53], 1984), movie(3, [35], 2015)])
+    test_db_session.commit()
+    apply_user_media_statuses(1, [("movie", 1, "seen"), ("movie", 2, "seen"), ("movie", 3, "seen")], test_db_session)
+
+
+def test_affinity_follows_status_changes(test_db_session, horror_fan):
+    affinity = load_user_affinity(1, "movie", test_db_session)
+    assert affinity.weights["genre:27"] > affinity.weights["genre:35"]
+    assert affinity.weights["decade:1980"] > affinity.weights["decade:2010"]
+    assert abs(sum(w * w for w in affinity.weights.values()) - 1) < 1e-9
+
+    update_user_media_status("movie", 1, 1, test_db_session, "none")
+    update_user_media_status("movie", 2, 1, test_db_session, "hidden")
+    assert set(load_user_affinity(1, "movie", test_db_session).weights) == {"genre:35", "decade:2010"}
+
+    # Decades come from everything seen, genres only from the same media type
+    assert set(load_user_affinity(1, "tv", test_db_session).weights) == {"decade:2010"}
+    assert not load_user_affinity(2, "movie", test_db_session)
+
+
+def test_personalized_rerank_puts_matching_candidates_first(test_db_session, horror_fan):
+    candidates = [movie(10, [35], 2020, 9.0), movie(11, [27], 1986, 6.5), movie(12, [18], 1999, 8.0)]
+    affinity = load_user_affinity(1, "movie", test_db_session)
+
+    ranked = rerank_and_imdb_filter_movies(candidates, MovieSearchFilters(sort_by="personalized"), affinity)
+    assert [m.tmdb_id for m in ranked] == [11, 10, 12]
+
+    assert rank_by_affinity(candidates, AffinityVector()) == candidates
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
@@ -54,14 +56,14 @@ def test_check_user_credentials_success(fake_db, user_data):
     add_user_to_db(user_data, fake_db)
     creds = UserLogin(email=user_data.email, password=user_data.password)
 
-    user = check_user_credentials_in_db(creds, fake_db)
+    user = asyncio.run(check_user_credentials_in_db(creds, fake_db))
     assert user.email == creds.email
 
 
 def test_check_user_credentials_wrong_email(fake_db):
     creds = UserLogin(email="nonexistent@example.com", password="irrelevant")
     with pytest.raises(HTTPException) as exc:
-        check_user_credentials_in_db(creds, fake_db)
+        asyncio.run(check_user_credentials_in_db(creds, fake_db))
     assert exc.value.status_code == 401
     assert "Invalid credentials" in str(exc.value.detail)
 
@@ -70,7 +72,7 @@ def test_check_user_credentials_wrong_password(fake_db, user_data):
     add_user_to_db(user_data, fake_db)
     creds = UserLogin(email=user_data.email, password="wrongpassword")
     with pytest.raises(HTTPException) as exc:
-        check_user_credentials_in_db(creds, fake_db)
+        asyncio.run(check_user_credentials_in_db(creds, fake_db))
     assert exc.value.status_code == 401
     assert "Invalid credentials" in str(exc.value.detail)
 
@@ -78,15 +80,22 @@ def test_check_user_credentials_wrong_password(fake_db, user_data):
 # ---------- handle_signup_request ----------
 
 def test_handle_signup_request_success(fake_db, user_data):
-    result = handle_signup_request(user_data, fake_db)
+    result = asyncio.run(handle_signup_request(user_data, fake_db))
     assert result.access_token
     assert result.user.email == user_data.email
 
 
+def test_handle_signup_request_hashes_once_and_skips_verify(mocker, fake_db, user_data):
+    verify = mocker.patch("app.backend.services.auth_service.verify_password_async")
+    result = asyncio.run(handle_signup_request(user_data, fake_db))
+    assert result.user.first_name == user_data.first_name
+    verify.assert_not_called()
+
+
 def test_handle_signup_request_duplicate(fake_db, user_data):
-    handle_signup_request(user_data, fake_db)
+    asyncio.run(handle_signup_request(user_data, fake_db))
     with pytest.raises(HTTPException) as exc:
-        handle_signup_request(user_data, fake_db)
+        asyncio.run(handle_signup_request(user_data, fake_db))
     assert exc.value.status_code == 400
     assert "Email already exists" in str(exc.value.detail)
 
@@ -94,9 +103,9 @@ def test_handle_signup_request_duplicate(fake_db, user_data):
 # ---------- handle_login_request ----------
 
 def test_handle_login_request_success(fake_db, user_data):
-    handle_signup_request(user_data, fake_db)
+    asyncio.run(handle_signup_request(user_data, fake_db))
     creds = UserLogin(email=user_data.email, password=user_data.password)
-    result = handle_login_request(creds, fake_db)
+    result = asyncio.run(handle_login_request(creds, fake_db))
     assert result.access_token
     assert result.user.email == creds.email
 
@@ -104,6 +113,6 @@ def test_handle_login_request_success(fake_db, user_data):
 def test_handle_login_request_failure(fake_db):
     creds = UserLogin(email="unknown@example.com", password="whatever")
     with pytest.raises(HTTPException) as exc:
-        handle_login_request(creds, fake_db)
+        asyncio.run(handle_login_request(creds, fake_db))
     assert exc.value.status_code == 401
     assert "Invalid credentials" in str(exc.value.detail)
@@ -0,0 +1,83 @@
+import json
+from app.backend.models.movie_model import CachedMovie
+from app.backend.schemas.movie_schemas import MovieCard
+from app.backend.services import card_cache
+from app.backend.services.card_cache import CardList, card_cache_stats, card_list_response
+from app.backend.services.movie_service import to_movie_card, to_movie_cards
+
+
+def make_movie(database, tmdb_id=1, **overrides) -> CachedMovie:
+    fields = dict(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=8.8,
+        imdb_votes_count=2000000,
+        release_year=2010,
+        poster_url="https://image.tmdb.org/t/p/original/inception.jpg",
+        title_en="Inception",
+        title_fr="Origine",
+        genre_ids=[28],
+        genre_names_en=["Action"],
+        genre_names_fr=["Action"],
+        overview_en="A mind-bending thriller.",
+        overview_fr="Un thriller hallucinant.",
+    )
+    fields.update(overrides)
+    movie = CachedMovie(**fields)
+    database.add(movie)
+    database.commit()
+    return movie
+
+
+def test_spliced_json_matches_validated_cards(test_db_session):
+    movies = [make_movie(test_db_session, 1), make_movie(test_db_session, 2, title_en="Heat", title_fr="Heat")]
+
+    for language in ("en", "fr"):
+        cards = to_movie_cards(movies, language)
+        expected = [to_movie_card(movie, language).model_dump() for movie in movies]
+        assert json.loads(cards.to_json()) == expected
+        assert all(isinstance(card, MovieCard) for card in cards)
+
+
+def test_cards_serialized_once_per_row_version(mocker, test_db_session):
+    movie = make_movie(test_db_session)
+    build = mocker.Mock(side_effect=to_movie_card)
+    cards = CardList("movie", [movie], "en", build)
+
+    cards.to_json()
+    cards.to_json()
+    assert build.call_count == 1
+    assert card_cache_stats()["hits"] == 1
+
+    # A refresh done elsewhere (another process) shows up as a new row_version
+    card_cache._card_json._entries[("movie", 1, "en", "w342")] = (movie.row_version - 1, b"{}")
+    assert json.loads(cards.to_json())[0]["title"] == "Inception"
+    assert build.call_count == 2
+
+
+def test_row_update_evicts_cached_card(test_db_session):
+    movie = make_movie(test_db_session)
+    assert b"Inception" in to_movie_cards([movie], "en").to_json()
+
+    movie.title_en = "Inception (Director's Cut)"
+    test_db_session.commit()
+
+    assert b"Director's Cut" in to_movie_cards([movie], "en").to_json()
+
+
+def test_card_list_response_accepts_plain_lists():
+    response = card_list_response([])
+    assert response.body == b"[]"
+    assert response.media_type == "application/json"
+
+
+def test_cards_cached_per_poster_size(test_db_session):
+    movie = make_movie(test_db_session)
+    cards = to_movie_cards([movie], "en")
+
+    small = json.loads(card_list_response(cards, "w185").body)[0]
+    default = json.loads(card_list_response(cards).body)[0]
+
+    assert small["poster_url"] == "https://image.tmdb.org/t/p/w185/inception.jpg"
+    assert default["poster_url"] == "https://image.tmdb.org/t/p/w342/inception.jpg"
+    assert small["poster_path"] == default["poster_path"] == "/inception.jpg"
@@ -0,0 +1,73 @@
+import gzip
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from app.backend.models.catalog_candidate_model import CatalogCandidate
+from app.backend.services import catalog_bootstrap_service
+from app.backend.services.catalog_bootstrap_service import (
+    export_file_url, open_export_file, ingest_tmdb_export, next_candidates, enrich_candidates,
+)
+
+SAMPLE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "tmdb_exports" / "movie_ids_sample.json"
+
+
+@pytest.fixture()
+def seeded(test_db_session):
+    with open_export_file(SAMPLE_PATH) as stream:
+        ingest_tmdb_export(stream, "movie", test_db_session, date(2025, 7, 28), min_popularity=1.0)
+    return test_db_session
+
+
+def test_export_file_url():
+    assert export_file_url("tv", date(2025, 7, 28)) == "http://files.tmdb.org/p/exports/tv_series_ids_07_28_2025.json.gz"
+
+
+def test_ingest_skips_adult_video_and_long_tail(tmp_path, test_db_session):
+    gz_path = tmp_path / "movie_ids.json.gz"
+    with open(SAMPLE_PATH, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+
+    with open_export_file(gz_path) as stream:
+        total = ingest_tmdb_export(stream, "movie", test_db_session, min_popularity=1.0, chunk_size=2)
+
+    assert total == 3
+    ids = {row.tmdb_id for row in test_db_session.query(CatalogCandidate)}
+    assert ids == {603, 550, 13}
+
+
+def test_candidates_are_served_by_popularity(seeded):
+    assert next_candidates("movie", seeded, limit=10) == [603, 13, 550]
+
+
+def test_enrich_candidates_marks_them_done_in_priority_order(mocker, seeded):
+    enrich = mocker.Mock(return_value=True)
+    mocker.patch.dict(catalog_bootstrap_service.ENRICHERS, {"movie": enrich})
+
+    assert enrich_candidates("movie", seeded, limit=2, batch_size=1) == 2
+    assert [call.args[0] for call in enrich.call_args_list] == [603, 13]
+    assert next_candidates("movie", seeded, limit=10) == [550]
+
+
+def test_failed_candidates_stay_pending_and_are_not_retried_in_the_same_run(mocker, seeded):
+    enrich = mocker.Mock(side_effect=lambda tmdb_id: tmdb_id != 603)
+    mocker.patch.dict(catalog_bootstrap_service.ENRICHERS, {"movie": enrich})
+
+    assert enrich_candidates("movie", seeded, limit=10, batch_size=1) == 2
+    assert [call.args[0] for call in enrich.call_args_list] == [603, 13, 550]
+    assert next_candidates("movie", seeded, limit=10) == [603]
+
+
+def test_reingest_keeps_enriched_flag(seeded):
+    seeded.query(CatalogCandidate).filter_by(tmdb_id=603).update({"enriched": True})
+    seeded.commit()
+
+    with open_export_file(SAMPLE_PATH) as stream:
+        ingest_tmdb_export(stream, "movie", seeded, date(2025, 7, 29), min_popularity=1.0)
+
+    seeded.expire_all()
+    matrix = seeded.query(CatalogCandidate).filter_by(tmdb_id=603).one()
+    assert matrix.enriched is True
+    assert matrix.export_date == date(2025, 7, 29)
@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.services.catalog_search_service import rebuild_fts_index, search_by_description, search_by_title
+from app.backend.services.movie_service import recommend_movies_from_description, search_movies_by_title
+
+
+def movie(tmdb_id: int, title: str, overview: str, genres: list[str], overview_fr: str = None) -> CachedMovie:
+    return CachedMovie(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=7.5,
+        imdb_votes_count=1000,
+        release_year=2000,
+        poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+        genre_ids=[18],
+        genre_names_en=genres,
+        title_en=title,
+        overview_en=overview,
+        overview_fr=overview_fr,
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+@pytest.fixture()
+def catalog(test_db_session):
+    test_db_session.add_all([
+        movie(1, "Inception", "A thief steals secrets through dream sharing, a mind-bending heist.", ["Science Fiction"]),
+        movie(2, "Heat", "A detective hunts a crew of professional heist robbers in Los Angeles.", ["Crime"]),
+        movie(3, "Amélie", "A shy waitress changes lives in Paris.", ["Comedy"], "Une serveuse timide à Paris change des vies."),
+    ])
+    test_db_session.commit()
+
+
+def test_rows_are_indexed_on_insert_refresh_and_delete(test_db_session, catalog):
+    assert search_by_description("movie", "mind-bending heists", test_db_session, match_all=True) == [1]
+    assert sorted(search_by_description("movie", "heist", test_db_session)) == [1, 2]
+    assert search_by_description("movie", "serveuse a Paris", test_db_session) == [3]
+
+    heat = test_db_session.query(CachedMovie).filter_by(tmdb_id=2).one()
+    heat.overview_en = "A detective chases a bank robber."
+    test_db_session.commit()
+    assert search_by_description("movie", "heist", test_db_session) == [1]
+
+    test_db_session.delete(test_db_session.query(CachedMovie).filter_by(tmdb_id=1).one())
+    test_db_session.commit()
+    assert search_by_description("movie", "heist", test_db_session) == []
+
+
+def test_rebuild_refills_from_the_catalog(test_db_session, catalog):
+    test_db_session.execute(text("DELETE FROM movies_fts"))
+    assert search_by_description("movie", "waitress", test_db_session) == []
+
+    assert rebuild_fts_index(test_db_session, "movie") == 3
+    assert search_by_description("movie", "waitress", test_db_session) == [3]
+
+
+def test_description_merges_local_matches_with_llm(test_db_session, catalog, mocker):
+    llm = mocker.patch("app.backend.services.movie_service.get_titles_from_description_with_llm", return_value=[])
+    mocker.patch("app.backend.services.movie_service.DESCRIPTION_LOCAL_MIN_RESULTS", 1)
+
+    cards = recommend_movies_from_description("a dream heist", 1, test_db_session, "en")
+    assert [card.tmdb_id for card in cards] == [1]
+    llm.assert_not_called()
+
+    cards = recommend_movies_from_description("a detective story", 1, test_db_session, "en")
+    assert [card.tmdb_id for card in cards] == [2]
+    llm.assert_called_once()
+
+
+def test_title_search_folds_accents_and_ranks_by_match_then_votes(test_db_session):
+    test_db_session.add_all([
+        movie(10, "Star Wars", "", []),
+        movie(11, "Star Wars: The Empire Strikes Back", "", []),
+        movie(12, "The Stars of War", "", []),
+        movie(13, "Amélie", "", []),
+    ])
+    test_db_session.commit()
+    test_db_session.query(CachedMovie).filter_by(tmdb_id=11).update({"imdb_votes_count": 5000})
+    test_db_session.commit()
+
+    assert search_by_title("movie", "star wars", test_db_session) == [10, 11]
+    assert search_by_title("movie", "star war", test_db_session) == [11, 10, 12]
+    assert search_by_title("movie", "AMELIE", test_db_session) == [13]
+    assert search_by_title("movie", "find the movie amelie", test_db_session) == [13]
+    assert search_by_title("movie", "amelie poulain", test_db_session) == []
+
+
+def test_title_search_uses_the_llm_only_without_local_hits(test_db_session, catalog, mocker):
+    llm = mocker.patch("app.backend.services.movie_service.extract_movie_titles_with_llm", return_value=[])
+
+    assert [card.tmdb_id for card in search_movies_by_title("inception", test_db_session, "en")] == [1]
+    llm.assert_not_called()
+
+    assert search_movies_by_title("the matrix", test_db_session, "en") == []
+    llm.assert_called_once_with("the matrix")
@@ -0,0 +1,132 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.sync_retry_model import SyncRetry
+from app.backend.services import catalog_sync_service
+from app.backend.services.catalog_sync_service import (
+    fetch_changed_tmdb_ids, get_watermark, set_watermark, sync_media_changes,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "tmdb_changes"
+
+
+def recorded_changes_feed(media_type, start_date, end_date, page):
+    with open(FIXTURES_DIR / f"{media_type}_page_{page}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cached_movie(tmdb_id: int) -> CachedMovie:
+    return CachedMovie(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=8.0,
+        imdb_votes_count=1000,
+        release_year=1999,
+        poster_url="https://example.com/poster.jpg",
+        genre_ids=[18],
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+@pytest.fixture()
+def enrich_mock(mocker):
+    enrich = mocker.Mock(return_value=True)
+    mocker.patch.dict(catalog_sync_service.SYNC_TARGETS, {"movie": (CachedMovie, enrich)})
+    return enrich
+
+
+def test_fetch_changed_ids_walks_pages_and_skips_adult(mocker):
+    mocker.patch.object(catalog_sync_service, "call_tmdb_changes_endpoint", side_effect=recorded_changes_feed)
+    ids = fetch_changed_tmdb_ids("movie", date(2025, 7, 1), date(2025, 7, 2))
+    assert ids == {550, 1184918, 603}
+
+
+def test_fetch_changed_ids_splits_long_ranges_in_14_day_windows(mocker):
+    feed = mocker.patch.object(
+        catalog_sync_service, "call_tmdb_changes_endpoint",
+        return_value={"results": [], "page": 1, "total_pages": 1},
+    )
+    fetch_changed_tmdb_ids("movie", date(2025, 6, 1), date(2025, 7, 10))
+
+    windows = [(call.args[1], call.args[2]) for call in feed.call_args_list]
+    assert windows == [
+        ("2025-06-01", "2025-06-14"),
+        ("2025-06-15", "2025-06-28"),
+        ("2025-06-29", "2025-07-10"),
+    ]
+
+
+def test_sync_refreshes_only_cached_changed_rows(mocker, test_db_session, enrich_mock):
+    mocker.patch.object(catalog_sync_service, "call_tmdb_changes_endpoint", side_effect=recorded_changes_feed)
+    test_db_session.add_all([cached_movie(550), cached_movie(603), cached_movie(13)])
+    test_db_session.commit()
+
+    summary = sync_media_changes("movie", test_db_session, today=date(2025, 7, 2))
+
+    refreshed = sorted(call.args[0] for call in enrich_mock.call_args_list)
+    assert refreshed == [550, 603]
+    assert all(call.kwargs == {"force_refresh": True} for call in enrich_mock.call_args_list)
+    assert summary["changed"] == 3
+    assert summary["refreshed"] == 2
+
+
+def test_sync_starts_from_stored_watermark_and_advances_it(mocker, test_db_session, enrich_mock):
+    feed = mocker.patch.object(
+        catalog_sync_service, "call_tmdb_changes_endpoint",
+        return_value={"results": [], "page": 1, "total_pages": 1},
+    )
+    set_watermark("movie", date(2025, 6, 30), test_db_session)
+
+    sync_media_changes("movie", test_db_session, today=date(2025, 7, 2))
+
+    assert feed.call_args.args[1] == "2025-06-30"
+    assert get_watermark("movie", test_db_session) == date(2025, 7, 2)
+
+
+def test_failed_refresh_keeps_watermark_and_is_retried(mocker, test_db_session, enrich_mock):
+    mocker.patch.object(catalog_sync_service, "call_tmdb_changes_endpoint", side_effect=recorded_changes_feed)
+    test_db_session.add_all([cached_movie(550), cached_movie(603)])
+    test_db_session.commit()
+    set_watermark("movie", date(2025, 7, 1), test_db_session)
+    enrich_mock.side_effect = lambda tmdb_id, force_refresh: tmdb_id != 603
+
+    summary = sync_media_changes("movie", test_db_session, today=date(2025, 7, 2))
+
+    assert summary["failed"] == [603]
+    assert get_watermark("movie", test_db_session) == date(2025, 7, 1)
+    assert [row.tmdb_id for row in test_db_session.query(SyncRetry)] == [603]
+
+    # Next run: nothing new in the feed, the failed title is retried and the watermark catches up
+    mocker.patch.object(
+        catalog_sync_service, "call_tmdb_changes_endpoint",
+        return_value={"results": [], "page": 1, "total_pages": 1},
+    )
+    enrich_mock.reset_mock()
+    enrich_mock.side_effect = None
+
+    summary = sync_media_changes("movie", test_db_session, today=date(2025, 7, 3))
+
+    assert [call.args[0] for call in enrich_mock.call_args_list] == [603]
+    assert summary["failed"] == []
+    assert get_watermark("movie", test_db_session) == date(2025, 7, 3)
+    assert test_db_session.query(SyncRetry).count() == 0
+
+
+def test_title_failing_too_often_stops_holding_the_watermark(mocker, test_db_session, enrich_mock):
+    mocker.patch.object(
+        catalog_sync_service, "call_tmdb_changes_endpoint",
+        return_value={"results": [], "page": 1, "total_pages": 1},
+    )
+    test_db_session.add(SyncRetry(media_type="movie", tmdb_id=603, attempts=catalog_sync_service.MAX_REFRESH_ATTEMPTS - 1))
+    test_db_session.commit()
+    enrich_mock.return_value = False
+
+    summary = sync_media_changes("movie", test_db_session, today=date(2025, 7, 2))
+
+    assert summary["failed"] == [603]
+    assert summary["watermark_advanced"] is True
+    assert test_db_session.query(SyncRetry).count() == 0
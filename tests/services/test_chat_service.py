@@ -45,7 +45,7 @@ def test_chat_creates_new_session(test_db_session, user):
     # Ensure session doesn't exist before
     assert test_db_session.query(ChatSession).filter_by(id=session_id).first() is None
 
-    from app.backend.services.chat_service import get_or_create_chat_session
+    from app.backend.services.session_service import get_or_create_chat_session
     session = get_or_create_chat_session(user.id, session_id, test_db_session)
     assert session.id == session_id
     assert session.user_id == user.id
@@ -57,24 +57,38 @@ def test_chat_creates_new_session(test_db_session, user):
 
 # 5. Test appending to conversation
 def test_chat_appends_to_existing_session(mocker, test_db_session, user):
-    from app.backend.services.chat_service import get_or_create_chat_session
+    from app.backend.services.chat_session_store import ChatSessionStore
+    from app.backend.services.session_service import (
+        append_chat_message, get_or_create_chat_session, get_recent_chat_messages,
+    )
     session_id = str(uuid4())
-    session = get_or_create_chat_session(user.id, session_id, test_db_session)
+    get_or_create_chat_session(user.id, session_id, test_db_session)
 
     # Manually seed 1 message
-    session.conversation.append({"role": "user", "content": "Hi"})
-    test_db_session.commit()
-
-    mocker.patch("app.backend.services.chat_service.get_llm_response", return_value="Okay!")
-    mocker.patch("app.backend.services.chat_service.parse_llm_response", return_value=(
-        "Okay!", None, None, None
-    ))
+    append_chat_message(session_id, "user", "Hi", test_db_session)
+
+    # Private store: no write-behind thread left running after the test
+    store = ChatSessionStore(max_sessions=10, flush_interval=60, batch_size=1000)
+    mocker.patch("app.backend.services.chat_service.get_chat_session_store", return_value=store)
+    mocker.patch("app.backend.services.chat_service.classify_intent_locally", return_value=None)
+    llm = mocker.patch(
+        "app.backend.services.chat_service.answer_and_classify_user_intent",
+        return_value=("error", None, "Okay!"),
+    )
 
-    payload = ChatQuery(session_id=session_id, query="Hello again")
+    payload = ChatQuery(session_id=session_id, query="Hello again", media_type=None)
     result = process_chat_query(payload, user, test_db_session, "en")
 
     assert result.message == "Okay!"
-
-    # Make sure conversation now has 3 messages: user, assistant, user again
-    session = get_or_create_chat_session(user.id, session_id, test_db_session)
-    assert len(session.conversation) == 3
+    # The LLM saw the stored history plus the new message
+    assert [m["content"] for m in llm.call_args.args[0]] == ["Hi", "Hello again"]
+
+    # Make sure conversation now has 3 messages: user, user again, assistant
+    store.flush()
+    store.shutdown()
+    messages = get_recent_chat_messages(session_id, test_db_session, limit=10)
+    assert messages == [
+        {"role": "user", "content": "Hi"},
+        {"role": "user", "content": "Hello again"},
+        {"role": "assistant", "content": "Okay!"},
+    ]
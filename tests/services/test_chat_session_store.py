@@ -0,0 +1,93 @@
+import pytest
+
+from app.backend.models.chat_message_model import ChatMessage
+from app.backend.models.chat_session_model import ChatSession
+from app.backend.models.user_model import User
+from app.backend.services.chat_session_store import ChatSessionStore
+
+
+@pytest.fixture()
+def store():
+    # Long interval: the tests flush explicitly
+    store = ChatSessionStore(max_sessions=1, flush_interval=60, batch_size=1000)
+    yield store
+    store.shutdown()
+
+
+@pytest.fixture()
+def user(test_db_session):
+    user = User(first_name="Store", last_name="Test", email="store@example.com", password_hash="x")
+    test_db_session.add(user)
+    test_db_session.commit()
+    return user
+
+
+def test_turns_are_written_behind_in_one_batch(store, test_db_session, user):
+    state = store.get_or_load(user.id, "s1", test_db_session)
+    store.append(state, "user", "Hi", test_db_session)
+    store.append(state, "assistant", "Hello!", test_db_session)
+
+    # Nothing is written on the request path
+    assert test_db_session.query(ChatSession).count() == 0
+
+    assert store.flush() == 3
+    assert test_db_session.get(ChatSession, "s1").user_id == user.id
+    rows = test_db_session.query(ChatMessage).filter_by(session_id="s1").order_by(ChatMessage.seq).all()
+    assert [(m.seq, m.role, m.content) for m in rows] == [(1, "user", "Hi"), (2, "assistant", "Hello!")]
+
+
+def test_evicted_session_reloads_its_window(store, test_db_session, user):
+    state = store.get_or_load(user.id, "s1", test_db_session)
+    for i in range(6):
+        store.append(state, "user", f"message {i}", test_db_session)
+
+    # max_sessions=1: loading s2 evicts s1 while its messages are still queued
+    store.get_or_load(user.id, "s2", test_db_session)
+    reloaded = store.get_or_load(user.id, "s1", test_db_session)
+
+    assert reloaded is not state
+    assert [m["content"] for m in reloaded.recent] == ["message 2", "message 3", "message 4", "message 5"]
+
+
+def test_session_of_another_user_is_rejected(store, test_db_session, user):
+    store.get_or_load(user.id, "s1", test_db_session)
+    with pytest.raises(RuntimeError):
+        store.get_or_load(user.id + 1, "s1", test_db_session)
+
+
+def test_constraint_violation_drops_only_the_bad_rows(store, test_db_session, user):
+    first = store.get_or_load(user.id, "s1", test_db_session)
+    second = store.get_or_load(user.id, "s2", test_db_session)
+    store.append(first, "user", "Hi", test_db_session)
+    store.append(first, "assistant", None, test_db_session)  # content is NOT NULL
+    store.append(second, "user", "Hello", test_db_session)
+
+    assert store.flush() == 4
+    assert [m.content for m in test_db_session.query(ChatMessage).order_by(ChatMessage.session_id)] == ["Hi", "Hello"]
+
+
+def test_failing_session_is_retried_then_dropped_without_blocking_others(mocker, test_db_session, user):
+    from app.backend.services import chat_session_store
+
+    real_append = chat_session_store.append_chat_message
+
+    def append(session_id, *args, **kwargs):
+        if session_id == "bad":
+            raise RuntimeError("disk I/O error")
+        return real_append(session_id, *args, **kwargs)
+
+    mocker.patch("app.backend.services.chat_session_store.append_chat_message", side_effect=append)
+    store = ChatSessionStore(max_sessions=10, flush_interval=60, batch_size=1000, max_attempts=2)
+    try:
+        bad = store.get_or_load(user.id, "bad", test_db_session)
+        store.append(bad, "user", "Hi", test_db_session)
+        good = store.get_or_load(user.id, "good", test_db_session)
+        store.append(good, "user", "Hello", test_db_session)
+
+        assert store.flush() == 2
+        assert store.stats()["pending_writes"] == 2
+        assert store.flush() == 0
+        assert store.stats()["pending_writes"] == 0
+        assert test_db_session.query(ChatMessage).filter_by(session_id="good").count() == 1
+    finally:
+        store.shutdown()
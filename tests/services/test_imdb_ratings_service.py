@@ -0,0 +1,88 @@
+import gzip
+import shutil
+from datetime import date
+from pathlib import Path
+
+from app.backend.models.imdb_rating_model import ImdbRating
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.services import imdb_ratings_service
+from app.backend.services.imdb_ratings_service import (
+    open_ratings_file, import_imdb_ratings, apply_imdb_ratings_to_cache, get_imdb_rating_and_votes,
+)
+
+SAMPLE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "imdb" / "title.ratings.sample.tsv"
+
+
+def cached_row(model, tmdb_id: int, imdb_id: str):
+    return model(
+        tmdb_id=tmdb_id,
+        imdb_id=imdb_id,
+        imdb_rating=0.0,
+        imdb_votes_count=0,
+        release_year=1999,
+        poster_url="https://example.com/poster.jpg",
+        genre_ids=[18],
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+def test_import_streams_gzipped_dump_in_chunks(tmp_path, test_db_session):
+    gz_path = tmp_path / "title.ratings.tsv.gz"
+    with open(SAMPLE_PATH, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+
+    with open_ratings_file(gz_path) as stream:
+        total = import_imdb_ratings(stream, test_db_session, chunk_size=3)
+
+    assert total == 4
+    matrix = test_db_session.get(ImdbRating, "tt0133093")
+    assert matrix.imdb_rating == 8.7
+    assert matrix.imdb_votes_count == 2150000
+
+
+def test_reimport_updates_existing_rows(test_db_session):
+    test_db_session.add(ImdbRating(imdb_id="tt0133093", imdb_rating=1.0, imdb_votes_count=1))
+    test_db_session.commit()
+
+    with open_ratings_file(SAMPLE_PATH) as stream:
+        import_imdb_ratings(stream, test_db_session)
+
+    test_db_session.expire_all()
+    assert test_db_session.get(ImdbRating, "tt0133093").imdb_rating == 8.7
+
+
+def test_apply_ratings_updates_cached_movies_and_tvshows(test_db_session):
+    test_db_session.add_all([
+        cached_row(CachedMovie, 603, "tt0133093"),
+        cached_row(CachedMovie, 550, "tt0137523"),
+        cached_row(CachedMovie, 1, "tt0000001"),  # not in the dump
+        cached_row(CachedTvShow, 1396, "tt0903747"),
+    ])
+    test_db_session.commit()
+    with open_ratings_file(SAMPLE_PATH) as stream:
+        import_imdb_ratings(stream, test_db_session)
+
+    updated = apply_imdb_ratings_to_cache(test_db_session)
+
+    assert updated == {"movie": 2, "tv": 1}
+    test_db_session.expire_all()
+    movie = test_db_session.query(CachedMovie).filter_by(tmdb_id=550).one()
+    assert (movie.imdb_rating, movie.imdb_votes_count) == (8.8, 2400000)
+    missing = test_db_session.query(CachedMovie).filter_by(tmdb_id=1).one()
+    assert missing.imdb_rating == 0.0
+
+
+def test_rating_lookup_prefers_local_table_and_falls_back_to_omdb(mocker, test_db_session):
+    omdb = mocker.patch.object(
+        imdb_ratings_service, "call_omdb_client",
+        return_value={"imdb_rating": "7.5", "imdb_votes_count": "12,345"},
+    )
+    test_db_session.add(ImdbRating(imdb_id="tt0133093", imdb_rating=8.7, imdb_votes_count=2150000))
+    test_db_session.commit()
+
+    assert get_imdb_rating_and_votes("tt0133093", test_db_session) == (8.7, 2150000)
+    omdb.assert_not_called()
+
+    assert get_imdb_rating_and_votes("tt0000001", test_db_session) == (7.5, 12345)
+    omdb.assert_called_once_with("tt0000001")
@@ -0,0 +1,140 @@
+from uuid import uuid4
+
+import pytest
+
+from app.backend.models.user_model import User
+from app.backend.schemas.chat_schemas import ChatQuery
+from app.backend.services.chat_service import process_chat_query
+from app.backend.services.chat_session_store import ChatSessionStore
+from app.backend.services.intent_classifier_service import (
+    MEDIA_LABELS,
+    IntentClassifier,
+    train_linear_model,
+)
+
+TURNS = [
+    ("movies like {title}", "similar_media"),
+    ("something similar to {title}", "similar_media"),
+    ("films comme {title}", "similar_media"),
+    ("{title}", "exact_title"),
+    ("find the movie {title}", "exact_title"),
+    ("french comedies from the {decade}s", "filters_parsing"),
+    ("thrillers from the {decade}s rated over 7", "filters_parsing"),
+    ("a slow story about {title} and memory", "free_description_suggestion"),
+    ("hello", "error"),
+    ("bonjour", "error"),
+]
+TITLES = ["Inception", "Heat", "Alien", "Amélie", "Drive", "Parasite"]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    examples = [
+        (template.format(title=title, decade=decade), intent)
+        for template, intent in TURNS
+        for title in TITLES
+        for decade in (70, 80, 90)
+    ]
+    media_examples = [
+        (f"{kind} like {title}", media_type)
+        for kind, media_type in (("movies", "movie"), ("films", "movie"), ("shows", "tv"), ("series", "tv"))
+        for title in TITLES
+    ] + [(f"something similar to {title}", "none") for title in TITLES] + [(title, "none") for title in TITLES]
+    return IntentClassifier(train_linear_model(examples), train_linear_model(media_examples, labels=list(MEDIA_LABELS)))
+
+
+def test_confident_intents_are_answered_locally(classifier):
+    local = classifier.classify("movies like Oldboy", threshold=0.8)
+    assert (local.intent, local.media_type) == ("similar_media", "movie")
+    assert local.confidence >= 0.8
+
+    # No media type in the message: the user's selection, then the session's
+    assert classifier.classify("something similar to Zodiac", "tv", threshold=0.8).media_type == "tv"
+    assert classifier.classify("something similar to Zodiac", None, "movie", threshold=0.8).media_type == "movie"
+
+
+def test_unsure_or_unanswerable_turns_defer_to_the_llm(classifier):
+    assert classifier.classify("movies like Oldboy", threshold=1.0) is None
+    # Greetings stay with the LLM, however confident the model is
+    assert classifier.classify("hello", "movie", threshold=0.5) is None
+    # Nothing says which media type
+    assert classifier.classify("something similar to Zodiac", threshold=0.8) is None
+
+
+def test_saved_model_predicts_like_the_trained_one(classifier, tmp_path):
+    classifier.save(tmp_path / "intent_model.json")
+    loaded = IntentClassifier.load(tmp_path / "intent_model.json")
+
+    for text in ("movies like Oldboy", "thrillers from the 60s", "hello"):
+        label, confidence = classifier.intent_model.predict(text)
+        loaded_label, loaded_confidence = loaded.intent_model.predict(text)
+        assert loaded_label == label
+        assert loaded_confidence == pytest.approx(confidence, abs=1e-2)
+
+
+def test_chat_skips_the_llm_for_local_intents(mocker, test_db_session, classifier):
+    user = User(first_name="Test", last_name="Intent", email="intent@example.com", password_hash="hashed")
+    test_db_session.add(user)
+    test_db_session.commit()
+
+    # Private store: no write-behind thread left running after the test
+    store = ChatSessionStore(max_sessions=10, flush_interval=60, batch_size=1000)
+    mocker.patch("app.backend.services.chat_service.get_chat_session_store", return_value=store)
+    mocker.patch("app.backend.services.intent_classifier_service.get_intent_classifier", return_value=classifier)
+    llm = mocker.patch("app.backend.services.chat_service.answer_and_classify_user_intent")
+    similar = mocker.patch("app.backend.services.chat_service.recommend_similar_movies", return_value=[])
+
+    payload = ChatQuery(session_id=str(uuid4()), query="films comme Oldboy", media_type="movie")
+    response = process_chat_query(payload, user, test_db_session, "fr")
+
+    llm.assert_not_called()
+    similar.assert_called_once_with("films comme Oldboy", user.id, test_db_session, "fr")
+    assert response.message == "Voici des films similaires."
+    assert response.media_type == "movie"
+    store.shutdown()
+
+
+def test_follow_up_turns_go_to_the_llm(mocker, test_db_session, classifier):
+    user = User(first_name="Test", last_name="Intent", email="intent@example.com", password_hash="hashed")
+    test_db_session.add(user)
+    test_db_session.commit()
+
+    store = ChatSessionStore(max_sessions=10, flush_interval=60, batch_size=1000)
+    mocker.patch("app.backend.services.chat_service.get_chat_session_store", return_value=store)
+    mocker.patch("app.backend.services.intent_classifier_service.get_intent_classifier", return_value=classifier)
+    llm = mocker.patch(
+        "app.backend.services.chat_service.answer_and_classify_user_intent",
+        return_value=("similar_media", "movie", "Here you go."),
+    )
+    mocker.patch("app.backend.services.chat_service.recommend_similar_movies", return_value=[])
+
+    session_id = str(uuid4())
+    process_chat_query(ChatQuery(session_id=session_id, query="films comme Oldboy", media_type="movie"), user, test_db_session, "fr")
+    llm.assert_not_called()
+
+    process_chat_query(ChatQuery(session_id=session_id, query="films comme Oldboy", media_type="movie"), user, test_db_session, "fr")
+    llm.assert_called_once()
+    store.shutdown()
+
+
+def test_intent_labels_are_logged_only_when_enabled(mocker, test_db_session, caplog):
+    user = User(first_name="Test", last_name="Intent", email="intent@example.com", password_hash="hashed")
+    test_db_session.add(user)
+    test_db_session.commit()
+
+    store = ChatSessionStore(max_sessions=10, flush_interval=60, batch_size=1000)
+    mocker.patch("app.backend.services.chat_service.get_chat_session_store", return_value=store)
+    mocker.patch("app.backend.services.intent_classifier_service.get_intent_classifier", return_value=None)
+    mocker.patch(
+        "app.backend.services.chat_service.answer_and_classify_user_intent",
+        return_value=("error", None, "Movies or TV shows?"),
+    )
+
+    with caplog.at_level("INFO", logger="app.backend.services.chat_service"):
+        process_chat_query(ChatQuery(session_id=str(uuid4()), query="something fun", media_type=None), user, test_db_session, "en")
+        assert "Chat intent classified" not in caplog.text
+
+        mocker.patch("app.backend.services.chat_service.INTENT_LABEL_LOGGING", True)
+        process_chat_query(ChatQuery(session_id=str(uuid4()), query="something fun", media_type=None), user, test_db_session, "en")
+        assert "Chat intent classified" in caplog.text
+    store.shutdown()
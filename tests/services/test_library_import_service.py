@@ -0,0 +1,137 @@
+import io
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_media_model import UserMedia
+from app.backend.services.library_import_service import import_library_export, read_export_rows
+from app.backend.services.stats_service import get_user_stats
+from app.backend.services.user_media_service import apply_user_media_statuses, get_user_library_page
+from app.backend.services.version_service import library_etag
+
+
+IMDB_EXPORT = """Const,Your Rating,Date Rated,Title,Title Type,Year
+tt0000010,9,2024-01-01,Title 10,movie,1999
+tt0000020,8,2024-01-02,Title 20,tvSeries,2001
+tt9999999,7,2024-01-03,Unknown,movie,2010
+"""
+
+LETTERBOXD_EXPORT = """Date,Name,Year,Letterboxd URI
+2024-01-01,Title 10,1999,https://boxd.it/a
+2024-01-02,Missing Film,2012,https://boxd.it/b
+"""
+
+
+def cached_row(model, tmdb_id: int, release_year: int = 1999, genre_ids=(18,)):
+    return model(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=8.0,
+        imdb_votes_count=1000,
+        release_year=release_year,
+        poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+        genre_ids=list(genre_ids),
+        title_en=f"Title {tmdb_id}",
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+@pytest.fixture()
+def catalog(test_db_session):
+    test_db_session.add_all([cached_row(CachedMovie, 10), cached_row(CachedTvShow, 20)])
+    test_db_session.commit()
+
+
+@pytest.fixture()
+def enrich_movie(test_db_session, mocker):
+    """
+    Stands in for TMDB enrichment: caches a 2010 comedy from the pool worker, on its own session.
+    """
+    def enrich(tmdb_id):
+        with Session(bind=test_db_session.get_bind()) as db:
+            db.add(cached_row(CachedMovie, tmdb_id, release_year=2010, genre_ids=[35]))
+            db.commit()
+        return True
+
+    return mocker.patch("app.backend.services.library_import_service.enrich_and_cache_one_movie", side_effect=enrich)
+
+
+def statuses(database, user_id=1):
+    return {(m.media_type, m.tmdb_id): m.status for m in database.query(UserMedia).filter_by(user_id=user_id)}
+
+
+def test_read_export_rows_detects_both_formats():
+    imdb = list(read_export_rows(io.StringIO(IMDB_EXPORT)))
+    assert [(r["imdb_id"], r["media_type"]) for r in imdb] == [
+        ("tt0000010", "movie"), ("tt0000020", "tv"), ("tt9999999", "movie"),
+    ]
+    letterboxd = list(read_export_rows(io.StringIO(LETTERBOXD_EXPORT)))
+    assert [(r["title"], r["year"]) for r in letterboxd] == [("Title 10", 1999), ("Missing Film", 2012)]
+
+    with pytest.raises(ValueError):
+        list(read_export_rows(io.StringIO("foo,bar\n1,2\n")))
+
+
+def test_import_resolves_locally_then_on_tmdb(test_db_session, catalog, enrich_movie, mocker):
+    find = mocker.patch(
+        "app.backend.services.library_import_service.call_tmdb_find_by_imdb_id_endpoint", return_value=("movie", 99)
+    )
+
+    report = import_library_export(1, io.StringIO(IMDB_EXPORT), "seen", test_db_session, chunk_size=2)
+
+    assert (report["rows"], report["imported"], report["unresolved"]) == (3, 3, 0)
+    find.assert_called_once_with("tt9999999")
+    enrich_movie.assert_called_once_with(99)
+    assert statuses(test_db_session) == {("movie", 10): "seen", ("tv", 20): "seen", ("movie", 99): "seen"}
+
+    # The title resolved on TMDB was cached before import: it is listed and counted in the stats
+    entries, _ = get_user_library_page(1, test_db_session)
+    assert {(e.media_type, e.row.tmdb_id) for e in entries} == {("movie", 10), ("tv", 20), ("movie", 99)}
+    stats = get_user_stats(1, test_db_session)
+    assert stats.total_seen == 3
+    assert "comedy" in stats.top_genres
+    assert 2010 in stats.most_watched_years
+
+
+def test_import_skips_titles_that_cannot_be_cached(test_db_session, catalog, mocker):
+    mocker.patch("app.backend.services.library_import_service.call_tmdb_find_by_imdb_id_endpoint", return_value=("movie", 99))
+    mocker.patch("app.backend.services.library_import_service.enrich_and_cache_one_movie", return_value=False)
+
+    report = import_library_export(1, io.StringIO(IMDB_EXPORT), "seen", test_db_session)
+
+    assert (report["imported"], report["unresolved"]) == (2, 1)
+    assert ("movie", 99) not in statuses(test_db_session)
+
+
+def test_letterboxd_import_falls_back_to_title_search(test_db_session, catalog, enrich_movie, mocker):
+    search = mocker.patch(
+        "app.backend.services.library_import_service.call_tmdb_media_id_by_media_name_endpoint", return_value=77
+    )
+
+    report = import_library_export(1, io.StringIO(LETTERBOXD_EXPORT), "towatchlater", test_db_session)
+
+    assert report["imported"] == 2
+    search.assert_called_once_with("movie", "Missing Film", 2012)
+    enrich_movie.assert_called_once_with(77)
+    assert statuses(test_db_session) == {("movie", 10): "towatchlater", ("movie", 77): "towatchlater"}
+
+
+def test_apply_statuses_upserts_removes_and_bumps_version_once(test_db_session):
+    apply_user_media_statuses(1, [("movie", 1, "seen"), ("movie", 2, "seen")], test_db_session)
+    before = library_etag(test_db_session, 1, ["movie"])
+
+    counts = apply_user_media_statuses(
+        1, [("movie", 1, "hidden"), ("movie", 2, "none"), ("movie", 3, "seen"), ("movie", 3, "towatchlater")],
+        test_db_session,
+    )
+
+    assert counts == {"updated": 2, "removed": 1}
+    assert statuses(test_db_session) == {("movie", 1): "hidden", ("movie", 3): "towatchlater"}
+    assert library_etag(test_db_session, 1, ["movie"]) != before
+
+    unchanged = library_etag(test_db_session, 1, ["movie"])
+    assert apply_user_media_statuses(1, [("movie", 1, "hidden")], test_db_session) == {"updated": 0, "removed": 0}
+    assert library_etag(test_db_session, 1, ["movie"]) == unchanged
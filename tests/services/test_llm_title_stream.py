@@ -0,0 +1,62 @@
+import threading
+
+from app.backend.services import llm_service
+from app.backend.services.llm_service import JsonArrayParser, get_similar_titles_with_llm
+from app.backend.services.movie_service import resolve_and_cache_movies
+
+ANSWER = '```json\n[\n  {"title": "Heat", "year": 1995},\n  {"title": "Say \\"Hi\\" {or} [not]", "year": 2001},\n  {"title": "Drive"}\n]\n```'
+
+
+def test_parser_returns_each_object_once_it_is_complete():
+    parser = JsonArrayParser()
+    cut = ANSWER.index("1995") + 5
+
+    assert parser.feed(ANSWER[:cut - 1]) == []
+    assert parser.feed(ANSWER[cut - 1:cut]) == [{"title": "Heat", "year": 1995}]
+
+    # Character by character: braces, brackets and escaped quotes inside strings are not structure
+    items = [item for char in ANSWER[cut:] for item in parser.feed(char)]
+    assert items == [{"title": 'Say "Hi" {or} [not]', "year": 2001}, {"title": "Drive"}]
+    assert parser.finished
+
+
+def test_parser_skips_invalid_objects_and_text_after_the_array():
+    parser = JsonArrayParser()
+    assert parser.feed('Sure! [{"title": Heat}, {"title": "Alien", "year": 1979}] [{"title": "x"}]') == [
+        {"title": "Alien", "year": 1979}
+    ]
+
+
+def test_titles_are_streamed_or_parsed_from_the_full_answer(mocker):
+    pieces = [ANSWER[i:i + 7] for i in range(0, len(ANSWER), 7)]
+    mocker.patch.object(llm_service, "stream_openai_completion", return_value=iter(pieces))
+    assert [item["title"] for item in get_similar_titles_with_llm("movie", "like Heat")] == ["Heat", 'Say "Hi" {or} [not]', "Drive"]
+
+    mocker.patch.object(llm_service, "OPENAI_STREAMING", False)
+    mocker.patch.object(llm_service, "get_openai_completion", return_value=ANSWER)
+    assert len(list(get_similar_titles_with_llm("movie", "like Heat"))) == 3
+
+
+def test_titles_are_resolved_and_cached_while_the_answer_streams(mocker):
+    heat_cached = threading.Event()
+    ids = {"Heat": 949, "Alien": 348, "Seen": 1}
+    mocker.patch(
+        "app.backend.services.movie_service.call_tmdb_media_id_by_media_name_endpoint",
+        side_effect=lambda media_type, title, year=None: ids.get(title),
+    )
+    enrich = mocker.patch(
+        "app.backend.services.movie_service.enrich_and_cache_one_movie",
+        side_effect=lambda tmdb_id: tmdb_id == 949 and heat_cached.set(),
+    )
+
+    def streamed_titles():
+        yield {"title": "Heat", "year": 1995}
+        # Heat is enriched before the model has written the next title
+        assert heat_cached.wait(timeout=5)
+        yield {"title": "Unknown"}
+        yield {"title": "Seen"}
+        yield {"year": 2000}
+        yield {"title": "Alien", "year": 1979}
+
+    assert resolve_and_cache_movies(streamed_titles(), excluded_ids={1}) == [949, 348]
+    assert sorted(call.args[0] for call in enrich.call_args_list) == [348, 949]
@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+from app.backend.models.chat_message_model import ChatMessage
+from app.backend.models.user_model import User
+from app.backend.services.session_service import (
+    append_chat_message,
+    get_or_create_chat_session,
+    get_recent_chat_messages,
+)
+
+
+def make_session(database):
+    user = User(first_name="Chat", last_name="Log", email="chatlog@example.com", password_hash="x")
+    database.add(user)
+    database.commit()
+    return get_or_create_chat_session(user.id, str(uuid4()), database)
+
+
+def test_append_assigns_increasing_seq(test_db_session):
+    session = make_session(test_db_session)
+    for i in range(3):
+        append_chat_message(session.id, "user", f"message {i}", test_db_session)
+
+    seqs = [m.seq for m in test_db_session.query(ChatMessage).filter_by(session_id=session.id).order_by(ChatMessage.seq)]
+    assert seqs == [1, 2, 3]
+
+
+def test_recent_messages_are_the_last_window_oldest_first(test_db_session):
+    session = make_session(test_db_session)
+    for i in range(10):
+        role = "user" if i % 2 == 0 else "assistant"
+        append_chat_message(session.id, role, f"message {i}", test_db_session)
+
+    recent = get_recent_chat_messages(session.id, test_db_session, limit=4)
+    assert [m["content"] for m in recent] == ["message 6", "message 7", "message 8", "message 9"]
+    assert recent[0] == {"role": "user", "content": "message 6"}
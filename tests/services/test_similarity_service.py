@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.services.movie_service import recommend_similar_movies
+from app.backend.services.similarity_service import build_similarity_index, find_reference_title, find_similar_tmdb_ids
+from app.backend.services.user_media_service import update_user_media_status
+
+CATALOG = [
+    (1, "Alien", None, "A spaceship crew hunted by a deadly alien creature aboard their vessel in deep space.", [27, 878], 1979),
+    (2, "Aliens", None, "Marines return to the alien planet and fight the deadly creature hive in deep space.", [28, 878], 1986),
+    (3, "Event Horizon", None, "A rescue crew boards a lost spaceship in deep space and finds a horror aboard.", [27, 878], 1997),
+    (4, "Amélie", "Le Fabuleux Destin d'Amélie Poulain", "A shy waitress in Paris decides to change the lives of people around her.", [35, 10749], 2001),
+    (5, "Before Sunrise", None, "Two strangers meet on a train and spend one night walking around Vienna talking about love.", [18, 10749], 1995),
+    (6, "Midnight in Paris", None, "A writer walking around Paris at night finds himself in the past, talking with his heroes about love.", [35, 10749], 2011),
+]
+
+
+@pytest.fixture()
+def indexed_catalog(test_db_session):
+    for tmdb_id, title_en, title_fr, overview, genre_ids, year in CATALOG:
+        test_db_session.add(CachedMovie(
+            tmdb_id=tmdb_id,
+            imdb_id=f"tt{tmdb_id:07d}",
+            imdb_rating=7.5,
+            imdb_votes_count=1000 * tmdb_id,
+            release_year=year,
+            poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+            genre_ids=genre_ids,
+            title_en=title_en,
+            title_fr=title_fr or title_en,
+            overview_en=overview,
+            cache_update_date=date(2025, 1, 1),
+        ))
+    test_db_session.commit()
+    build_similarity_index(test_db_session, "movie", neighbours=3)
+    test_db_session.commit()
+
+
+def test_reference_title_is_found_in_free_text(test_db_session, indexed_catalog):
+    assert find_reference_title("movie", "films comme Le fabuleux destin d'Amelie Poulain", test_db_session) == 4
+    assert find_reference_title("movie", "something like ALIENS please", test_db_session) == 2
+    assert find_reference_title("movie", "movies like the matrix", test_db_session) is None
+    assert find_reference_title("tv", "shows like alien", test_db_session) is None
+
+
+def test_one_word_titles_need_a_cue(test_db_session, indexed_catalog):
+    assert find_reference_title("movie", "a slow horror movie with an alien on a ship", test_db_session) is None
+    assert find_reference_title("movie", "something similar to the Alien please", test_db_session) == 1
+    assert find_reference_title("movie", "Alien", test_db_session) == 1
+
+
+def test_neighbours_share_overview_genres_and_era(test_db_session, indexed_catalog):
+    assert find_similar_tmdb_ids("movie", "movies like Alien", test_db_session)[:2] in ([2, 3], [3, 2])
+    assert find_similar_tmdb_ids("movie", "like Midnight in Paris", test_db_session)[0] in (4, 5)
+
+
+def test_similar_movies_are_served_locally_and_fall_back_to_llm(test_db_session, indexed_catalog, mocker):
+    llm = mocker.patch("app.backend.services.movie_service.get_similar_titles_with_llm", return_value=[])
+    update_user_media_status("movie", 2, 1, test_db_session, "seen")
+
+    cards = recommend_similar_movies("movies like Alien", 1, test_db_session, "en")
+    assert 2 not in [card.tmdb_id for card in cards]
+    assert cards[0].tmdb_id == 3
+    llm.assert_not_called()
+
+    assert recommend_similar_movies("movies like The Matrix", 1, test_db_session, "en") == []
+    llm.assert_called_once_with("movie", "movies like The Matrix")
@@ -0,0 +1,107 @@
+from datetime import date
+
+import pytest
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_stat_counter_model import UserStatCounter
+from app.backend.services.stats_service import get_user_stats, rebuild_user_stats
+from app.backend.services.user_media_service import apply_user_media_statuses, update_user_media_status
+
+
+@pytest.fixture()
+def catalog(test_db_session):
+    rows = [
+        (CachedMovie, 1, [18, 80], 1994, 9.0),   # drama, crime
+        (CachedMovie, 2, [18], 1994, 8.0),       # drama
+        (CachedMovie, 3, [28], 2010, 7.0),       # action
+        (CachedTvShow, 4, [18], 2008, 9.5),      # drama
+    ]
+    for model, tmdb_id, genre_ids, year, rating in rows:
+        test_db_session.add(model(
+            tmdb_id=tmdb_id,
+            imdb_id=f"tt{tmdb_id:07d}",
+            imdb_rating=rating,
+            imdb_votes_count=1000,
+            release_year=year,
+            poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+            genre_ids=genre_ids,
+            title_en=f"Title {tmdb_id}",
+            cache_update_date=date(2025, 1, 1),
+        ))
+    test_db_session.commit()
+
+
+def test_counters_follow_every_status_change(test_db_session, catalog):
+    for tmdb_id in (1, 2, 3):
+        update_user_media_status("movie", tmdb_id, 1, test_db_session, "seen")
+    update_user_media_status("tv", 4, 1, test_db_session, "seen")
+    update_user_media_status("movie", 3, 1, test_db_session, "towatchlater")
+    update_user_media_status("movie", 999, 1, test_db_session, "towatchlater")
+
+    stats = get_user_stats(1, test_db_session)
+    assert stats.total_seen == 3
+    assert stats.watch_later_count == 2
+    assert stats.top_genres[0] == "drama"
+    assert stats.most_watched_years[0] == 1994
+    assert stats.average_rating_seen == round((9.0 + 8.0 + 9.5) / 3, 2)
+    assert stats.average_release_year == round((1994 + 1994 + 2008) / 3)
+
+    update_user_media_status("movie", 1, 1, test_db_session, "none")
+    update_user_media_status("movie", 3, 1, test_db_session, "none")
+    stats = get_user_stats(1, test_db_session)
+    assert (stats.total_seen, stats.watch_later_count) == (2, 1)
+    assert "crime" not in stats.top_genres
+
+
+def test_batch_updates_match_a_rebuild(test_db_session, catalog):
+    apply_user_media_statuses(1, [("movie", 1, "seen"), ("movie", 2, "seen"), ("tv", 4, "towatchlater")], test_db_session)
+    apply_user_media_statuses(1, [("movie", 2, "hidden"), ("tv", 4, "seen"), ("movie", 3, "seen")], test_db_session)
+    incremental = get_user_stats(1, test_db_session)
+
+    rebuild_user_stats(test_db_session, 1)
+    test_db_session.commit()
+
+    assert get_user_stats(1, test_db_session) == incremental
+    assert (incremental.total_seen, incremental.watch_later_count) == (3, 0)
+
+
+def test_leaving_seen_subtracts_what_was_counted(test_db_session, catalog):
+    update_user_media_status("movie", 1, 1, test_db_session, "seen")
+    update_user_media_status("movie", 50, 1, test_db_session, "seen")     # not cached yet: counts as seen only
+
+    # The catalog moves on: title 50 gets cached, title 1's rating is refreshed
+    test_db_session.add(CachedMovie(
+        tmdb_id=50, imdb_id="tt0000050", imdb_rating=6.0, imdb_votes_count=10, release_year=2001,
+        poster_url="https://image.tmdb.org/t/p/original/50.jpg", genre_ids=[35], cache_update_date=date(2025, 1, 1),
+    ))
+    test_db_session.get(CachedMovie, 1).imdb_rating = 7.5
+    test_db_session.commit()
+
+    update_user_media_status("movie", 50, 1, test_db_session, "none")
+    apply_user_media_statuses(1, [("movie", 1, "hidden")], test_db_session)
+
+    leftovers = test_db_session.query(UserStatCounter).filter(UserStatCounter.user_id == 1, UserStatCounter.value != 0).all()
+    assert leftovers == []
+
+
+def test_rebuild_snapshots_titles_cached_since_they_were_seen(test_db_session, catalog):
+    update_user_media_status("movie", 50, 1, test_db_session, "seen")
+    test_db_session.add(CachedMovie(
+        tmdb_id=50, imdb_id="tt0000050", imdb_rating=6.0, imdb_votes_count=10, release_year=2001,
+        poster_url="https://image.tmdb.org/t/p/original/50.jpg", genre_ids=[35], cache_update_date=date(2025, 1, 1),
+    ))
+    test_db_session.commit()
+
+    rebuild_user_stats(test_db_session, 1)
+    test_db_session.commit()
+    assert get_user_stats(1, test_db_session).average_rating_seen == 6.0
+
+    update_user_media_status("movie", 50, 1, test_db_session, "none")
+    assert get_user_stats(1, test_db_session).average_rating_seen == 0.0
+    assert get_user_stats(1, test_db_session).top_genres == []
+
+
+def test_empty_library_has_zero_stats(test_db_session):
+    stats = get_user_stats(1, test_db_session)
+    assert stats.total_seen == 0 and stats.top_genres == [] and stats.average_rating_seen == 0.0
@@ -0,0 +1,81 @@
+import json
+from datetime import date, datetime
+
+import pytest
+
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.models.user_media_model import UserMedia
+from app.backend.services.user_media_service import get_user_library_page, render_library_page
+
+
+def catalog_row(model, tmdb_id: int):
+    return model(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=8.0,
+        imdb_votes_count=1000,
+        release_year=1999,
+        poster_url=f"https://image.tmdb.org/t/p/original/{tmdb_id}.jpg",
+        genre_ids=[18],
+        title_en=f"Title {tmdb_id}",
+        cache_update_date=date(2025, 1, 1),
+    )
+
+
+@pytest.fixture()
+def library(test_db_session):
+    """
+    user 1: 3 movies + 2 shows over three statuses, two entries sharing a timestamp; user 2: one movie.
+    Returns user 1's tmdb_ids, newest first.
+    """
+    entries = [
+        (1, 10, "movie", "seen", datetime(2025, 1, 1, 10, 0, 0)),
+        (1, 11, "movie", "towatchlater", datetime(2025, 1, 1, 11, 0, 0)),
+        (1, 12, "movie", "hidden", datetime(2025, 1, 1, 11, 0, 0)),
+        (1, 20, "tv", "seen", datetime(2025, 1, 1, 12, 0, 0)),
+        (1, 21, "tv", "towatchlater", datetime(2025, 1, 1, 9, 0, 0)),
+        (2, 10, "movie", "seen", datetime(2025, 1, 2, 0, 0, 0)),
+    ]
+    for user_id, tmdb_id, media_type, status, updated_at in entries:
+        test_db_session.add(UserMedia(user_id=user_id, tmdb_id=tmdb_id, media_type=media_type, status=status, updated_at=updated_at))
+    test_db_session.add_all([catalog_row(CachedMovie, i) for i in (10, 11, 12)])
+    test_db_session.add_all([catalog_row(CachedTvShow, i) for i in (20, 21)])
+    test_db_session.commit()
+    # Same timestamp: the higher id comes first
+    return [20, 12, 11, 10, 21]
+
+
+def test_library_pages_cover_everything_once_newest_first(test_db_session, library):
+    seen, cursor = [], None
+    while True:
+        entries, cursor = get_user_library_page(1, test_db_session, cursor=cursor, limit=2)
+        seen.extend(entry.row.tmdb_id for entry in entries)
+        if cursor is None:
+            break
+
+    assert seen == library
+
+
+def test_library_filters_by_media_type_and_status(test_db_session, library):
+    movies, _ = get_user_library_page(1, test_db_session, media_type="movie")
+    later, _ = get_user_library_page(1, test_db_session, status="towatchlater")
+
+    assert [entry.row.tmdb_id for entry in movies] == [12, 11, 10]
+    assert {(entry.media_type, entry.row.tmdb_id) for entry in later} == {("movie", 11), ("tv", 21)}
+
+
+def test_library_rejects_foreign_cursor(test_db_session, library):
+    with pytest.raises(ValueError):
+        get_user_library_page(1, test_db_session, cursor="not-a-cursor")
+
+
+def test_render_library_page_splices_cards(test_db_session, library):
+    entries, cursor = get_user_library_page(1, test_db_session, limit=1)
+
+    page = json.loads(render_library_page(entries, cursor, "en", "w185"))
+
+    assert page["next_cursor"] == cursor
+    assert page["items"][0]["media_type"] == "tv"
+    assert page["items"][0]["updated_at"] == "2025-01-01T12:00:00.000000"
+    assert page["items"][0]["card"]["poster_url"] == "https://image.tmdb.org/t/p/w185/20.jpg"
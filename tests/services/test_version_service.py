@@ -0,0 +1,86 @@
+from app.backend.models.imdb_rating_model import ImdbRating
+from app.backend.models.movie_model import CachedMovie
+from app.backend.models.tvshow_model import CachedTvShow
+from app.backend.services.imdb_ratings_service import apply_imdb_ratings_to_cache
+from app.backend.services.user_media_service import update_user_media_status
+from app.backend.services.version_service import etag_matches, library_etag
+
+
+def cached_row(model, tmdb_id: int):
+    return model(
+        tmdb_id=tmdb_id,
+        imdb_id=f"tt{tmdb_id:07d}",
+        imdb_rating=8.0,
+        imdb_votes_count=1000,
+        release_year=1999,
+        poster_url="https://example.com/poster.jpg",
+        genre_ids=[18],
+    )
+
+
+def test_catalog_rows_get_increasing_versions_per_media_type(test_db_session):
+    first, second, show = cached_row(CachedMovie, 1), cached_row(CachedMovie, 2), cached_row(CachedTvShow, 1)
+    test_db_session.add_all([first, second, show])
+    test_db_session.commit()
+    assert sorted([first.row_version, second.row_version]) == [1, 2]
+    assert show.row_version == 1
+
+    first.imdb_rating = 8.5
+    test_db_session.commit()
+    assert first.row_version == 3
+
+
+def test_library_etag_follows_library_and_catalog_changes(test_db_session):
+    etag = library_etag(test_db_session, 1, ["movie"], "seen", "en")
+    assert library_etag(test_db_session, 1, ["movie"], "seen", "en") == etag
+    assert library_etag(test_db_session, 1, ["movie"], "seen", "fr") != etag
+
+    update_user_media_status("movie", 42, 1, test_db_session, "seen")
+    after_status_change = library_etag(test_db_session, 1, ["movie"], "seen", "en")
+    assert after_status_change != etag
+
+    # Another user's change and a TV refresh leave the movie list ETag alone
+    update_user_media_status("movie", 42, 2, test_db_session, "seen")
+    test_db_session.add(cached_row(CachedTvShow, 7))
+    test_db_session.commit()
+    assert library_etag(test_db_session, 1, ["movie"], "seen", "en") == after_status_change
+
+    # So does a movie outside the list
+    test_db_session.add(cached_row(CachedMovie, 99))
+    test_db_session.commit()
+    assert library_etag(test_db_session, 1, ["movie"], "seen", "en") == after_status_change
+
+    listed = cached_row(CachedMovie, 42)
+    test_db_session.add(listed)
+    test_db_session.commit()
+    after_caching = library_etag(test_db_session, 1, ["movie"], "seen", "en")
+    assert after_caching != after_status_change
+
+    listed.imdb_rating = 9.0
+    test_db_session.commit()
+    after_refresh = library_etag(test_db_session, 1, ["movie"], "seen", "en")
+    assert after_refresh != after_caching
+
+    test_db_session.delete(listed)
+    test_db_session.commit()
+    assert library_etag(test_db_session, 1, ["movie"], "seen", "en") != after_refresh
+
+
+def test_bulk_ratings_apply_changes_listing_users_etag(test_db_session):
+    test_db_session.add_all([cached_row(CachedMovie, 42), cached_row(CachedMovie, 99)])
+    test_db_session.add(ImdbRating(imdb_id="tt0000042", imdb_rating=9.1, imdb_votes_count=5000))
+    test_db_session.commit()
+    update_user_media_status("movie", 42, 1, test_db_session, "seen")
+    update_user_media_status("movie", 99, 2, test_db_session, "seen")
+    listing, other = (library_etag(test_db_session, user_id, ["movie"], "seen") for user_id in (1, 2))
+
+    apply_imdb_ratings_to_cache(test_db_session)
+    assert library_etag(test_db_session, 1, ["movie"], "seen") != listing
+    assert library_etag(test_db_session, 2, ["movie"], "seen") == other
+
+
+def test_etag_matches_lists_and_weak_validators():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"a"', '"b"')